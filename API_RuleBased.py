@@ -1,17 +1,28 @@
 #API_RuleBased.py
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, request, jsonify, send_file, Response
 from flask_cors import CORS
+from werkzeug.http import is_resource_modified
 import os
 import sys
 import csv
 import json
-from datetime import datetime
+import hashlib
+import queue
+import random
+import signal
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 import tldextract
-from urllib.parse import urlparse
 
 sys.path.append(os.path.dirname(__file__))
 
 from RuleBased.Ensemble_Rulebased import RuleBasedFusionPredictor
+from RuleBased.fp_override_index import FalsePositiveOverrideIndex, OVERRIDE_SCOPES, SCOPE_URL, SCOPE_DOMAIN, registered_domain
+from log_store.detection_log import DetectionLog, entry_id, partition_date
+from log_store.html_archive import HtmlArchive
+from monitoring.metrics import MetricsRegistry, SIZE_BUCKETS
+from monitoring.sampling_profiler import SamplingProfiler
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for Chrome Extension
@@ -25,15 +36,50 @@ except Exception as e:
     predictor = None
 
 # File paths
-LOG_FILE = os.path.join(os.path.dirname(__file__), 'HTML_logs', 'Malicious_log.csv')
+LOG_DIR = os.path.join(os.path.dirname(__file__), 'HTML_logs', 'detections')
+LOG_FILE = os.path.join(os.path.dirname(__file__), 'HTML_logs', 'Malicious_log.csv')  # legacy single-file log
+TOMBSTONE_FILE = os.path.join(os.path.dirname(__file__), 'HTML_logs', 'Malicious_log_tombstones.csv')
+LOG_RETENTION_DAYS = int(os.environ.get('DETECTION_LOG_RETENTION_DAYS', '365'))
+LOG_COMPRESS_AFTER_DAYS = int(os.environ.get('DETECTION_LOG_COMPRESS_AFTER_DAYS', '1'))
+HTML_ARCHIVE_DIR = os.path.join(os.path.dirname(__file__), 'HTML_logs', 'html_logs')
 FALSE_POSITIVE_FILE = os.path.join(os.path.dirname(__file__), 'HTML_logs', 'false_positive_log.csv')
+OVERRIDE_RULES_FILE = os.path.join(os.path.dirname(__file__), 'HTML_logs', 'override_rules.csv')
+OVERRIDE_RULE_FIELDS = ['created_at', 'scope', 'pattern', 'admin_note']
+OVERRIDE_AUDIT_FILE = os.path.join(os.path.dirname(__file__), 'HTML_logs', 'override_audit_log.csv')
+OVERRIDE_AUDIT_FIELDS = ['audited_at', 'url', 'override_scope', 'model_prediction', 'model_risk_level', 'model_probability', 'url_prob', 'content_prob']
 
-# Initialize CSV file if it doesn't exist
-if not os.path.exists(LOG_FILE):
-    os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
-    with open(LOG_FILE, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(['timestamp', 'url', 'domain', 'prediction', 'probability', 'action', 'risk_level', 'reason', 'detailed_reason'])
+# Audit mode: overridden URLs skip the models in /predict, but can still be scored
+# in the background for transparency (set FP_OVERRIDE_AUDIT=1 to enable)
+OVERRIDE_AUDIT_ENABLED = os.environ.get('FP_OVERRIDE_AUDIT', '0') == '1'
+
+# Sampling profiler output (collapsed stacks for flamegraphs); started via
+# POST /api/admin/profile or by sending SIGUSR1 to the server process
+PROFILE_DIR = os.path.join(os.path.dirname(__file__), 'HTML_logs', 'profiles')
+PROFILE_SIGNAL_SECONDS = float(os.environ.get('PROFILE_SIGNAL_SECONDS', '30'))
+
+# Per-request stage timings (microseconds) in the /predict response: sent when the
+# request carries "X-Debug-Timings: 1", or for a random PREDICT_TIMINGS_SAMPLE_RATE share of requests
+TIMINGS_HEADER = 'X-Debug-Timings'
+TIMINGS_SAMPLE_RATE = float(os.environ.get('PREDICT_TIMINGS_SAMPLE_RATE', '0'))
+
+# Append-only detection log, one partition per day; false positives are tombstoned
+# instead of rewriting the CSV, old days are gzipped and dropped after the retention period.
+# Migration of the legacy single-file log and rotation run from startup(), not on import.
+detection_log = DetectionLog(LOG_DIR, retention_days=LOG_RETENTION_DAYS,
+                             compress_after_days=LOG_COMPRESS_AFTER_DAYS)
+
+profiler = SamplingProfiler(PROFILE_DIR, project_dir=os.path.dirname(os.path.abspath(__file__)))
+
+def _profile_on_signal(signum, frame):
+    if profiler.start(PROFILE_SIGNAL_SECONDS) is None:
+        print(" Profiler already running - signal ignored")
+
+if hasattr(signal, 'SIGUSR1') and threading.current_thread() is threading.main_thread():
+    signal.signal(signal.SIGUSR1, _profile_on_signal)
+
+# Captured pages, stored once per content hash (gzip) and referenced from detection rows.
+# Legacy <uuid>.html files are moved in by running log_store/html_archive.py once.
+html_archive = HtmlArchive(HTML_ARCHIVE_DIR)
 
 # Initialize false positive CSV file if it doesn't exist
 if not os.path.exists(FALSE_POSITIVE_FILE):
@@ -42,6 +88,86 @@ if not os.path.exists(FALSE_POSITIVE_FILE):
         writer = csv.writer(f)
         writer.writerow(['marked_at', 'original_timestamp', 'url', 'domain', 'prediction', 'probability', 'risk_level', 'action', 'reason', 'detailed_reason', 'admin_note'])
 
+# METRICS (Prometheus text format on /metrics, aggregated per thread without locks)
+metrics = MetricsRegistry()
+PREDICTIONS = metrics.counter('phishing_predictions_total', 'Requests to /predict by outcome and risk level', ('outcome', 'risk_level'))
+PREDICT_LATENCY = metrics.histogram('phishing_predict_duration_seconds', 'End-to-end latency of the /predict handler')
+STAGE_LATENCY = metrics.histogram('phishing_stage_duration_seconds', 'Latency of each /predict stage', ('stage',))
+PAYLOAD_SIZE = metrics.histogram('phishing_payload_bytes', 'Size of /predict payloads (whole request body and captured HTML)', ('part',), buckets=SIZE_BUCKETS)
+CACHE_LOOKUPS = metrics.counter('phishing_cache_lookups_total', 'Cache lookups by cache and result (hit / miss)', ('cache', 'result'))
+CASCADE = metrics.counter('phishing_cascade_total', 'Predictions with HTML by whether the content model ran (full) or was skipped (shortcut)', ('result',))
+
+def record_prediction(started, outcome, risk_level=''):
+    PREDICTIONS.inc(outcome=outcome, risk_level=risk_level)
+    PREDICT_LATENCY.observe(time.perf_counter() - started)
+
+# CONDITIONAL GET / CACHING HELPERS
+FRONTEND_DIR = os.path.join(os.path.dirname(__file__), 'Frontend')
+STATIC_MAX_AGE = 31536000  # 1 year, only for content-hashed asset URLs
+
+# Cache of asset content hashes keyed by path, invalidated by mtime
+_asset_hash_cache = {}
+
+def file_validators(*paths, extra=''):
+    """ Build (etag, last_modified) for a response backed by one or more files.
+        The etag changes whenever any file's mtime or size changes (or extra changes). """
+    parts = [extra]
+    latest = 0.0
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            parts.append('missing')
+            continue
+        parts.append(f"{st.st_mtime_ns:x}-{st.st_size:x}")
+        latest = max(latest, st.st_mtime)
+    etag = hashlib.md5('|'.join(parts).encode('utf-8')).hexdigest()
+    last_modified = datetime.fromtimestamp(int(latest), tz=timezone.utc) if latest else None
+    return etag, last_modified
+
+def asset_hash(path):
+    """ Short content hash of a static asset (cached until the file changes) """
+    mtime = os.path.getmtime(path)
+    cached = _asset_hash_cache.get(path)
+    if cached and cached[0] == mtime:
+        CACHE_LOOKUPS.inc(cache='asset_hash', result='hit')
+        return cached[1]
+    CACHE_LOOKUPS.inc(cache='asset_hash', result='miss')
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:16]
+    _asset_hash_cache[path] = (mtime, digest)
+    return digest
+
+def conditional_response(etag, last_modified, build_response):
+    """ Return 304 if the client's validators still match, otherwise build the full response.
+        build_response is only called when the data actually changed. """
+    if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        CACHE_LOOKUPS.inc(cache='http_conditional', result='hit')
+        response = Response(status=304)
+    else:
+        CACHE_LOOKUPS.inc(cache='http_conditional', result='miss')
+        response = build_response()
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified
+    # Browsers must revalidate every poll, but may reuse the cached body on 304
+    response.cache_control.no_cache = True
+    return response
+
+def send_asset(path, mimetype):
+    """ Serve a dashboard asset. Requests carrying the current content hash (?v=...)
+        get a long-lived immutable cache header; others must revalidate. """
+    digest = asset_hash(path)
+    versioned = request.args.get('v') == digest
+    response = send_file(path, mimetype=mimetype, etag=digest, conditional=True,
+                         max_age=STATIC_MAX_AGE if versioned else None)
+    if versioned:
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    return response
+
 def get_risk_level(probability):
     """Determine risk level based on probability"""
     prob = float(probability.replace('%', '')) if isinstance(probability, str) else probability
@@ -96,67 +222,138 @@ def extract_feature_explanations(url, result):
     return explanations
 
 # FALSE POSITIVE OVERRIDE FUNCTIONS
-# Cache for false positive URLs with file modification time
+# Cache for the override index with the modification times of its source files
 _fp_cache = {
-    'urls': set(),
+    'index': FalsePositiveOverrideIndex(),
     'mtime': None
 }
 
-def normalize_url(url):
-    """ Normalize URL to handle variations (trailing slashes, params, case) """
-    try:
-        parsed = urlparse(url)
-        # Preserve scheme and netloc, normalize path
-        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-        # Remove trailing slash and convert to lowercase for consistency
-        normalized = normalized.rstrip('/').lower()
-        return normalized
-    except Exception as e:
-        print(f"Error normalizing URL {url}: {e}")
-        return url.lower()  # Fallback to lowercase only
-
-def load_false_positive_urls():
-    """ Load false positive URLs from CSV with mtime-based cache invalidation.
-        This implements a post-prediction policy override based on verified false positives. """
+def load_false_positive_index():
+    """ Load the false positive override index with mtime-based cache invalidation.
+        Exact URLs come from false_positive_log.csv, prefix / domain rules from override_rules.csv. """
     global _fp_cache
     
     try:
-        # Check if file exists
-        if not os.path.exists(FALSE_POSITIVE_FILE):
-            return set()
-        
-        # Get current file modification time
-        current_mtime = os.path.getmtime(FALSE_POSITIVE_FILE)
-        
-        # Return cached data if file hasn't been modified
-        if _fp_cache['mtime'] == current_mtime and _fp_cache['urls']:
-            return _fp_cache['urls']
-        
-        # File has been modified or cache is empty - reload
-        fp_urls = set()
-        with open(FALSE_POSITIVE_FILE, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                url = row.get('url', '').strip()
-                if url:
-                    # Normalize URL before storing
-                    normalized_url = normalize_url(url)
-                    fp_urls.add(normalized_url)
+        # Get current file modification times (None if a file is missing)
+        current_mtime = tuple(
+            os.path.getmtime(path) if os.path.exists(path) else None
+            for path in (FALSE_POSITIVE_FILE, OVERRIDE_RULES_FILE)
+        )
+        
+        # Return cached index if neither file has been modified
+        if _fp_cache['mtime'] == current_mtime:
+            CACHE_LOOKUPS.inc(cache='fp_index', result='hit')
+            return _fp_cache['index']
+        CACHE_LOOKUPS.inc(cache='fp_index', result='miss')
+        
+        # A file has been modified - rebuild
+        index = FalsePositiveOverrideIndex()
+        if os.path.exists(FALSE_POSITIVE_FILE):
+            with open(FALSE_POSITIVE_FILE, 'r', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                for row in reader:
+                    url = (row.get('url') or '').strip()
+                    if url:
+                        index.add(url, SCOPE_URL)
+        
+        if os.path.exists(OVERRIDE_RULES_FILE):
+            with open(OVERRIDE_RULES_FILE, 'r', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                for row in reader:
+                    pattern = (row.get('pattern') or '').strip()
+                    scope = (row.get('scope') or SCOPE_URL).strip()
+                    if pattern and scope in OVERRIDE_SCOPES:
+                        index.add(pattern, scope)
         
         # Update cache
-        _fp_cache['urls'] = fp_urls
+        _fp_cache['index'] = index
         _fp_cache['mtime'] = current_mtime
         
-        print(f" Loaded {len(fp_urls)} verified false positive URLs (cache updated)")
-        return fp_urls
+        print(f" Loaded {len(index)} false positive overrides (cache updated)")
+        return index
         
     except Exception as e:
-        print(f" Error loading false positive URLs: {e}")
-        return set()
+        print(f" Error loading false positive overrides: {e}")
+        return _fp_cache['index']
+
+def is_marked_false_positive(timestamp, url):
+    """ Whether false_positive_log.csv already holds this detection. Its tombstone
+        is dropped once compaction removes the row, so this is the record that remains. """
+    if not timestamp or not os.path.exists(FALSE_POSITIVE_FILE):
+        return False
+    with open(FALSE_POSITIVE_FILE, 'r', encoding='utf-8') as f:
+        return any(row.get('original_timestamp') == timestamp and row.get('url') == url
+                   for row in csv.DictReader(f))
+
+def append_override_rule(pattern, scope, admin_note=''):
+    """ Append a prefix / domain scoped override rule """
+    file_exists = os.path.exists(OVERRIDE_RULES_FILE)
+    with open(OVERRIDE_RULES_FILE, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=OVERRIDE_RULE_FIELDS)
+        if not file_exists:
+            writer.writeheader()
+        writer.writerow({
+            'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'scope': scope,
+            'pattern': pattern,
+            'admin_note': admin_note
+        })
+
+# OVERRIDE AUDIT (BACKGROUND MODEL SCORING)
+_audit_queue = queue.Queue(maxsize=100)
+_audit_worker = {'thread': None, 'lock': threading.Lock()}
 
-def log_to_csv(url, result):
+def _override_audit_loop():
+    """ Background worker: score overridden URLs with the models and record the result """
+    try:
+        # Lowest OS priority for this thread only (Linux applies nice per thread)
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError):
+        pass
+    
+    while True:
+        url, html_content, override_scope = _audit_queue.get()
+        try:
+            result = predictor.predict(url, html_content)
+            file_exists = os.path.exists(OVERRIDE_AUDIT_FILE)
+            with open(OVERRIDE_AUDIT_FILE, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=OVERRIDE_AUDIT_FIELDS)
+                if not file_exists:
+                    writer.writeheader()
+                writer.writerow({
+                    'audited_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'url': url,
+                    'override_scope': override_scope,
+                    'model_prediction': 'phishing' if result.get('is_phishing', False) else 'legitimate',
+                    'model_risk_level': result.get('risk_level', 'UNKNOWN'),
+                    'model_probability': f"{result.get('final_risk_pct', 0.0):.2f}%",
+                    'url_prob': result.get('url_prob', 0.0),
+                    'content_prob': result.get('content_prob', 0.0)
+                })
+        except Exception as e:
+            print(f" Override audit failed for {url}: {e}")
+        finally:
+            _audit_queue.task_done()
+
+def submit_override_audit(url, html_content, override_scope):
+    """ Queue an overridden URL for background scoring. Never blocks the request;
+        if the queue is full the audit is dropped. """
+    if predictor is None:
+        return
+    with _audit_worker['lock']:
+        if _audit_worker['thread'] is None:
+            _audit_worker['thread'] = threading.Thread(target=_override_audit_loop, name='override-audit', daemon=True)
+            _audit_worker['thread'].start()
+    try:
+        _audit_queue.put_nowait((url, html_content, override_scope))
+    except queue.Full:
+        print(f" Override audit queue full - skipped {url}")
+
+def log_to_csv(url, result, html_content=None, timings=None):
     "Log phishing to CSV file"
+    timings = {} if timings is None else timings
     try:
+        t0 = time.perf_counter()
         # Extract domain
         ext = tldextract.extract(url)
         domain = f"{ext.domain}.{ext.suffix}" if ext.suffix else ext.domain
@@ -198,21 +395,28 @@ def log_to_csv(url, result):
         # Get detailed explanations
         detailed_explanations = extract_feature_explanations(url, result)
         detailed_reason = ' • ' + '\n• '.join(detailed_explanations) if detailed_explanations else reason
+        t1 = time.perf_counter()
+        timings['log_explanations'] = int((t1 - t0) * 1e6)
+        
+        # Archive the captured page (deduplicated by content hash)
+        html_hash = html_archive.put(html_content) if result.get('html_available') and html_content else ''
+        t0 = time.perf_counter()
+        timings['log_html_archive'] = int((t0 - t1) * 1e6)
         
         # Write to CSV - blocked and Warned URLs
-        with open(LOG_FILE, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                url,
-                domain,
-                prediction,
-                prob_str,
-                action,
-                risk_indicator,
-                reason,
-                detailed_reason
-            ])
+        detection_log.append({
+            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'url': url,
+            'domain': domain,
+            'prediction': prediction,
+            'probability': prob_str,
+            'action': action,
+            'risk_level': risk_indicator,
+            'reason': reason,
+            'detailed_reason': detailed_reason,
+            'html_hash': html_hash
+        })
+        timings['log_csv_write'] = int((time.perf_counter() - t0) * 1e6)
     except Exception as e:
         print(f"Error logging to CSV: {e}")
 
@@ -228,16 +432,25 @@ def home():
 
 @app.route("/predict", methods=["POST"])
 def predict():
-    if not predictor:
-        return jsonify({"error": "Model not initialized"}), 500
+    started = time.perf_counter()
+    PAYLOAD_SIZE.observe(request.content_length or 0, part='request')
+    
+    # Opt-in stage timings for this request (microseconds)
+    want_timings = (request.headers.get(TIMINGS_HEADER) == '1'
+                    or (TIMINGS_SAMPLE_RATE > 0 and random.random() < TIMINGS_SAMPLE_RATE))
+    timings = {}
     
     data = request.get_json()
+    timings['parse_request'] = int((time.perf_counter() - started) * 1e6)
     if not data or 'url' not in data:
+        record_prediction(started, 'invalid')
         return jsonify({"error": "URL is required"}), 400
     
     url = data['url']
     html_content = data.get('html_content')  # Optional
     html_captured = data.get('html_captured', False)
+    if html_content:
+        PAYLOAD_SIZE.observe(len(html_content), part='html')
     
     try:
         # Log request
@@ -248,40 +461,72 @@ def predict():
         print(f"HTML Available: {html_content is not None}")
         print(f"HTML Captured Flag: {html_captured}")
         
-        # Run prediction
-        result = predictor.predict(url, html_content)
-        
-        # POST-PREDICTION POLICY OVERRIDE FOR VERIFIED FALSE POSITIVES
-        # Normalize the current URL for comparison
-        normalized_url = normalize_url(url)
-        
-        # Load false positive URLs (cached with mtime check)
-        fp_urls = load_false_positive_urls()
-        
-        # Check if this URL has been verified as a false positive
-        is_false_positive_override = normalized_url in fp_urls
-        
-        # Store original model predictions (for transparency and auditing)
-        model_prediction = "phishing" if result.get('is_phishing', False) else "legitimate"
-        model_risk_level = result.get('risk_level', 'UNKNOWN')
-        model_probability = result.get('final_risk_pct', 0.0)
-        model_color = result.get('color', 'gray')
-        
-        # Apply post-prediction policy override if URL is verified false positive
-        if is_false_positive_override:
-            # Override decision - this URL was verified as safe by admin
-            result['is_phishing'] = False
-            result['risk_level'] = 'SAFE (FALSE POSITIVE)'
-            result['final_risk_pct'] = 0.0
-            result['color'] = 'blue'  # Blue indicates user-verified false positive
-            result['message'] = 'This URL was previously reported as a false positive by administrators'
+        # PRE-PREDICTION POLICY OVERRIDE FOR VERIFIED FALSE POSITIVES
+        # Checked before the models so admin-verified URLs skip inference entirely
+        t0 = time.perf_counter()
+        fp_index = load_false_positive_index()
+        override_scope = fp_index.match(url)
+        elapsed = time.perf_counter() - t0
+        STAGE_LATENCY.observe(elapsed, stage='override_lookup')
+        timings['override_lookup'] = int(elapsed * 1e6)
+        
+        if override_scope is not None:
+            if OVERRIDE_AUDIT_ENABLED:
+                submit_override_audit(url, html_content, override_scope)
             
-            print(f"FALSE POSITIVE OVERRIDE APPLIED")
+            print(f"FALSE POSITIVE OVERRIDE APPLIED (models skipped)")
             print(f"URL: {url}")
-            print(f"Original Model Prediction: {model_prediction}")
+            print(f"Override Scope: {override_scope}")
             print(f"Final Decision: legitimate (policy override)")
+            
+            # Same shape as a model response; model fields are marked as not evaluated
+            response = {
+                "url": url,
+                "html_available": html_content is not None and len(html_content) > 100,
+                
+                "url_prob": 0.0,
+                "content_prob": 0.0,
+                "model_prediction": "not evaluated",
+                "model_risk_level": "NOT EVALUATED",
+                "model_probability": 0.0,
+                
+                "final_decision": "legitimate",
+                "final_risk_pct": 0.0,
+                "risk_level": "SAFE (FALSE POSITIVE)",
+                "color": "blue",  # Blue indicates user-verified false positive
+                "confidence": "HIGH",
+                "is_phishing": False,
+                "message": "This URL was previously reported as a false positive by administrators",
+                
+                "overridden": True,
+                "override_reason": "Verified false positive by admin",
+                "override_scope": override_scope,
+                
+                "whitelisted": False,
+                "method": "Verified False Positive Override"
+            }
+            record_prediction(started, 'override', response['risk_level'])
+            if want_timings:
+                timings['total'] = int((time.perf_counter() - started) * 1e6)
+                response['timings_us'] = timings
+            return jsonify(response)
+        
+        if not predictor:
+            record_prediction(started, 'unavailable')
+            return jsonify({"error": "Model not initialized"}), 500
+        
+        # Run prediction
+        result = predictor.predict(url, html_content)
+        for stage, elapsed_us in result.get('timings_us', {}).items():
+            STAGE_LATENCY.observe(elapsed_us / 1e6, stage=stage)
+            timings[stage] = elapsed_us
+        if predictor.cascade_mode != 'off' and result.get('html_available'):
+            CASCADE.inc(result='shortcut' if result.get('content_skipped') else 'full')
+        if 'url_features_cached' in result:
+            CACHE_LOOKUPS.inc(cache='url_features', result='hit' if result['url_features_cached'] else 'miss')
         
         # Format response for browser extension
+        model_prediction = "phishing" if result.get('is_phishing', False) else "legitimate"
         response = {
             # Input info
             "url": url,
@@ -290,12 +535,13 @@ def predict():
             # Model predictions
             "url_prob": result.get('url_prob', 0.0),
             "content_prob": result.get('content_prob', 0.0),
+            "content_skipped": result.get('content_skipped', False),
             "model_prediction": model_prediction,
-            "model_risk_level": model_risk_level,
-            "model_probability": model_probability,
+            "model_risk_level": result.get('risk_level', 'UNKNOWN'),
+            "model_probability": result.get('final_risk_pct', 0.0),
             
-            # Final decision (after policy override if applicable)
-            "final_decision": "phishing" if result.get('is_phishing', False) else "legitimate",
+            # Final decision
+            "final_decision": model_prediction,
             "final_risk_pct": result.get('final_risk_pct', 0.0),
             "risk_level": result.get('risk_level', 'UNKNOWN'),
             "color": result.get('color', 'gray'),
@@ -304,8 +550,9 @@ def predict():
             "message": result.get('message', ''),
             
             # Override tracking
-            "overridden": is_false_positive_override,
-            "override_reason": "Verified false positive by admin" if is_false_positive_override else None,
+            "overridden": False,
+            "override_reason": None,
+            "override_scope": None,
             
             # Additional info
             "whitelisted": result.get('whitelisted', False),
@@ -323,59 +570,100 @@ def predict():
         
         # Log to CSV if phishing detected or warned
         if response['is_phishing']:
-            log_to_csv(url, result)
-        
+            t0 = time.perf_counter()
+            log_to_csv(url, result, html_content, timings)
+            elapsed = time.perf_counter() - t0
+            STAGE_LATENCY.observe(elapsed, stage='logging')
+            timings['logging'] = int(elapsed * 1e6)
+        
+        record_prediction(started, model_prediction, response['risk_level'])
+        if want_timings:
+            timings['total'] = int((time.perf_counter() - started) * 1e6)
+            response['timings_us'] = timings
         return jsonify(response)
         
     except Exception as e:
         print(f"Error during prediction: {e}")
         import traceback
         traceback.print_exc()
+        record_prediction(started, 'error')
         return jsonify({"error": str(e)}), 500
 
 # Dashboard Endpoints
 @app.route("/dashboard", methods=["GET"])
 def dashboard():
-    """Serves the Admin Dashboard HTML"""
-    dashboard_path = os.path.join(os.path.dirname(__file__), 'Frontend', 'dashboard.html')
-    if os.path.exists(dashboard_path):
-        return send_file(dashboard_path)
-    return "Dashboard not available - file not found", 404
+    """Serves the Admin Dashboard HTML with content-hashed asset URLs"""
+    dashboard_path = os.path.join(FRONTEND_DIR, 'dashboard.html')
+    css_path = os.path.join(FRONTEND_DIR, 'dashboard.css')
+    js_path = os.path.join(FRONTEND_DIR, 'dashboard.js')
+    if not os.path.exists(dashboard_path):
+        return "Dashboard not available - file not found", 404
+
+    # Asset hashes are part of the page, so the page etag depends on all three files
+    etag, last_modified = file_validators(dashboard_path, css_path, js_path)
+
+    def build():
+        with open(dashboard_path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        if os.path.exists(css_path):
+            html = html.replace('href="dashboard.css"', f'href="dashboard.css?v={asset_hash(css_path)}"')
+        if os.path.exists(js_path):
+            html = html.replace('src="dashboard.js"', f'src="dashboard.js?v={asset_hash(js_path)}"')
+        return Response(html, mimetype='text/html')
+
+    return conditional_response(etag, last_modified, build)
 
 @app.route("/dashboard.css", methods=["GET"])
 def dashboard_css():
     """Serves the Dashboard CSS"""
-    css_path = os.path.join(os.path.dirname(__file__), 'Frontend', 'dashboard.css')
+    css_path = os.path.join(FRONTEND_DIR, 'dashboard.css')
     if os.path.exists(css_path):
-        return send_file(css_path, mimetype='text/css')
+        return send_asset(css_path, 'text/css')
     return "CSS not found", 404
 
 @app.route("/dashboard.js", methods=["GET"])
 def dashboard_js():
     """Serves the Dashboard JavaScript"""
-    js_path = os.path.join(os.path.dirname(__file__), 'Frontend', 'dashboard.js')
+    js_path = os.path.join(FRONTEND_DIR, 'dashboard.js')
     if os.path.exists(js_path):
-        return send_file(js_path, mimetype='application/javascript')
+        return send_asset(js_path, 'application/javascript')
     return "JS not found", 404
 
+def parse_date_range():
+    """ Read an optional ?start=YYYY-MM-DD&end=YYYY-MM-DD (or ?days=N) window from the query string """
+    start = request.args.get('start')
+    end = request.args.get('end')
+    days = request.args.get('days')
+    if days:
+        start = (datetime.now() - timedelta(days=int(days) - 1)).strftime('%Y-%m-%d')
+    for value in (start, end):
+        if value is not None and partition_date(value) != value:
+            raise ValueError(f"Invalid date '{value}', expected YYYY-MM-DD")
+    return start, end
+
 @app.route("/api/logs", methods=["GET"])
 def get_logs():
-    """Get phishing log data for dashboard"""
+    """Get phishing log data for dashboard (optionally limited to a date range)"""
     try:
-        logs = []
-        if os.path.exists(LOG_FILE):
-            with open(LOG_FILE, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    logs.append(row)
+        try:
+            start, end = parse_date_range()
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
         
-        # Return in reverse order (newest first)
-        logs.reverse()
-        return jsonify({
-            "success": True,
-            "logs": logs,
-            "total": len(logs)
-        })
+        # Only the partitions inside the range are stat-ed and read
+        etag, last_modified = file_validators(*detection_log.files(start, end),
+                                              extra=f"{start}:{end}")
+
+        def build():
+            # Tombstoned (false positive) entries are skipped, newest first
+            logs = list(detection_log.rows(start, end, newest_first=True))
+            return jsonify({
+                "success": True,
+                "logs": logs,
+                "total": len(logs)
+            })
+
+        return conditional_response(etag, last_modified, build)
     except Exception as e:
         return jsonify({
             "success": False,
@@ -386,51 +674,42 @@ def get_logs():
 def get_stats():
     """Get dashboard statistics including today's summary"""
     try:
-        logs = []
-        if os.path.exists(LOG_FILE):
-            with open(LOG_FILE, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    logs.append(row)
-        
-        # Get today's date
+        # "Today" counts roll over at midnight even if no file changed
         today = datetime.now().strftime('%Y-%m-%d')
+        etag, last_modified = file_validators(*detection_log.files(), FALSE_POSITIVE_FILE, extra=today)
+
+        def build():
+            # Per-day counts are cached per partition; only changed days are re-read
+            totals = detection_log.totals()
+            today_counts = detection_log.summary(today)
+        
+            # Get false positives
+            false_positive_count = 0
+            false_positive_today = 0
+            try:
+                if os.path.exists(FALSE_POSITIVE_FILE):
+                    with open(FALSE_POSITIVE_FILE, 'r', encoding='utf-8') as f:
+                        reader = csv.DictReader(f)
+                        for row in reader:
+                            false_positive_count += 1
+                            if (row.get('marked_at') or '').startswith(today):
+                                false_positive_today += 1
+            except Exception as csv_error:
+                print(f"Error reading false positive CSV: {csv_error}")
         
-        # Calculate stats
-        total = len(logs)
-        today_logs = [log for log in logs if log['timestamp'].startswith(today)]
-        
-        blocked_total = len([log for log in logs if log['action'] == 'Blocked'])
-        warned_total = len([log for log in logs if log['action'] == 'Warned'])
-        
-        blocked_today = len([log for log in today_logs if log['action'] == 'Blocked'])
-        warned_today = len([log for log in today_logs if log['action'] == 'Warned'])
-        
-        # Get false positives
-        false_positives = []
-        try:
-            if os.path.exists(FALSE_POSITIVE_FILE):
-                with open(FALSE_POSITIVE_FILE, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        false_positives.append(row)
-        except Exception as csv_error:
-            print(f"Error reading false positive CSV: {csv_error}")
-        
-        false_positive_count = len(false_positives)
-        false_positive_today = len([fp for fp in false_positives if fp.get('marked_at', '').startswith(today)])
-        
-        return jsonify({
-            "success": True,
-            "total_detections": total,
-            "blocked_total": blocked_total,
-            "warned_total": warned_total,
-            "today_total": len(today_logs),
-            "today_blocked": blocked_today,
-            "today_warned": warned_today,
-            "false_positives_total": false_positive_count,
-            "false_positives_today": false_positive_today
-        })
+            return jsonify({
+                "success": True,
+                "total_detections": totals['total'],
+                "blocked_total": totals['Blocked'],
+                "warned_total": totals['Warned'],
+                "today_total": today_counts['total'],
+                "today_blocked": today_counts['Blocked'],
+                "today_warned": today_counts['Warned'],
+                "false_positives_total": false_positive_count,
+                "false_positives_today": false_positive_today
+            })
+
+        return conditional_response(etag, last_modified, build)
     except Exception as e:
         return jsonify({
             "success": False,
@@ -441,33 +720,38 @@ def get_stats():
 def get_false_positives():
     """Get list of reported false positives for dashboard"""
     try:
-        false_positives = []
-        if os.path.exists(FALSE_POSITIVE_FILE):
-            with open(FALSE_POSITIVE_FILE, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Convert CSV row to match expected frontend format
-                    false_positives.append({
-                        'timestamp': row['marked_at'],
-                        'original_detection_time': row['original_timestamp'],
-                        'url': row['url'],
-                        'domain': row['domain'],
-                        'predicted_label': row['prediction'],
-                        'confidence': float(row['probability'].replace('%', '')) / 100 if '%' in row['probability'] else float(row['probability']),
-                        'risk_level': row['risk_level'],
-                        'action_taken': row['action'],
-                        'detection_reason': row['reason'],
-                        'detailed_features': row['detailed_reason'],
-                        'admin_note': row['admin_note']
-                    })
-        
-        # Return in reverse order (newest first)
-        false_positives.reverse()
-        return jsonify({
-            "success": True,
-            "false_positives": false_positives,
-            "total": len(false_positives)
-        })
+        etag, last_modified = file_validators(FALSE_POSITIVE_FILE)
+
+        def build():
+            false_positives = []
+            if os.path.exists(FALSE_POSITIVE_FILE):
+                with open(FALSE_POSITIVE_FILE, 'r', encoding='utf-8') as f:
+                    reader = csv.DictReader(f)
+                    for row in reader:
+                        # Convert CSV row to match expected frontend format
+                        false_positives.append({
+                            'timestamp': row['marked_at'],
+                            'original_detection_time': row['original_timestamp'],
+                            'url': row['url'],
+                            'domain': row['domain'],
+                            'predicted_label': row['prediction'],
+                            'confidence': float(row['probability'].replace('%', '')) / 100 if '%' in row['probability'] else float(row['probability']),
+                            'risk_level': row['risk_level'],
+                            'action_taken': row['action'],
+                            'detection_reason': row['reason'],
+                            'detailed_features': row['detailed_reason'],
+                            'admin_note': row['admin_note']
+                        })
+            
+            # Return in reverse order (newest first)
+            false_positives.reverse()
+            return jsonify({
+                "success": True,
+                "false_positives": false_positives,
+                "total": len(false_positives)
+            })
+
+        return conditional_response(etag, last_modified, build)
     except Exception as e:
         return jsonify({
             "success": False,
@@ -476,60 +760,58 @@ def get_false_positives():
 
 @app.route("/api/mark_false_positive", methods=["POST"])
 def mark_false_positive():
-    """Mark a URL as false positive removes from malicious log and adds to false positive CSV"""
+    """Mark a URL as false positive: tombstones the malicious log entry and adds it to the false positive CSV.
+       Append-only - neither log is rewritten, so the cost doesn't grow with log size."""
     try:
         data = request.get_json()
         url = data.get('url')
         timestamp = data.get('timestamp')
         admin_note = data.get('note', '')
+        scope = data.get('scope', SCOPE_URL)
         
         if not url:
             return jsonify({"success": False, "error": "URL required"}), 400
+        if scope not in OVERRIDE_SCOPES:
+            return jsonify({"success": False, "error": f"scope must be one of {list(OVERRIDE_SCOPES)}"}), 400
+        if scope == SCOPE_DOMAIN and not registered_domain(url):
+            # A bare public suffix (co.uk, com, github.io) would whitelist every site under it
+            return jsonify({"success": False, "error": "domain scope needs a registered domain, not a public suffix"}), 400
+        
+        # Rows with the same timestamp and URL are told apart by entry_id; without one
+        # the first live row with this timestamp and URL is marked
+        eid = data.get('entry_id')
+        if not eid:
+            row = detection_log.find(timestamp, url)
+            eid = row['entry_id'] if row else entry_id(timestamp, url)
         
-        # Read all logs from malicious_log.csv
-        all_logs = []
-        original_log = None
-        
-        if os.path.exists(LOG_FILE):
-            with open(LOG_FILE, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row['url'] == url and row['timestamp'] == timestamp:
-                        original_log = row  # Found the entry to remove
-                    else:
-                        all_logs.append(row)  # Keep all other entries
-        
-        if not original_log:
+        # Check if already marked as false positive
+        if detection_log.is_tombstoned(eid):
+            return jsonify({
+                "success": True,
+                "message": "Already marked as false positive",
+                "already_marked": True
+            })
+        
+        # Find the entry via the offset index
+        original_log = detection_log.get(eid)
+        if not original_log and is_marked_false_positive(timestamp, url):
+            # Marked before and already compacted out of the log (tombstone applied)
+            return jsonify({
+                "success": True,
+                "message": "Already marked as false positive",
+                "already_marked": True
+            })
+        if not original_log or original_log['url'] != url:
             return jsonify({
                 "success": False,
                 "error": "Original log entry not found"
             }), 404
         
-        # Check if already marked as false positive
-        if os.path.exists(FALSE_POSITIVE_FILE):
-            with open(FALSE_POSITIVE_FILE, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row['url'] == url and row['original_timestamp'] == timestamp:
-                        return jsonify({
-                            "success": True,
-                            "message": "Already marked as false positive",
-                            "already_marked": True
-                        })
-        
-        # Write back to malicious_log.csv WITHOUT the false positive entry
-        with open(LOG_FILE, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=['timestamp', 'url', 'domain', 'prediction', 
-                                                   'probability', 'action', 'risk_level', 
-                                                   'reason', 'detailed_reason'])
-            writer.writeheader()
-            writer.writerows(all_logs)
-        
         # Add to false_positive_log.csv
         marked_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         fp_entry = {
             'marked_at': marked_timestamp,
-            'original_timestamp': timestamp,
+            'original_timestamp': original_log['timestamp'],
             'url': url,
             'domain': original_log['domain'],
             'prediction': original_log['prediction'],
@@ -553,8 +835,15 @@ def mark_false_positive():
             writer = csv.DictWriter(f, fieldnames=list(fp_entry.keys()))
             writer.writerow(fp_entry)
         
-        print(f"False Positive Marked: {url}")
-        print(f"Removed from: Malicious_log.csv")
+        # Hide the entry from the malicious log (physically removed by background compaction)
+        detection_log.tombstone(eid)
+        
+        # Wider scopes also cover the rest of the path / domain from now on
+        if scope != SCOPE_URL:
+            append_override_rule(url, scope, admin_note)
+        
+        print(f"False Positive Marked: {url} (scope: {scope})")
+        print(f"Tombstoned in: detection log (entry {eid})")
         print(f"Added to: false_positive_log.csv")
         
         return jsonify({
@@ -570,16 +859,145 @@ def mark_false_positive():
             "error": str(e)
         }), 500
 
+@app.route("/api/overrides", methods=["GET"])
+def get_overrides():
+    """List prefix / domain scoped override rules"""
+    try:
+        etag, last_modified = file_validators(OVERRIDE_RULES_FILE)
+
+        def build():
+            rules = []
+            if os.path.exists(OVERRIDE_RULES_FILE):
+                with open(OVERRIDE_RULES_FILE, 'r', encoding='utf-8') as f:
+                    reader = csv.DictReader(f)
+                    for row in reader:
+                        rules.append(row)
+            rules.reverse()
+            return jsonify({
+                "success": True,
+                "overrides": rules,
+                "total": len(rules)
+            })
+
+        return conditional_response(etag, last_modified, build)
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+@app.route("/api/overrides", methods=["POST"])
+def add_override():
+    """Add an override for a URL, a path prefix or a whole registered domain"""
+    try:
+        data = request.get_json() or {}
+        pattern = (data.get('url') or '').strip()
+        scope = data.get('scope', SCOPE_URL)
+        admin_note = data.get('note', '')
+        
+        if not pattern:
+            return jsonify({"success": False, "error": "URL required"}), 400
+        if scope not in OVERRIDE_SCOPES:
+            return jsonify({"success": False, "error": f"scope must be one of {list(OVERRIDE_SCOPES)}"}), 400
+        if scope == SCOPE_DOMAIN and not registered_domain(pattern):
+            # A bare public suffix (co.uk, com, github.io) would whitelist every site under it
+            return jsonify({"success": False, "error": "domain scope needs a registered domain, not a public suffix"}), 400
+        
+        # Skip only if an existing rule is at least as wide (an exact URL doesn't cover a prefix)
+        existing_scope = load_false_positive_index().match(pattern)
+        if existing_scope is not None and (existing_scope != SCOPE_URL or scope == SCOPE_URL):
+            return jsonify({
+                "success": True,
+                "message": "Already covered by an existing override",
+                "already_marked": True
+            })
+        
+        append_override_rule(pattern, scope, admin_note)
+        print(f"Override Added: {pattern} (scope: {scope})")
+        
+        return jsonify({
+            "success": True,
+            "message": "Override added successfully",
+            "scope": scope
+        })
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+@app.route("/api/html/<page_hash>", methods=["GET"])
+def get_archived_html(page_hash):
+    """Stream a captured page from the HTML archive as plain text (never rendered)"""
+    if page_hash not in html_archive:
+        return jsonify({"success": False, "error": "Page not found"}), 404
+
+    # Content-addressed: the hash is the ETag and the content never changes
+    if not is_resource_modified(request.environ, etag=page_hash):
+        response = Response(status=304)
+    else:
+        response = Response(html_archive.iter_chunks(page_hash), mimetype='text/plain')
+    response.set_etag(page_hash)
+    response.headers['X-Content-Type-Options'] = 'nosniff'
+    response.cache_control.public = True
+    response.cache_control.max_age = STATIC_MAX_AGE
+    response.cache_control.immutable = True
+    return response
+
+# METRICS
+@app.route("/metrics", methods=["GET"])
+def get_metrics():
+    """Prometheus scrape endpoint"""
+    return Response(metrics.expose(), content_type=MetricsRegistry.CONTENT_TYPE)
+
+# PROFILING
+@app.route("/api/admin/profile", methods=["POST"])
+def start_profile():
+    """Sample all worker stacks for N seconds and write a collapsed-stack file"""
+    data = request.get_json(silent=True) or {}
+    try:
+        seconds = float(data.get('seconds', 30))
+        interval = float(data.get('interval_ms', 10)) / 1000
+    except (TypeError, ValueError):
+        return jsonify({"success": False, "error": "seconds and interval_ms must be numbers"}), 400
+    
+    output = profiler.start(seconds, interval, include_idle=bool(data.get('include_idle', False)))
+    if output is None:
+        return jsonify({"success": False, "error": "A profile is already running", "status": profiler.status}), 409
+    return jsonify({"success": True, "status": profiler.status}), 202
+
+@app.route("/api/admin/profile", methods=["GET"])
+def get_profile_status():
+    """Status of the running profile, or the summary of the last one"""
+    return jsonify({"success": True, "status": profiler.status})
+
 # HEALTH CHECK
 @app.route("/health", methods=["GET"])
 def health_check():
     """Simple health check endpoint"""
     return jsonify({
         "status": "healthy",
-        "predictor": "active" if predictor else "inactive"
+        "predictor": "active" if predictor else "inactive",
+        "cascade": predictor.cascade_report() if predictor else None,
+        "url_feature_cache": predictor.url_cache.stats() if predictor and predictor.url_cache else None,
+        "extractor_fingerprints": predictor.fingerprints if predictor else None
     })
 
+# STARTUP
+def startup():
+    """ One-time server startup work that changes files on disk: split the legacy
+        Malicious_log.csv into day partitions (renamed to .migrated afterwards) and
+        start log rotation. Called when the server starts, never on import, so tests,
+        benchmarks and tooling can import this module without touching HTML_logs/. """
+    detection_log.migrate_legacy(LOG_FILE, TOMBSTONE_FILE)
+    detection_log.rotate_in_background()
+    legacy_pages = html_archive.legacy_files()
+    if legacy_pages:
+        print(f" Note: {len(legacy_pages)} legacy HTML files in {HTML_ARCHIVE_DIR} - "
+              f"run python log_store/html_archive.py to move them into the archive")
+
 if __name__ == "__main__":
+    startup()
     print("="*70)
     print("STARTING RULE-BASED PHISHING DETECTION API")
     print("="*70)
@@ -591,6 +1009,8 @@ if __name__ == "__main__":
     print("Endpoints:")
     print("POST /predict - Main prediction")
     print("GET /health - Health check")
+    print("GET /metrics - Prometheus metrics")
+    print("POST /api/admin/profile - Sample worker stacks (or send SIGUSR1)")
     print("GET /api/stats - System stats")
     print("\n" + "="*70 + "\n")
     
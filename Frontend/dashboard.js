@@ -141,7 +141,7 @@ function renderTable(logs) {
       // Admin column - either "Reviewed" or "Report" button
       const adminCell = isMarked
         ? `<span class="fp-reviewed-badge"> Reviewed </span>`
-        : `<button class="fp-btn-modern" onclick="event.stopPropagation(); markFalsePositive('${log.url}', '${log.timestamp}')" title="Report False Positive">
+        : `<button class="fp-btn-modern" onclick="event.stopPropagation(); markFalsePositive('${log.url}', '${log.timestamp}', '${log.entry_id || ""}')" title="Report False Positive">
                 <span class="fp-icon"> </span>
                 <span class="fp-text">Report</span>
             </button>`;
@@ -185,6 +185,13 @@ function renderTable(logs) {
                               log.url
                             }</span>
                         </div>
+                        ${
+                          log.html_hash
+                            ? `<div class="detail-item">
+                            <strong>📄 Captured Page:</strong> <a href="/api/html/${log.html_hash}" target="_blank" rel="noopener" onclick="event.stopPropagation()">View source</a>
+                        </div>`
+                            : ""
+                        }
                     </div>
                     <h4>🔍 Why was this URL flagged?</h4>
                     <div class="explanation-box">
@@ -450,14 +457,17 @@ async function fetchFalsePositives() {
 
 let pendingFPUrl = null;
 let pendingFPTimestamp = null;
+let pendingFPEntryId = null;
 
-function markFalsePositive(url, timestamp) {
-  // Store pending values
+function markFalsePositive(url, timestamp, entryId) {
+  // Store pending values (entry_id tells apart rows with the same URL and timestamp)
   pendingFPUrl = url;
   pendingFPTimestamp = timestamp;
+  pendingFPEntryId = entryId || null;
 
-  // Update modal with URL
+  // Update modal with URL (scope defaults to this URL only)
   document.getElementById("fpModalUrl").textContent = url;
+  document.getElementById("fpModalScope").value = "url";
 
   // Show modal
   const modal = document.getElementById("fpModal");
@@ -471,6 +481,7 @@ function closeFPModal() {
   document.body.style.overflow = "";
   pendingFPUrl = null;
   pendingFPTimestamp = null;
+  pendingFPEntryId = null;
 }
 
 async function confirmFalsePositive() {
@@ -483,6 +494,8 @@ async function confirmFalsePositive() {
       body: JSON.stringify({
         url: pendingFPUrl,
         timestamp: pendingFPTimestamp,
+        entry_id: pendingFPEntryId,
+        scope: document.getElementById("fpModalScope").value,
         note: "", // No note needed anymore
       }),
     });
@@ -1,12 +1,18 @@
+import atexit
 import joblib
 import pandas as pd
 import numpy as np
 import os
 import sys
+import threading
+import time
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from feature_extraction.content_2023.feature_extract_2023 import ContentFeatureExtractor
 from feature_extraction.url_2024.Feature_Extractor import URLFeatureExtractor
+from feature_extraction.url_2024.feature_cache import URLFeatureCache
+from feature_extraction.extractor_fingerprint import check_fingerprint
+from RuleBased.flat_forest import FlatForest
 
 
 class RuleBasedFusionPredictor:
@@ -26,14 +32,36 @@ class RuleBasedFusionPredictor:
             self.model_2025 = joblib.load(os.path.join(model_2024_path, 'model_2024.pkl'))
             self.feats_2025 = joblib.load(os.path.join(model_2024_path, 'features_2024.pkl'))
             self.extractor_2025 = URLFeatureExtractor()
+            self._init_url_booster()
+            # URL features are looked up in the shared on-disk cache (filled by
+            # training, augmentation and earlier requests); URL_FEATURE_CACHE=0 disables it.
+            # Writes happen on a background thread, and the cache is capped at
+            # URL_FEATURE_CACHE_MAX_ENTRIES entries (~280 bytes each) so it doesn't
+            # grow with every URL seen in production.
+            self.url_cache = None
+            if os.environ.get('URL_FEATURE_CACHE', '1') != '0':
+                self.url_cache = URLFeatureCache(
+                    self.extractor_2025, flush_every=256, background=True,
+                    max_entries=int(os.environ.get('URL_FEATURE_CACHE_MAX_ENTRIES', '500000')))
+                atexit.register(self.url_cache.flush)
             print("Model 2024 (URL) Loaded")
 
             model_2023_path = os.path.join(self.models_path, 'model_2023')
-            self.model_2023 = joblib.load(os.path.join(model_2023_path, 'model_2023.pkl'))
-            self.feats_2023 = joblib.load(os.path.join(model_2023_path, 'features_2023.pkl'))
+            # The forest is evaluated from flattened arrays (model_2023_flat.npz, built on
+            # first load); the pickled estimator is only loaded when that cache is stale.
+            # Set CONTENT_MODEL_BACKEND=sklearn to use the estimator itself.
+            model_2023_file = os.path.join(model_2023_path, 'model_2023.pkl')
+            if os.environ.get('CONTENT_MODEL_BACKEND', 'flat') == 'sklearn':
+                self.flat_2023, self.model_2023 = None, joblib.load(model_2023_file)
+            else:
+                self.flat_2023, self.model_2023 = FlatForest.load_or_build(model_2023_file)
+            self.feats_2023 = list(joblib.load(os.path.join(model_2023_path, 'features_2023.pkl')))
             self.extractor_2023 = ContentFeatureExtractor()
             print("Model 2023 (Content) Loaded")
             
+            self._check_fingerprints(os.environ.get('FEATURE_FINGERPRINT_CHECK', 'warn'))
+            self._init_cascade(os.environ.get('FUSION_CASCADE', 'off'))
+            
             print("SYSTEM READY")
             print("="*70 + "\n")
 
@@ -41,6 +69,149 @@ class RuleBasedFusionPredictor:
             print(f"Error: {e}")
             raise
 
+    def _check_fingerprints(self, mode):
+        """
+        Compare the extractor fingerprint each model was trained with (in its
+        metadata) against the running extractors. FEATURE_FINGERPRINT_CHECK=
+        warn (default) prints a warning on a mismatch, strict refuses to start
+        (the model would get features computed differently from its training
+        data), off skips the message.
+        """
+        self.fingerprints = {}
+        for name, model_dir, extractor in (('url', 'model_2024', self.extractor_2025),
+                                           ('content', 'model_2023', self.extractor_2023)):
+            metadata_path = os.path.join(self.models_path, model_dir, f'{model_dir}_metadata.pkl')
+            metadata = joblib.load(metadata_path) if os.path.exists(metadata_path) else {}
+            expected = metadata.get('extractor_fingerprint')
+            actual = extractor.fingerprint()
+            status = check_fingerprint(model_dir, expected, actual, mode)
+            self.fingerprints[name] = {'model': expected, 'extractor': actual, 'status': status}
+
+    def _init_url_booster(self):
+        """
+        Use the XGBoost booster directly (inplace_predict on a float32 array)
+        instead of XGBClassifier.predict_proba on a DataFrame, which validates
+        and converts the input on every call. Falls back to the wrapper for
+        models that are not XGBoost.
+        """
+        self.feats_2025 = list(self.feats_2025)
+        self.booster_2025 = None
+        if not hasattr(self.model_2025, 'get_booster'):
+            return
+        self.booster_2025 = self.model_2025.get_booster()
+        # Same trees as predict_proba: stop at the best iteration if early stopping was used
+        try:
+            best_iteration = self.model_2025.best_iteration
+        except AttributeError:
+            best_iteration = None
+        self._url_iteration_range = (0, best_iteration + 1) if best_iteration is not None else (0, 0)
+        missing = getattr(self.model_2025, 'missing', np.nan)
+        self._url_missing = np.nan if missing is None else missing
+
+    def url_matrix(self, feature_dicts):
+        """ Contiguous float32 matrix of URL features in the model's column order
+            (absent features -> 0, as reindex(fill_value=0) did; None -> NaN) """
+        x = np.empty((len(feature_dicts), len(self.feats_2025)), dtype=np.float32)
+        for i, feats in enumerate(feature_dicts):
+            x[i] = [feats.get(name, 0) for name in self.feats_2025]
+        return x
+
+    def url_probabilities(self, x, native=True):
+        """ Phishing probability for each row of a url_matrix() """
+        if native and self.booster_2025 is not None:
+            out = self.booster_2025.inplace_predict(x, iteration_range=self._url_iteration_range,
+                                                    missing=self._url_missing)
+            return out[:, 1] if out.ndim == 2 else out
+        return self.model_2025.predict_proba(pd.DataFrame(x, columns=self.feats_2025))[:, 1]
+
+    def content_matrix(self, feature_dicts):
+        """ Float32 matrix of content features in the model's column order (absent features -> 0) """
+        x = np.empty((len(feature_dicts), len(self.feats_2023)), dtype=np.float32)
+        for i, feats in enumerate(feature_dicts):
+            x[i] = [feats.get(name, 0) for name in self.feats_2023]
+        return x
+
+    def content_probabilities(self, x):
+        """ Phishing probability for each row of a content_matrix() """
+        if self.flat_2023 is not None:
+            return self.flat_2023.predict_proba(x)[:, 1]
+        return self.model_2023.predict_proba(pd.DataFrame(x, columns=self.feats_2023))[:, 1]
+
+    def _init_cascade(self, mode):
+        """
+        Early-exit cascade (FUSION_CASCADE=level, default off).
+        
+        For URL probabilities where the fusion gives the same risk level - and so
+        the same extension action (block / warn / allow) - for every content
+        probability as without HTML, Stage 2 (HTML parsing + RandomForest) cannot
+        change the result and is skipped; the request is scored like one without HTML.
+        
+        The ranges are derived from _fusion_terms / determine_risk_level at startup,
+        so they follow any change to the fusion rules. With the current rules there
+        is no such range - content can always move the level (e.g. at url_prob 0.99,
+        content >= 0.6 gives VERY SUSPICIOUS, content 0 POSSIBLY MALICIOUS) - so
+        nothing is skipped until the rules change.
+        """
+        if mode not in ('off', 'level'):
+            print(f"FUSION_CASCADE={mode} is not supported (only 'level' keeps every risk level) - cascade off")
+        self.cascade_mode = 'level' if mode == 'level' else 'off'
+        self.cascade_ranges = [] if self.cascade_mode == 'off' else self._decisive_url_ranges()
+        self.cascade_stats = {'eligible': 0, 'shortcut': 0}
+        self._cascade_lock = threading.Lock()
+        if self.cascade_mode != 'off':
+            ranges = ', '.join(f"{lo:.3f}-{hi:.3f}" for lo, hi in self.cascade_ranges) or 'none'
+            print(f"Fusion cascade ({self.cascade_mode}): content model skipped for url_prob in {ranges}")
+
+    def _fusion_level(self, url_prob, content_prob, html_available):
+        final_risk = self._fusion_terms(url_prob * 100, content_prob * 100, html_available)['final_risk']
+        return self.determine_risk_level(final_risk, url_prob, content_prob)[0]
+
+    def _decisive_url_ranges(self, steps=1000, content_steps=400):
+        """
+        URL probability intervals where the risk level with any content probability
+        equals the risk level without content. The content grid includes the points
+        where the fusion rules switch (|url - content| = 40%, content = 50%), and
+        an interval only contains url_prob values strictly between decisive grid
+        points, so the unchecked edges of each interval are excluded.
+        """
+        decisive = []
+        for i in range(steps + 1):
+            u = i / steps
+            url_only = self._fusion_level(u, 0.0, False)
+            edges = [u - 0.4, u + 0.4, 0.5]
+            contents = [0.0, 1.0] + [c + d for c in edges for d in (-1e-9, 1e-9) if 0 <= c + d <= 1]
+            contents += [j / content_steps for j in range(1, content_steps)]
+            decisive.append(all(self._fusion_level(u, c, True) == url_only for c in contents))
+        
+        ranges, start = [], None
+        for i, ok in enumerate(decisive + [False]):
+            if ok and start is None:
+                start = i
+            elif not ok and start is not None:
+                if i - 1 > start:
+                    ranges.append((start / steps, (i - 1) / steps))
+                start = None
+        return ranges
+
+    def _cascade_shortcut(self, url_prob):
+        """ True if the content model can be skipped for this URL probability (and counts it) """
+        if self.cascade_mode == 'off':
+            return False
+        # Interval ends are only decisive at 0 and 1, where no unchecked values lie beyond them
+        shortcut = any(lo < url_prob < hi or url_prob in (lo, hi) and url_prob in (0.0, 1.0)
+                       for lo, hi in self.cascade_ranges)
+        with self._cascade_lock:
+            self.cascade_stats['eligible'] += 1
+            self.cascade_stats['shortcut'] += shortcut
+        return shortcut
+
+    def cascade_report(self):
+        """ Cascade configuration and how often it skipped the content model """
+        with self._cascade_lock:
+            stats = dict(self.cascade_stats)
+        stats['shortcut_rate'] = stats['shortcut'] / stats['eligible'] if stats['eligible'] else 0.0
+        return {'mode': self.cascade_mode, 'url_prob_ranges': self.cascade_ranges, **stats}
+
     def calculate_final_risk(self, url_prob, content_prob, html_available):
         """
         ============================================================
@@ -106,22 +277,23 @@ class RuleBasedFusionPredictor:
         print(f"   Model 2023 (Content): {content_pct:.1f}%")
         print(f"   HTML Available:       {html_available}")
         
-        # Calculate disagreement
-        disagreement = abs(url_pct - content_pct)
+        terms = self._fusion_terms(url_pct, content_pct, html_available)
+        disagreement = terms['disagreement']
+        agreement = terms['agreement']
+        base_risk = terms['base_risk']
+        boost = terms['boost']
+        html_adjustment = terms['html_adjustment']
+        final_risk = terms['final_risk']
         
         # --------------------------------------------------------
         # RULE 1: Agreement vs Disagreement
         # --------------------------------------------------------
         if disagreement > 40:
-            # Models DISAGREE → Use 50/50 average
-            base_risk = (url_pct + content_pct) / 2
             print(f"\n Rule 1 - Disagreement (50/50 Average):")
             print(f"   disagreement = |{url_pct:.1f}% - {content_pct:.1f}%| = {disagreement:.1f}%")
             print(f"   base_risk = ({url_pct:.1f}% + {content_pct:.1f}%) / 2 = {base_risk:.1f}%")
             print(f"   Reason: High disagreement → Equal weight to both models")
         else:
-            # Models AGREE → Use MAX
-            base_risk = max(url_pct, content_pct)
             print(f"\n Rule 1 - Agreement (MAX):")
             print(f"   disagreement = {disagreement:.1f}% (< 40% threshold)")
             print(f"   base_risk = MAX({url_pct:.1f}%, {content_pct:.1f}%) = {base_risk:.1f}%")
@@ -130,47 +302,32 @@ class RuleBasedFusionPredictor:
         # --------------------------------------------------------
         # RULE 2: Agreement Boost (When Both Say Phishing)
         # --------------------------------------------------------
-        agreement = 100 - disagreement
-        boost = 0.0
+        both_say_phishing = url_pct > 50 and content_pct > 50
         
-        url_says_phishing = url_pct > 50
-        content_says_phishing = content_pct > 50
-        both_say_phishing = url_says_phishing and content_says_phishing
-        
-        if both_say_phishing and agreement > 60:
-            boost = agreement * 0.03  # More conservative boost
-            print(f"\n Rule 2 - Agreement Boost:")
+        print(f"\n Rule 2 - Agreement Boost:")
+        if boost:
             print(f"   Both models predict phishing (>{50}%)")
             print(f"   agreement = {agreement:.1f}% (> 60% threshold)")
             print(f"   boost = {agreement:.1f}% × 0.03 = {boost:.1f}%")
             print(f"   Reason: Strong consensus on danger → Amplify signal")
+        elif not both_say_phishing:
+            print(f"   Not both predicting phishing → No boost")
         else:
-            print(f"\n Rule 2 - Agreement Boost:")
-            if not both_say_phishing:
-                print(f"   Not both predicting phishing → No boost")
-            else:
-                print(f"   agreement = {agreement:.1f}% (< 60% threshold) → No boost")
+            print(f"   agreement = {agreement:.1f}% (< 60% threshold) → No boost")
         
         # --------------------------------------------------------
         # RULE 3: HTML Availability Adjustment
         # --------------------------------------------------------
-        html_adjustment = 0.0
-        
-        if not html_available:
-            html_adjustment = 5.0
-            print(f"\n Rule 3 - HTML Adjustment:")
+        print(f"\n Rule 3 - HTML Adjustment:")
+        if html_adjustment:
             print(f"   HTML not available → Reduce confidence by {html_adjustment:.1f}%")
             print(f"   Reason: Can't verify content, rely only on URL")
         else:
-            print(f"\n Rule 3 - HTML Adjustment:")
             print(f"   HTML available → No adjustment needed")
         
         # --------------------------------------------------------
         # FINAL CALCULATION
         # --------------------------------------------------------
-        final_risk = base_risk + boost - html_adjustment
-        final_risk = max(0, min(100, final_risk)) 
-        
         print(f"\n" + "="*70)
         print("  FINAL CALCULATION")
         print("="*70)
@@ -180,6 +337,29 @@ class RuleBasedFusionPredictor:
         
         return final_risk / 100 
 
+    @staticmethod
+    def _fusion_terms(url_pct, content_pct, html_available):
+        """ The arithmetic of calculate_final_risk (percentages in, percentages out), without the report """
+        disagreement = abs(url_pct - content_pct)
+        if disagreement > 40:
+            # Models DISAGREE → Use 50/50 average
+            base_risk = (url_pct + content_pct) / 2
+        else:
+            # Models AGREE → Use MAX
+            base_risk = max(url_pct, content_pct)
+        
+        agreement = 100 - disagreement
+        boost = 0.0
+        if url_pct > 50 and content_pct > 50 and agreement > 60:
+            boost = agreement * 0.03  # More conservative boost
+        
+        html_adjustment = 0.0 if html_available else 5.0
+        
+        final_risk = base_risk + boost - html_adjustment
+        final_risk = max(0, min(100, final_risk))
+        return {'disagreement': disagreement, 'agreement': agreement, 'base_risk': base_risk,
+                'boost': boost, 'html_adjustment': html_adjustment, 'final_risk': final_risk}
+
     def determine_risk_level(self, final_risk_pct, url_prob, content_prob):
         url_pred = 1 if url_prob > 0.5 else 0
         content_pred = 1 if content_prob > 0.5 else 0
@@ -224,6 +404,9 @@ class RuleBasedFusionPredictor:
             'html_available': html_content is not None and len(html_content) > 100,
             'method': 'Rule-Based Fusion (Model 2024 + Model 2023)'
         }
+        # Wall time of each stage in microseconds (exported by the API as metrics)
+        timings = results['timings_us'] = {}
+        clock = time.perf_counter
 
         print(f"\n" + "="*70)
         print(f"  ANALYZING: {url}")
@@ -236,12 +419,17 @@ class RuleBasedFusionPredictor:
             print(" STAGE 1: URL Pattern Analysis (Model 2024)")
             print("-"*70)
             
-            feats_url = self.extractor_2025.extract(url)
-            df_25 = pd.DataFrame([feats_url])
-            df_25 = df_25.reindex(columns=self.feats_2025, fill_value=0)
+            t0 = clock()
+            feats_url = self.url_cache.get(url) if self.url_cache else None
+            results['url_features_cached'] = feats_url is not None
+            if feats_url is None:
+                feats_url = self.url_cache.compute(url) if self.url_cache else self.extractor_2025.extract(url)
+            x_25 = self.url_matrix([feats_url])
+            t1 = clock()
+            timings['url_extraction'] = int((t1 - t0) * 1e6)
             
-            proba_2025 = self.model_2025.predict_proba(df_25)[0]
-            prob_phish_2025 = proba_2025[1]
+            prob_phish_2025 = self.url_probabilities(x_25)[0]
+            timings['xgboost'] = int((clock() - t1) * 1e6)
             pred_2025 = 1 if prob_phish_2025 > 0.5 else 0
             
             results['url_pred'] = pred_2025
@@ -250,25 +438,35 @@ class RuleBasedFusionPredictor:
             print(f"   Prediction: {pred_2025} ({'Phishing' if pred_2025 else 'Safe'})")
             print(f"   Probability: {prob_phish_2025*100:.1f}%")
             
+            # Early exit: the content model cannot change the outcome
+            results['content_skipped'] = results['html_available'] and self._cascade_shortcut(results['url_prob'])
+            
         except Exception as e:
             print("Error: {e}")
             results['url_pred'] = 0
             results['url_prob'] = 0.5
+            results['content_skipped'] = False
 
         # ========================================================
         # STAGE 2: Model 2023 (Content Analysis)
         # ========================================================
-        if results['html_available']:
+        if results['content_skipped']:
+            print("TAGE 2: Skipped (URL model decisive)")
+            results['content_pred'] = 0
+            results['content_prob'] = 0.0
+        elif results['html_available']:
             try:
                 print("TAGE 2: Page Content Analysis (Model 2023)")
                 print("-"*70)
                 
+                t0 = clock()
                 feats_content = self.extractor_2023.extract_from_html(html_content, url)
-                df_23 = pd.DataFrame([feats_content])
-                df_23 = df_23.reindex(columns=self.feats_2023, fill_value=0)
+                x_23 = self.content_matrix([feats_content])
+                t1 = clock()
+                timings['html_parse'] = int((t1 - t0) * 1e6)
                 
-                proba_2023 = self.model_2023.predict_proba(df_23)[0]
-                prob_phish_2023 = proba_2023[1]
+                prob_phish_2023 = self.content_probabilities(x_23)[0]
+                timings['random_forest'] = int((clock() - t1) * 1e6)
                 pred_2023 = 1 if prob_phish_2023 > 0.5 else 0
                 
                 results['content_pred'] = pred_2023
@@ -289,10 +487,11 @@ class RuleBasedFusionPredictor:
         # ========================================================
         # STAGE 3: Rule-Based Fusion
         # ========================================================
+        t0 = clock()
         final_risk_prob = self.calculate_final_risk(
             results['url_prob'],
             results['content_prob'],
-            results['html_available']
+            results['html_available'] and not results['content_skipped']
         )
         
         results['final_risk_prob'] = final_risk_prob
@@ -317,6 +516,7 @@ class RuleBasedFusionPredictor:
             results['message'] = f" WARNING: {results['final_risk_pct']:.1f}% risk detected"
         else:  # VERY SUSPICIOUS
             results['message'] = f" BLOCKED: {results['final_risk_pct']:.1f}% phishing confidence"
+        timings['fusion'] = int((clock() - t0) * 1e6)
 
         # ========================================================
         # Print Final Summary
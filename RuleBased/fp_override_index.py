@@ -0,0 +1,199 @@
+#fp_override_index.py
+from urllib.parse import urlparse
+import tldextract
+
+# Override scopes
+SCOPE_URL = 'url'          # exactly this URL (scheme, host, port and path; query / trailing slash ignored)
+SCOPE_PREFIX = 'prefix'    # this host and every path under the given path
+SCOPE_DOMAIN = 'domain'    # the whole registered domain, including all subdomains
+OVERRIDE_SCOPES = (SCOPE_URL, SCOPE_PREFIX, SCOPE_DOMAIN)
+
+# Private suffixes (github.io, herokuapp.com) count as public ones here: a domain
+# override for foo.github.io must not cover every other GitHub Pages site
+_extract_domain = tldextract.TLDExtract(include_psl_private_domains=True)
+
+
+def normalize_url(url):
+    """ Normalize URL to handle variations (trailing slashes, params, case) """
+    try:
+        parsed = urlparse(url)
+        # Preserve scheme and netloc, normalize path
+        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        # Remove trailing slash and convert to lowercase for consistency
+        normalized = normalized.rstrip('/').lower()
+        return normalized
+    except Exception as e:
+        print(f"Error normalizing URL {url}: {e}")
+        return url.lower()  # Fallback to lowercase only
+
+
+def registered_domain(url):
+    """ Registered domain of url (example.co.uk for www.example.co.uk), or '' when
+        the host is a bare public suffix (co.uk, com, github.io) or not a domain """
+    ext = _extract_domain(url if '://' in url else '//' + url)
+    if not ext.domain:
+        return ''
+    return f"{ext.domain}.{ext.suffix}" if ext.suffix else ext.domain
+
+
+class _PathNode:
+    __slots__ = ('children', 'prefix')
+
+    def __init__(self):
+        self.children = {}
+        self.prefix = False
+
+
+class _HostNode:
+    __slots__ = ('children', 'domain', 'paths')
+
+    def __init__(self):
+        self.children = {}
+        self.domain = False
+        self.paths = None
+
+
+class FalsePositiveOverrideIndex:
+    """
+    Index of admin-verified false positives.
+
+    Prefix and domain rules are stored in a trie of reversed host labels
+    (com -> example -> www), and every host node can own a tree of path
+    segments. A lookup walks the host labels once and then the path
+    segments once, so its cost depends on the URL length only, not on how
+    many overrides exist. These rules ignore scheme, port, query string and
+    case; path prefixes match whole segments: /account covers
+    /account/login but not /accounts.
+
+    Exact URL overrides keep the previous behaviour: a set of normalize_url()
+    keys, so scheme and port still have to match (marking https://x/a does
+    not cover http://x/a or x:8080/a).
+    """
+
+    def __init__(self):
+        self.root = _HostNode()
+        self.urls = set()
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    @staticmethod
+    def split_url(url):
+        """ Split a URL (or bare domain) into (host labels, path segments).
+            A URL that can't be parsed (e.g. http://[::1) has no labels. """
+        url = (url or '').strip()
+        if '://' not in url:
+            url = '//' + url
+        try:
+            parsed = urlparse(url)
+        except ValueError:
+            return [], []
+        host = (parsed.hostname or '').rstrip('.')
+        labels = [label for label in host.split('.') if label]
+        segments = [seg for seg in parsed.path.lower().split('/') if seg]
+        return labels, segments
+
+    def _host_node(self, labels, create):
+        node = self.root
+        for label in reversed(labels):
+            child = node.children.get(label)
+            if child is None:
+                if not create:
+                    return None
+                child = node.children[label] = _HostNode()
+            node = child
+        return node
+
+    def add(self, url, scope=SCOPE_URL):
+        """
+        Register an override for url with the given scope. Returns False if it
+        was already registered or can't be, e.g. a domain override for a bare
+        public suffix, which would cover every site under it:
+
+        >>> index = FalsePositiveOverrideIndex()
+        >>> index.add('https://co.uk/x', SCOPE_DOMAIN), index.add('com', SCOPE_DOMAIN), index.add('github.io', SCOPE_DOMAIN)
+        (False, False, False)
+        >>> index.match('https://evil.co.uk/a'), index.match('https://evil.com/a'), len(index)
+        (None, None, 0)
+        >>> index.add('https://www.example.co.uk/x', SCOPE_DOMAIN), index.add('example.co.uk', SCOPE_DOMAIN)
+        (True, False)
+        >>> index.match('https://login.example.co.uk/a'), len(index)
+        ('domain', 1)
+        """
+        if scope not in OVERRIDE_SCOPES:
+            raise ValueError(f"Unknown override scope: {scope}")
+
+        if scope == SCOPE_URL:
+            key = normalize_url(url)
+            if key in self.urls:
+                return False
+            self.urls.add(key)
+            self.size += 1
+            return True
+
+        if scope == SCOPE_DOMAIN:
+            labels, _ = self.split_url(registered_domain(url))
+            if not labels:
+                return False
+            node = self._host_node(labels, create=True)
+            if node.domain:
+                return False
+            node.domain = True
+            self.size += 1
+            return True
+
+        labels, segments = self.split_url(url)
+        if not labels:
+            return False
+        host = self._host_node(labels, create=True)
+        if host.paths is None:
+            host.paths = _PathNode()
+        node = host.paths
+        for seg in segments:
+            child = node.children.get(seg)
+            if child is None:
+                child = node.children[seg] = _PathNode()
+            node = child
+        if node.prefix:
+            return False
+        node.prefix = True
+        self.size += 1
+        return True
+
+    def _match_rule(self, url):
+        """ Scope of the prefix / domain rule covering url, or None """
+        labels, segments = self.split_url(url)
+        if not labels:
+            return None
+
+        # Walk host labels from the TLD down; a domain rule covers everything below it
+        node = self.root
+        for label in reversed(labels):
+            node = node.children.get(label)
+            if node is None:
+                return None
+            if node.domain:
+                return SCOPE_DOMAIN
+
+        # Exact host reached - walk the path tree
+        path_node = node.paths
+        if path_node is None:
+            return None
+        for seg in segments:
+            if path_node.prefix:
+                return SCOPE_PREFIX
+            path_node = path_node.children.get(seg)
+            if path_node is None:
+                return None
+        return SCOPE_PREFIX if path_node.prefix else None
+
+    def match(self, url):
+        """ Return the scope of the override covering url, or None """
+        scope = self._match_rule(url)
+        if scope is None and self.urls and normalize_url(url) in self.urls:
+            scope = SCOPE_URL
+        return scope
+
+    def __contains__(self, url):
+        return self.match(url) is not None
@@ -0,0 +1,147 @@
+#bench_content_model.py
+"""
+Content model inference: the pickled RandomForestClassifier vs. the flattened
+FlatForest evaluator (RuleBased/flat_forest.py) the predictor uses.
+
+Reports parity (max abs probability difference), single-row and batch latency,
+in-memory size and load time of both. Exits with status 1 if parity fails.
+
+Input rows are content features extracted from the captured and synthetic pages,
+or sampled from a dataset CSV with --dataset (e.g. datasets/dataset_2023/Dataset2023.csv).
+
+Usage:
+    python benchmarks/bench_content_model.py
+    python benchmarks/bench_content_model.py --dataset datasets/dataset_2023/Dataset2023.csv --rows 5000
+"""
+import os
+import sys
+import json
+import time
+import pickle
+import argparse
+import tempfile
+import joblib
+import numpy as np
+import pandas as pd
+
+base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(base_dir)
+
+from RuleBased.flat_forest import FlatForest
+from feature_extraction.content_2023.feature_extract_2023 import ContentFeatureExtractor
+from benchmarks.benchmark_suite import load_pages, measure, summarize, RESULTS_DIR
+
+DEFAULT_MODEL_DIR = os.path.join(base_dir, 'models', 'model_2023')
+
+
+def load_rows(features, dataset, n_rows, seed):
+    """ float32 feature matrix to score """
+    if dataset:
+        df = pd.read_csv(dataset, usecols=lambda c: c in set(features))
+        df = df.sample(n=min(n_rows, len(df)), random_state=seed)
+        return df.reindex(columns=features, fill_value=0).to_numpy(dtype=np.float32)
+
+    # Features of the stored / synthetic pages, jittered to get n_rows distinct rows
+    extractor = ContentFeatureExtractor()
+    base = [extractor.extract_from_html(html, url)
+            for name, pages in load_pages().items() if name != 'synthetic_huge' for url, html in pages]
+    base = pd.DataFrame(base).reindex(columns=features, fill_value=0).to_numpy(dtype=np.float32)
+    rng = np.random.default_rng(seed)
+    rows = base[rng.integers(0, len(base), n_rows)]
+    return (rows * rng.uniform(0.5, 1.5, rows.shape)).round().astype(np.float32)
+
+
+def timed_load(func):
+    t0 = time.perf_counter()
+    result = func()
+    return result, round((time.perf_counter() - t0) * 1e3, 2)
+
+
+def run(model, flat, features, X, batch_sizes, min_time, tolerance):
+    expected = model.predict_proba(pd.DataFrame(X, columns=features))[:, 1]
+    got = flat.predict_proba(X)[:, 1]
+    single = np.array([flat.predict_proba(X[i:i + 1])[0, 1] for i in range(min(len(X), 500))])
+    parity = {
+        'rows': len(X),
+        'max_abs_diff_batch': float(np.max(np.abs(got - expected))),
+        'max_abs_diff_single': float(np.max(np.abs(single - expected[:len(single)]))),
+        'decision_mismatches': int(np.sum((got > 0.5) != (expected > 0.5))),
+        'tolerance': tolerance,
+    }
+    parity['passed'] = (parity['max_abs_diff_batch'] <= tolerance and parity['max_abs_diff_single'] <= tolerance
+                        and parity['decision_mismatches'] == 0)
+    print(f" Parity: max |diff| {parity['max_abs_diff_batch']:.2e}, decision mismatches "
+          f"{parity['decision_mismatches']} -> {'OK' if parity['passed'] else 'FAILED'}")
+
+    report = {'parity': parity, 'latency': {}}
+    print(f"\n {'batch':>6} {'sklearn p50 ms':>15} {'flat p50 ms':>12} {'speedup':>8}")
+    print("-" * 50)
+    for batch_size in batch_sizes:
+        batches = [X[i:i + batch_size] for i in range(0, len(X) - batch_size + 1, batch_size)][:200] or [X]
+        frames = [pd.DataFrame(b, columns=features) for b in batches]
+        sk = summarize(measure(model.predict_proba, frames, min_time), items_per_call=batch_size)
+        fl = summarize(measure(flat.predict_proba, batches, min_time), items_per_call=batch_size)
+        speedup = sk['p50_ms'] / fl['p50_ms'] if fl['p50_ms'] else None
+        report['latency'][f'batch_{batch_size}'] = {'sklearn': sk, 'flat': fl,
+                                                    'p50_speedup': round(speedup, 2) if speedup else None}
+        print(f" {batch_size:>6} {sk['p50_ms']:>15.3f} {fl['p50_ms']:>12.3f} {speedup or 0:>7.1f}x")
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the pickled RandomForest with the flattened evaluator")
+    parser.add_argument('--model-dir', default=DEFAULT_MODEL_DIR)
+    parser.add_argument('--dataset', default=None)
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--batch-sizes', default='1,32,256',
+                        type=lambda s: [int(x) for x in s.split(',') if x.strip()])
+    parser.add_argument('--min-time', type=float, default=2.0)
+    parser.add_argument('--tolerance', type=float, default=1e-9)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=None)
+    args = parser.parse_args(argv)
+
+    print("\n" + "=" * 70)
+    print("  CONTENT MODEL: SKLEARN vs FLATTENED FOREST")
+    print("=" * 70)
+
+    model_path = os.path.join(args.model_dir, 'model_2023.pkl')
+    model, sklearn_load_ms = timed_load(lambda: joblib.load(model_path))
+    features = list(joblib.load(os.path.join(args.model_dir, 'features_2023.pkl')))
+    flat = FlatForest.from_sklearn(model)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        flat_path = os.path.join(tmp, 'model_2023_flat.npz')
+        flat.save(flat_path)
+        flat_file_mb = os.path.getsize(flat_path) / 1024 / 1024
+        _, flat_load_ms = timed_load(lambda: FlatForest.load(flat_path))
+
+    size = {
+        'trees': flat.n_trees,
+        'nodes': flat.n_nodes,
+        'sklearn_pickle_mb': round(len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)) / 1024 / 1024, 2),
+        'sklearn_file_mb': round(os.path.getsize(model_path) / 1024 / 1024, 2),
+        'flat_arrays_mb': round(flat.nbytes / 1024 / 1024, 2),
+        'flat_file_mb': round(flat_file_mb, 2),
+        'sklearn_load_ms': sklearn_load_ms,
+        'flat_load_ms': flat_load_ms,
+    }
+    print(f" {size['trees']} trees, {size['nodes']} nodes | size: sklearn {size['sklearn_pickle_mb']} MB, "
+          f"flat {size['flat_arrays_mb']} MB | load: sklearn {sklearn_load_ms} ms, flat {flat_load_ms} ms")
+
+    X = load_rows(features, args.dataset, args.rows, args.seed)
+    report = run(model, flat, features, X, args.batch_sizes, args.min_time, args.tolerance)
+    report['size'] = size
+    report['config'] = vars(args)
+    report['timestamp'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+
+    output = args.output or os.path.join(RESULTS_DIR, f"content_model_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n Results saved: {output}")
+    return 0 if report['parity']['passed'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#bench_url_model.py
+"""
+URL model inference: XGBClassifier.predict_proba on a DataFrame (the previous
+path) vs. the booster's inplace_predict on a float32 array (what the predictor
+uses now).
+
+Checks that both give the same probabilities (max abs difference <= --tolerance)
+on the replay corpus, then measures single-row and batch latency of both.
+Exits with status 1 if parity fails.
+
+Usage:
+    python benchmarks/bench_url_model.py
+    python benchmarks/bench_url_model.py --batch-sizes 1,32,256,1024 --min-time 2
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import numpy as np
+import pandas as pd
+
+base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(base_dir)
+
+from benchmarks.benchmark_suite import load_urls, measure, summarize, quiet, RESULTS_DIR
+
+
+def wrapper_probabilities(predictor, feature_dicts):
+    """ The previous inference path: DataFrame -> reindex -> predict_proba """
+    df = pd.DataFrame(feature_dicts).reindex(columns=predictor.feats_2025, fill_value=0)
+    return predictor.model_2025.predict_proba(df)[:, 1]
+
+
+def native_probabilities(predictor, feature_dicts):
+    return predictor.url_probabilities(predictor.url_matrix(feature_dicts))
+
+
+def check_parity(predictor, feature_dicts, tolerance):
+    expected = wrapper_probabilities(predictor, feature_dicts)
+    single = np.array([native_probabilities(predictor, [feats])[0] for feats in feature_dicts])
+    batch = native_probabilities(predictor, feature_dicts)
+    result = {
+        'rows': len(feature_dicts),
+        'max_abs_diff_single': float(np.max(np.abs(single - expected))) if len(expected) else 0.0,
+        'max_abs_diff_batch': float(np.max(np.abs(batch - expected))) if len(expected) else 0.0,
+        'decision_mismatches': int(np.sum((batch > 0.5) != (expected > 0.5))),
+        'tolerance': tolerance,
+    }
+    result['passed'] = (result['max_abs_diff_single'] <= tolerance and result['max_abs_diff_batch'] <= tolerance
+                        and result['decision_mismatches'] == 0)
+    return result
+
+
+def run(predictor, urls, batch_sizes, min_time, tolerance):
+    if predictor.booster_2025 is None:
+        raise SystemExit("URL model has no XGBoost booster - nothing to compare")
+
+    feature_dicts = [predictor.extractor_2025.extract(url) for url in urls]
+    report = {'parity': check_parity(predictor, feature_dicts, tolerance), 'latency': {}}
+    print(f" Parity: max |diff| single {report['parity']['max_abs_diff_single']:.2e}, "
+          f"batch {report['parity']['max_abs_diff_batch']:.2e}, "
+          f"decision mismatches {report['parity']['decision_mismatches']} "
+          f"-> {'OK' if report['parity']['passed'] else 'FAILED'}")
+
+    print(f"\n {'batch':>6} {'wrapper p50 ms':>15} {'native p50 ms':>14} {'speedup':>8}")
+    print("-" * 50)
+    for batch_size in batch_sizes:
+        batches = [feature_dicts[i:i + batch_size] for i in range(0, len(feature_dicts), batch_size)]
+        batches = [b for b in batches if len(b) == batch_size] or [
+            (feature_dicts * (batch_size // len(feature_dicts) + 1))[:batch_size]]
+        wrapper = summarize(measure(lambda b: wrapper_probabilities(predictor, b), batches, min_time),
+                            items_per_call=batch_size)
+        native = summarize(measure(lambda b: native_probabilities(predictor, b), batches, min_time),
+                           items_per_call=batch_size)
+        speedup = wrapper['p50_ms'] / native['p50_ms'] if native['p50_ms'] else None
+        report['latency'][f'batch_{batch_size}'] = {'wrapper': wrapper, 'native': native,
+                                                    'p50_speedup': round(speedup, 2) if speedup else None}
+        print(f" {batch_size:>6} {wrapper['p50_ms']:>15.3f} {native['p50_ms']:>14.3f} {speedup or 0:>7.1f}x")
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare wrapper and native booster inference for the URL model")
+    parser.add_argument('--batch-sizes', default='1,32,256,1024',
+                        type=lambda s: [int(x) for x in s.split(',') if x.strip()])
+    parser.add_argument('--url-limit', type=int, default=1000)
+    parser.add_argument('--min-time', type=float, default=2.0)
+    parser.add_argument('--tolerance', type=float, default=1e-6)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=None)
+    args = parser.parse_args(argv)
+
+    from RuleBased.Ensemble_Rulebased import RuleBasedFusionPredictor
+    with quiet():
+        predictor = RuleBasedFusionPredictor()
+
+    print("\n" + "=" * 70)
+    print("  URL MODEL: WRAPPER vs NATIVE BOOSTER")
+    print("=" * 70)
+    report = run(predictor, load_urls(args.url_limit, args.seed), args.batch_sizes, args.min_time, args.tolerance)
+    report['config'] = vars(args)
+    report['timestamp'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+
+    output = args.output or os.path.join(RESULTS_DIR, f"url_model_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n Results saved: {output}")
+    return 0 if report['parity']['passed'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
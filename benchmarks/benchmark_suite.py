@@ -0,0 +1,386 @@
+#benchmark_suite.py
+"""
+Reproducible performance benchmarks for the phishing detection pipeline.
+
+Sections:
+    url        URLFeatureExtractor.extract                     (URLs / s)
+    content    ContentFeatureExtractor.extract_from_html       (pages / s, archived + synthetic pages)
+    predictor  RuleBasedFusionPredictor.predict                (per-call latency, URL only and with HTML)
+    api        POST /predict on a running server               (throughput, p50 / p99 per concurrency)
+
+Results are written as JSON (benchmarks/results/bench_<timestamp>.json by default).
+Pass --compare <old.json> to flag throughput regressions against an earlier run.
+
+Usage:
+    python benchmarks/benchmark_suite.py
+    python benchmarks/benchmark_suite.py --sections url,content --min-time 5
+    python benchmarks/benchmark_suite.py --sections api --api-url http://127.0.0.1:5000 --concurrency 1,8,32
+    python benchmarks/benchmark_suite.py --compare benchmarks/results/bench_old.json
+"""
+import os
+import sys
+import io
+import csv
+import json
+import time
+import random
+import threading
+import argparse
+import platform
+import subprocess
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(base_dir)
+
+from feature_extraction.url_2024.Feature_Extractor import URLFeatureExtractor
+from feature_extraction.content_2023.feature_extract_2023 import ContentFeatureExtractor
+from log_store.detection_log import DetectionLog
+from log_store.html_archive import HtmlArchive
+
+HTML_LOGS_DIR = os.path.join(base_dir, 'HTML_logs')
+URL_LIST_FILE = os.path.join(base_dir, 'datasets', 'augmented', 'augmented_urls_2025.txt')
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# Always part of the URL corpus, so small checkouts still have something to measure
+FALLBACK_URLS = [
+    "https://www.britannica.com/biography/Che-Guevara",
+    "https://docs.google.com/document/d/1A9f8KJ9P2wQxU4Y/edit",
+    "https://g00gle-verify.tk",
+    "https://paypa1-secure.com",
+    "https://faceboook-login.xyz",
+    "https://xzqkrptl.tk",
+    "http://secure-update.account-verify.example.ml/login.php?session=8f3a2b&redirect=bank",
+    "https://github.com/pallets/flask/blob/main/src/flask/app.py",
+]
+
+
+# ============================================================
+# Corpus
+# ============================================================
+def load_urls(limit, seed):
+    """ URLs from the augmentation list and the detection log, deduplicated, deterministic order """
+    urls = list(FALLBACK_URLS)
+    if os.path.exists(URL_LIST_FILE):
+        with open(URL_LIST_FILE, 'r', encoding='utf-8', errors='replace') as f:
+            urls.extend(line.strip() for line in f if line.strip().startswith('http'))
+
+    detections_dir = os.path.join(HTML_LOGS_DIR, 'detections')
+    if os.path.isdir(detections_dir):
+        urls.extend(row['url'] for row in DetectionLog(detections_dir).rows() if row.get('url'))
+    legacy_log = os.path.join(HTML_LOGS_DIR, 'Malicious_log.csv')
+    if os.path.exists(legacy_log):
+        with open(legacy_log, 'r', encoding='utf-8') as f:
+            urls.extend(row['url'] for row in csv.DictReader(f) if row.get('url'))
+
+    urls = sorted(set(urls))
+    random.Random(seed).shuffle(urls)
+    return urls[:limit]
+
+
+def synthetic_page(target_bytes, seed):
+    """ Deterministic page with the elements ContentFeatureExtractor looks at (forms, links, scripts, ...) """
+    rng = random.Random(seed)
+    head = ('<!DOCTYPE html><html><head><title>Secure Account Login - Verify your bank details</title>'
+            '<meta name="viewport" content="width=device-width, initial-scale=1">'
+            '<meta name="description" content="Sign in to your account">'
+            '<meta name="robots" content="noindex"><link rel="icon" href="/favicon.ico">'
+            '<link rel="stylesheet" href="/static/site.css"><script src="/static/app.js"></script></head><body>\n')
+    blocks = [
+        '<form action="https://collect.example.net/submit" method="post"><input type="hidden" name="sid" value="{n}">'
+        '<input type="password" name="pw"><button type="submit">Sign in</button></form>\n',
+        '<p>Pay with crypto or bank transfer. Reference {n} for your account verification.</p>\n',
+        '<a href="/account/{n}">Account</a> <a href="https://facebook.com/page{n}">Facebook</a> <a href="#">Help</a>\n',
+        '<img src="/img/{n}.png"><iframe src="https://ads.example.com/{n}"></iframe>\n',
+        '<script>window.open("https://popup.example.com/{n}");</script>\n',
+        '<div class="row"><span>Lorem ipsum dolor sit amet {n}</span></div>\n',
+    ]
+    parts = [head]
+    size = len(head)
+    while size < target_bytes:
+        block = rng.choice(blocks).format(n=rng.randint(0, 10 ** 6))
+        parts.append(block)
+        size += len(block)
+    parts.append('<footer>&copy; 2024 Example Bank</footer></body></html>')
+    return ''.join(parts)
+
+
+def load_pages():
+    """ {name: [(url, html), ...]} - archived captures plus synthetic small / medium / huge pages """
+    pages = {}
+    archived = []
+    archive_dir = os.path.join(HTML_LOGS_DIR, 'html_logs')
+    if os.path.isdir(archive_dir):
+        # Read-only: legacy <uuid>.html files are read in place, not migrated
+        for name in sorted(os.listdir(archive_dir)):
+            if name.endswith('.html'):
+                with open(os.path.join(archive_dir, name), 'r', encoding='utf-8', errors='replace') as f:
+                    archived.append(('https://captured.example.com/', f.read()))
+        archive = HtmlArchive(archive_dir)
+        archived.extend(('https://captured.example.com/', html) for _, html in archive.iter_pages())
+    if archived:
+        pages['archived'] = archived
+
+    pages['synthetic_small'] = [('https://login.example.com/', synthetic_page(2 * 1024, seed)) for seed in range(20)]
+    pages['synthetic_medium'] = [('https://login.example.com/', synthetic_page(100 * 1024, seed)) for seed in range(5)]
+    pages['synthetic_huge'] = [('https://login.example.com/', synthetic_page(5 * 1024 * 1024, 0))]
+    return pages
+
+
+# ============================================================
+# Measurement
+# ============================================================
+class _NullWriter(io.TextIOBase):
+    def write(self, s):
+        return len(s)
+
+
+def quiet():
+    """ Silence the pipeline's progress prints (they are still formatted, as in production) """
+    return contextlib.redirect_stdout(_NullWriter())
+
+
+def summarize(latencies, items_per_call=1, total_time=None):
+    latencies = np.asarray(latencies, dtype=np.float64)
+    total_time = float(latencies.sum()) if total_time is None else total_time
+    return {
+        'calls': int(latencies.size),
+        'throughput_per_s': round(latencies.size * items_per_call / total_time, 2) if total_time else None,
+        'mean_ms': round(float(latencies.mean()) * 1e3, 4),
+        'p50_ms': round(float(np.percentile(latencies, 50)) * 1e3, 4),
+        'p90_ms': round(float(np.percentile(latencies, 90)) * 1e3, 4),
+        'p99_ms': round(float(np.percentile(latencies, 99)) * 1e3, 4),
+        'min_ms': round(float(latencies.min()) * 1e3, 4),
+        'max_ms': round(float(latencies.max()) * 1e3, 4),
+    }
+
+
+def measure(func, items, min_time, warmup=1):
+    """ Call func(item) over items (cycling) until min_time seconds have passed; at least one full pass """
+    for item in items[:warmup]:
+        func(item)
+    latencies = []
+    clock = time.perf_counter
+    started = clock()
+    i = 0
+    while i < len(items) or clock() - started < min_time:
+        item = items[i % len(items)]
+        t0 = clock()
+        func(item)
+        latencies.append(clock() - t0)
+        i += 1
+    return latencies
+
+
+# ============================================================
+# Sections
+# ============================================================
+def bench_url_extractor(args):
+    urls = load_urls(args.url_limit, args.seed)
+    extractor = URLFeatureExtractor()
+    latencies = measure(extractor.extract, urls, args.min_time)
+    result = summarize(latencies)
+    result['corpus_size'] = len(urls)
+    print(f" URL extraction: {result['throughput_per_s']:.0f} URLs/s (p99 {result['p99_ms']:.2f} ms, {len(urls)} URLs)")
+    return result
+
+
+def bench_content_extractor(args):
+    extractor = ContentFeatureExtractor()
+    results = {}
+    for name, pages in load_pages().items():
+        # No warmup call for single-page sets: a huge page can take tens of seconds
+        latencies = measure(lambda page: extractor.extract_from_html(page[1], page[0]), pages, args.min_time,
+                            warmup=1 if len(pages) > 1 else 0)
+        result = summarize(latencies)
+        result['pages'] = len(pages)
+        result['mean_page_kb'] = round(sum(len(html) for _, html in pages) / len(pages) / 1024, 1)
+        results[name] = result
+        print(f" Content extraction [{name}]: {result['throughput_per_s']:.1f} pages/s "
+              f"(p99 {result['p99_ms']:.1f} ms, {result['mean_page_kb']} KB/page)")
+    return results
+
+
+def bench_predictor(args):
+    from RuleBased.Ensemble_Rulebased import RuleBasedFusionPredictor
+    with quiet():
+        predictor = RuleBasedFusionPredictor()
+
+    urls = load_urls(args.url_limit, args.seed)
+    page = synthetic_page(50 * 1024, args.seed)
+    results = {}
+
+    with quiet():
+        results['single_url_only'] = summarize(measure(predictor.predict, urls, args.min_time))
+        results['single_with_html'] = summarize(
+            measure(lambda url: predictor.predict(url, page), urls, args.min_time))
+
+    for name, result in results.items():
+        print(f" Predictor [{name}]: {result['throughput_per_s']:.1f}/s (p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms)")
+    return results
+
+
+def bench_api(args):
+    import requests
+
+    endpoint = args.api_url.rstrip('/')
+    requests.get(f"{endpoint}/health", timeout=5).raise_for_status()
+
+    urls = load_urls(args.url_limit, args.seed)
+    pages = [html for name, page_list in load_pages().items() if name != 'synthetic_huge' for _, html in page_list]
+    rng = random.Random(args.seed)
+    # Same mix as the extension: URL-only first calls, and calls with the captured page
+    payloads = [{'url': url, 'html_content': rng.choice(pages), 'html_captured': True}
+                if rng.random() < args.html_ratio else {'url': url}
+                for url in urls]
+
+    results = {}
+    for concurrency in args.concurrency:
+        total = max(args.api_requests, concurrency)
+        local = threading.local()
+
+        def call(i):
+            session = getattr(local, 'session', None)
+            if session is None:
+                session = local.session = requests.Session()
+            t0 = time.perf_counter()
+            try:
+                ok = session.post(f"{endpoint}/predict", json=payloads[i % len(payloads)], timeout=60).status_code == 200
+            except requests.RequestException:
+                ok = False
+            return time.perf_counter() - t0, ok
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            outcomes = list(pool.map(call, range(total)))
+        elapsed = time.perf_counter() - started
+
+        result = summarize([latency for latency, _ in outcomes], total_time=elapsed)
+        result['concurrency'] = concurrency
+        result['errors'] = sum(1 for _, ok in outcomes if not ok)
+        results[f"concurrency_{concurrency}"] = result
+        print(f" API [c={concurrency}]: {result['throughput_per_s']:.1f} req/s "
+              f"(p50 {result['p50_ms']:.1f} ms, p99 {result['p99_ms']:.1f} ms, errors {result['errors']})")
+    return results
+
+
+SECTIONS = {
+    'url': bench_url_extractor,
+    'content': bench_content_extractor,
+    'predictor': bench_predictor,
+    'api': bench_api,
+}
+
+
+# ============================================================
+# Reporting
+# ============================================================
+def environment_info():
+    info = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+    try:
+        info['git_commit'] = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=base_dir, capture_output=True,
+                                            text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        info['git_commit'] = None
+    for package in ('numpy', 'pandas', 'sklearn', 'xgboost', 'bs4', 'tldextract'):
+        try:
+            info[f'{package}_version'] = __import__(package).__version__
+        except Exception:
+            info[f'{package}_version'] = None
+    return info
+
+
+def _throughputs(results, prefix=''):
+    """ Flatten {section: {...: {'throughput_per_s': x}}} into {'section.name': x} """
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            if 'throughput_per_s' in value:
+                flat[prefix + key] = value['throughput_per_s']
+            else:
+                flat.update(_throughputs(value, prefix + key + '.'))
+    return flat
+
+
+def compare(current, baseline_path, tolerance):
+    """ Print throughput changes against a previous run; return the regressed metrics """
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    old = _throughputs(baseline.get('results', {}))
+    new = _throughputs(current.get('results', {}))
+
+    print(f"\n Comparison with {os.path.basename(baseline_path)} (tolerance {tolerance:.0%})")
+    print("-" * 70)
+    regressions = []
+    for name in sorted(set(old) & set(new)):
+        if not old[name] or new[name] is None:
+            continue
+        change = new[name] / old[name] - 1
+        flag = ''
+        if change < -tolerance:
+            flag = '  <-- REGRESSION'
+            regressions.append(name)
+        print(f" {name:<45} {old[name]:>10.1f} -> {new[name]:>10.1f} ({change:+.1%}){flag}")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark extractors, predictor and API")
+    parser.add_argument('--sections', default='url,content,predictor,api',
+                        help="Comma separated subset of: " + ', '.join(SECTIONS))
+    parser.add_argument('--min-time', type=float, default=3.0, help="Minimum seconds per measurement")
+    parser.add_argument('--url-limit', type=int, default=1000, help="Maximum URLs in the corpus")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--api-url', default='http://127.0.0.1:5000')
+    parser.add_argument('--api-requests', type=int, default=200, help="Requests per concurrency level")
+    parser.add_argument('--concurrency', default='1,4,16',
+                        type=lambda s: [int(x) for x in s.split(',') if x.strip()])
+    parser.add_argument('--html-ratio', type=float, default=0.5, help="Share of API requests carrying HTML")
+    parser.add_argument('--output', default=None, help="Result JSON path")
+    parser.add_argument('--compare', default=None, help="Previous result JSON to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.15, help="Allowed throughput drop before flagging")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sections = [s.strip() for s in args.sections.split(',') if s.strip()]
+    unknown = [s for s in sections if s not in SECTIONS]
+    if unknown:
+        raise SystemExit(f"Unknown sections: {', '.join(unknown)}")
+
+    print("\n" + "=" * 70)
+    print("  BENCHMARK SUITE")
+    print("=" * 70)
+
+    report = {'environment': environment_info(), 'config': vars(args), 'results': {}, 'skipped': {}}
+    for section in sections:
+        print(f"\n [{section}]")
+        try:
+            report['results'][section] = SECTIONS[section](args)
+        except Exception as e:
+            # e.g. models not trained yet, or no server running for the api section
+            report['skipped'][section] = f"{type(e).__name__}: {e}"
+            print(f" Skipped: {report['skipped'][section]}")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"bench_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n Results saved: {output}")
+
+    if args.compare:
+        if compare(report, args.compare, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,449 @@
+#load_generator.py
+"""
+Load generator that replays logged traffic against a running /predict API.
+
+Every simulated page visit follows the browser extension (Extension/background.js):
+    1. URL-only call   {"url": ..., "html_content": null, "html_captured": false}
+    2. if that call did not already block the page (final_risk_pct > 60 or
+       VERY SUSPICIOUS), wait --phase-delay seconds (1.5 s in the extension)
+       and send the same URL again with the captured HTML
+
+URLs are replayed from the detection log, the dataset CSVs and the augmented
+URL list; HTML comes from the captured page archive (synthetic pages if the
+archive is empty).
+
+Modes:
+    open    visits arrive as a Poisson process at each rate in --rates (visits / s),
+            regardless of how fast the server answers; response times are measured
+            from the scheduled send time, so queueing on our side is not hidden
+    closed  --concurrency virtual users, each doing visits back to back
+
+Each level runs for --duration seconds. The report (stdout + JSON) contains the
+throughput / latency curve and the saturation point.
+
+Usage:
+    python benchmarks/load_generator.py --mode open --rates 5,10,20,40,80
+    python benchmarks/load_generator.py --mode closed --concurrency 1,2,4,8,16,32 --duration 20
+"""
+import os
+import sys
+import csv
+import glob
+import json
+import time
+import heapq
+import itertools
+import random
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import requests
+
+base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(base_dir)
+
+from log_store.detection_log import DetectionLog
+from log_store.html_archive import HtmlArchive
+from benchmarks.benchmark_suite import synthetic_page
+
+HTML_LOGS_DIR = os.path.join(base_dir, 'HTML_logs')
+DATASETS_DIR = os.path.join(base_dir, 'datasets')
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# Same rule as the extension for skipping the content check
+BLOCK_RISK_PCT = 60
+BLOCK_RISK_LEVEL = 'VERY SUSPICIOUS'
+
+
+# ============================================================
+# Replay corpus
+# ============================================================
+class _Reservoir:
+    """ Uniform sample of at most size items from a stream of unknown length """
+
+    def __init__(self, size, rng):
+        self.size = size
+        self.rng = rng
+        self.items = []
+        self.seen = 0
+
+    def add(self, item):
+        self.seen += 1
+        if len(self.items) < self.size:
+            self.items.append(item)
+        else:
+            j = self.rng.randrange(self.seen)
+            if j < self.size:
+                self.items[j] = item
+
+
+def _csv_urls(path):
+    csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+    with open(path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None) or []
+        lowered = [h.strip().lower() for h in header]
+        if 'url' not in lowered:
+            return
+        col = lowered.index('url')
+        for row in reader:
+            if len(row) > col and row[col].strip():
+                yield row[col].strip()
+
+
+def load_replay_urls(max_urls, seed):
+    """ Sample URLs from every traffic source; returns (urls, {source: urls seen}) """
+    rng = random.Random(seed)
+    reservoir = _Reservoir(max_urls, rng)
+    sources = {}
+
+    def feed(name, urls):
+        before = reservoir.seen
+        for url in urls:
+            if url.startswith('http'):
+                reservoir.add(url)
+        sources[name] = sources.get(name, 0) + reservoir.seen - before
+
+    detections_dir = os.path.join(HTML_LOGS_DIR, 'detections')
+    if os.path.isdir(detections_dir):
+        feed('detection_log', (row.get('url', '') for row in DetectionLog(detections_dir).rows()))
+    legacy_log = os.path.join(HTML_LOGS_DIR, 'Malicious_log.csv')
+    if os.path.exists(legacy_log):
+        feed('detection_log', _csv_urls(legacy_log))
+
+    for path in sorted(glob.glob(os.path.join(DATASETS_DIR, '**', '*.csv'), recursive=True)):
+        feed(os.path.relpath(path, base_dir), _csv_urls(path))
+
+    for path in sorted(glob.glob(os.path.join(DATASETS_DIR, '**', '*.txt'), recursive=True)):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            feed(os.path.relpath(path, base_dir), (line.strip() for line in f))
+
+    urls = reservoir.items
+    rng.shuffle(urls)
+    return urls, sources
+
+
+def load_replay_pages(limit, seed):
+    """ Captured pages from the HTML archive (read only), or synthetic pages if there are none """
+    pages = []
+    archive_dir = os.path.join(HTML_LOGS_DIR, 'html_logs')
+    if os.path.isdir(archive_dir):
+        for name in sorted(os.listdir(archive_dir)):
+            if name.endswith('.html') and len(pages) < limit:
+                with open(os.path.join(archive_dir, name), 'r', encoding='utf-8', errors='replace') as f:
+                    pages.append(f.read())
+        for _, html in HtmlArchive(archive_dir).iter_pages():
+            if len(pages) >= limit:
+                break
+            pages.append(html)
+
+    # Pages under 100 characters are treated as "no HTML" by the predictor
+    pages = [html for html in pages if len(html) > 100]
+    if not pages:
+        pages = [synthetic_page(size, seed + i) for i, size in enumerate((4096, 16384, 65536, 131072))]
+    return pages
+
+
+# ============================================================
+# Traffic
+# ============================================================
+class Recorder:
+    """ Collects (phase, intended_start, sent, finished, ok) samples; list.append is thread-safe """
+
+    def __init__(self):
+        self.samples = []
+
+    def add(self, phase, intended, sent, finished, ok):
+        self.samples.append((phase, intended, sent, finished, ok))
+
+
+class LoadGenerator:
+    def __init__(self, api_url, urls, pages, phase_delay=1.5, timeout=30.0, seed=42):
+        self.endpoint = api_url.rstrip('/') + '/predict'
+        self.urls = urls
+        self.pages = pages
+        self.phase_delay = phase_delay
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self._local = threading.local()
+        self._visit_lock = threading.Lock()
+        self._visit_index = 0
+
+    def _session(self):
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def next_visit(self):
+        with self._visit_lock:
+            url = self.urls[self._visit_index % len(self.urls)]
+            page = self.pages[self._visit_index % len(self.pages)]
+            self._visit_index += 1
+        return url, page
+
+    def send(self, phase, payload, intended, recorder):
+        """ POST one request; returns the decoded response (or None on failure) """
+        sent = time.perf_counter()
+        data = None
+        try:
+            response = self._session().post(self.endpoint, json=payload, timeout=self.timeout)
+            ok = response.status_code == 200
+            if ok:
+                data = response.json()
+        except (requests.RequestException, ValueError):
+            ok = False
+        recorder.add(phase, intended, sent, time.perf_counter(), ok)
+        return data
+
+    @staticmethod
+    def needs_content_check(data):
+        if data is None:
+            return False
+        return not (data.get('final_risk_pct', 0) > BLOCK_RISK_PCT or data.get('risk_level') == BLOCK_RISK_LEVEL)
+
+    def url_phase(self, url, intended, recorder):
+        return self.send('url_only', {'url': url, 'html_content': None, 'html_captured': False}, intended, recorder)
+
+    def html_phase(self, url, page, intended, recorder):
+        self.send('with_html', {'url': url, 'html_content': page, 'html_captured': True}, intended, recorder)
+
+    # ------------------------------------------------------------
+    # Open loop
+    # ------------------------------------------------------------
+    def run_open(self, rate, duration, max_inflight):
+        """ Poisson arrivals at rate visits / s for duration seconds """
+        recorder = Recorder()
+        pool = ThreadPoolExecutor(max_workers=max_inflight)
+        heap = []
+        cond = threading.Condition()
+        pending = [0]   # scheduled but not yet finished (arrivals + delayed content checks)
+        order = itertools.count()
+
+        def schedule(when, func, *args):
+            with cond:
+                heapq.heappush(heap, (when, next(order), func, args))
+                pending[0] += 1
+                cond.notify()
+
+        def done():
+            with cond:
+                pending[0] -= 1
+                cond.notify()
+
+        def visit(url, page, intended):
+            try:
+                data = self.url_phase(url, intended, recorder)
+                if self.needs_content_check(data):
+                    # The extension waits after the first answer, then sends the page
+                    schedule(time.perf_counter() + self.phase_delay, content, url, page)
+            finally:
+                done()
+
+        def content(url, page, intended):
+            try:
+                self.html_phase(url, page, intended, recorder)
+            finally:
+                done()
+
+        start = time.perf_counter()
+        t = start
+        while True:
+            t += self.rng.expovariate(rate)
+            if t >= start + duration:
+                break
+            url, page = self.next_visit()
+            schedule(t, visit, url, page)
+
+        # Dispatcher: hand each request to the pool at its scheduled time
+        with cond:
+            while pending[0] or heap:
+                if not heap:
+                    cond.wait()
+                    continue
+                when, _, func, args = heap[0]
+                delay = when - time.perf_counter()
+                if delay > 0:
+                    cond.wait(timeout=delay)
+                    continue
+                heapq.heappop(heap)
+                pool.submit(func, *args, when)
+        pool.shutdown(wait=True)
+        return recorder, start
+
+    # ------------------------------------------------------------
+    # Closed loop
+    # ------------------------------------------------------------
+    def run_closed(self, concurrency, duration, think_time=0.0):
+        """ concurrency virtual users doing visits back to back for duration seconds """
+        recorder = Recorder()
+        start = time.perf_counter()
+        deadline = start + duration
+
+        def user():
+            while time.perf_counter() < deadline:
+                url, page = self.next_visit()
+                data = self.url_phase(url, time.perf_counter(), recorder)
+                if self.needs_content_check(data):
+                    time.sleep(self.phase_delay)
+                    self.html_phase(url, page, time.perf_counter(), recorder)
+                if think_time:
+                    time.sleep(think_time)
+
+        threads = [threading.Thread(target=user, daemon=True) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return recorder, start
+
+
+# ============================================================
+# Reporting
+# ============================================================
+def _percentiles(values):
+    if not values:
+        return {'p50_ms': None, 'p90_ms': None, 'p99_ms': None}
+    values = np.asarray(values) * 1e3
+    return {f'p{q}_ms': round(float(np.percentile(values, q)), 2) for q in (50, 90, 99)}
+
+
+def summarize_level(recorder, start, duration):
+    samples = recorder.samples
+    # Requests still in flight at the end of the level are waited for, so they count too
+    elapsed = max(max((s[3] for s in samples), default=start) - start, duration)
+    ok = [s for s in samples if s[4]]
+
+    result = {
+        'requests': len(samples),
+        'errors': len(samples) - len(ok),
+        'error_rate': round((len(samples) - len(ok)) / len(samples), 4) if samples else 0.0,
+        'throughput_rps': round(len(ok) / elapsed, 2),
+        # Visits only start inside the level window; the tail is delayed content checks
+        'visits_per_s': round(len([s for s in ok if s[0] == 'url_only']) / duration, 2),
+    }
+    # Response time from the scheduled start (includes client-side queueing), and
+    # service time from the actual send
+    result.update(_percentiles([s[3] - s[1] for s in ok]))
+    result['service'] = _percentiles([s[3] - s[2] for s in ok])
+    for phase in ('url_only', 'with_html'):
+        phase_samples = [s for s in ok if s[0] == phase]
+        result[phase] = dict(_percentiles([s[3] - s[1] for s in phase_samples]), requests=len(phase_samples))
+    return result
+
+
+def find_saturation(curve, mode, slo_ms, max_error_rate=0.01):
+    """
+    open:   the highest rate that is still sustained - visits completed within 90% of
+            the offered rate, p99 within the SLO and errors under max_error_rate
+    closed: the concurrency after which adding users stops adding throughput
+            (< 10% gain) - more users only add queueing latency
+    """
+    if not curve:
+        return None
+
+    if mode == 'open':
+        sustained = None
+        for point in curve:
+            healthy = (point['visits_per_s'] >= 0.9 * point['level']
+                       and point['p99_ms'] is not None and point['p99_ms'] <= slo_ms
+                       and point['error_rate'] <= max_error_rate)
+            if not healthy:
+                break
+            sustained = point
+        return {
+            'max_sustained_rate': sustained['level'] if sustained else None,
+            'throughput_rps': sustained['throughput_rps'] if sustained else None,
+            'saturated': sustained is not curve[-1],
+        }
+
+    knee = curve[-1]
+    for previous, point in zip(curve, curve[1:]):
+        if point['throughput_rps'] < previous['throughput_rps'] * 1.10:
+            knee = previous
+            break
+    best = max(curve, key=lambda p: p['throughput_rps'])
+    return {
+        'saturation_concurrency': knee['level'],
+        'throughput_rps': knee['throughput_rps'],
+        'max_throughput_rps': best['throughput_rps'],
+        'saturated': knee is not curve[-1],
+    }
+
+
+def parse_args(argv=None):
+    int_list = lambda s: [int(x) for x in s.split(',') if x.strip()]
+    float_list = lambda s: [float(x) for x in s.split(',') if x.strip()]
+
+    parser = argparse.ArgumentParser(description="Replay logged traffic against /predict")
+    parser.add_argument('--api-url', default='http://127.0.0.1:5000')
+    parser.add_argument('--mode', choices=('open', 'closed'), default='open')
+    parser.add_argument('--rates', type=float_list, default=[2, 5, 10, 20, 40], help="Open loop: visits / s per level")
+    parser.add_argument('--concurrency', type=int_list, default=[1, 2, 4, 8, 16, 32], help="Closed loop: users per level")
+    parser.add_argument('--duration', type=float, default=30.0, help="Seconds per level")
+    parser.add_argument('--phase-delay', type=float, default=1.5, help="Delay before the HTML call (extension: 1.5 s)")
+    parser.add_argument('--think-time', type=float, default=0.0, help="Closed loop: pause between visits")
+    parser.add_argument('--max-inflight', type=int, default=256, help="Open loop: client threads")
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument('--slo-ms', type=float, default=1000.0, help="p99 response time considered healthy")
+    parser.add_argument('--max-urls', type=int, default=5000)
+    parser.add_argument('--max-pages', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=None, help="Result JSON path")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("\n" + "=" * 70)
+    print("  LOAD GENERATOR")
+    print("=" * 70)
+
+    requests.get(args.api_url.rstrip('/') + '/health', timeout=5).raise_for_status()
+
+    urls, sources = load_replay_urls(args.max_urls, args.seed)
+    pages = load_replay_pages(args.max_pages, args.seed)
+    if not urls:
+        raise SystemExit("No URLs found to replay")
+    print(f" Replaying {len(urls)} URLs ({', '.join(f'{k}: {v}' for k, v in sources.items())}), {len(pages)} pages")
+
+    generator = LoadGenerator(args.api_url, urls, pages, args.phase_delay, args.timeout, args.seed)
+    levels = args.rates if args.mode == 'open' else args.concurrency
+    unit = 'visits/s' if args.mode == 'open' else 'users'
+
+    curve = []
+    print(f"\n {unit:>10} {'req/s':>9} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    print("-" * 70)
+    for level in levels:
+        if args.mode == 'open':
+            recorder, start = generator.run_open(level, args.duration, args.max_inflight)
+        else:
+            recorder, start = generator.run_closed(level, args.duration, args.think_time)
+        point = summarize_level(recorder, start, args.duration)
+        point['level'] = level
+        curve.append(point)
+        print(f" {level:>10g} {point['throughput_rps']:>9.1f} {point['p50_ms'] or 0:>9.1f} "
+              f"{point['p90_ms'] or 0:>9.1f} {point['p99_ms'] or 0:>9.1f} {point['errors']:>7}")
+
+    saturation = find_saturation(curve, args.mode, args.slo_ms)
+    print("-" * 70)
+    print(f" Saturation: {json.dumps(saturation)}")
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'config': vars(args),
+        'sources': sources,
+        'curve': curve,
+        'saturation': saturation,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"load_{args.mode}_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f" Results saved: {output}")
+
+
+if __name__ == "__main__":
+    main()
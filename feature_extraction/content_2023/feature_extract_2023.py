@@ -4,8 +4,13 @@ from bs4 import BeautifulSoup
 import re
 from urllib.parse import urlparse
 from difflib import SequenceMatcher
+import os
+import sys
 import tldextract
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from extractor_fingerprint import fingerprint
+
 class ContentFeatureExtractor:
     def __init__(self):
         self.timeout = 10
@@ -13,6 +18,11 @@ class ContentFeatureExtractor:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
 
+    def fingerprint(self):
+        """Version of this extractor's code + configuration (see extractor_fingerprint.py);
+           the fetch settings (timeout, headers) don't change the features"""
+        return fingerprint(self, exclude=('timeout', 'headers'))
+
     def get_similarity(self, a, b):
         if not a or not b:
             return 0.0
@@ -0,0 +1,85 @@
+#extractor_fingerprint.py
+# Version fingerprint of a feature extractor.
+#
+# Features extracted by one version of an extractor and a model trained on
+# them are only consistent with that version: changing a keyword list, a TLD
+# set or the code of extract() changes the features of the same URL. The
+# fingerprint is a hash of
+#   - the code of the extractor's class (tokens only: comments, blank lines and
+#     formatting don't count, so they don't invalidate anything), and
+#   - its configuration: every attribute set in __init__, in a canonical form
+#     (sets sorted, dict keys sorted) so it is the same in every process.
+# It is stamped into feature artifacts and model metadata and compared when
+# they are used together.
+import hashlib
+import inspect
+import io
+import json
+import tokenize
+
+_SKIP_TOKENS = (tokenize.COMMENT, tokenize.NL, tokenize.NEWLINE)
+
+
+def _code_tokens(cls):
+    source = inspect.getsource(cls)
+    tokens = []
+    for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+        if tok.type in _SKIP_TOKENS:
+            continue
+        # Indentation only matters as structure, not as an amount of whitespace
+        tokens.append(tokenize.tok_name[tok.type] if tok.type in (tokenize.INDENT, tokenize.DEDENT) else tok.string)
+    return tokens
+
+
+def _canonical(value):
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(v) for v in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return repr(value)
+
+
+def fingerprint(extractor, exclude=()):
+    """
+    Hex fingerprint (16 chars) of an extractor instance's code and configuration.
+    Attributes in exclude are left out (settings that don't change the features,
+    e.g. a network timeout).
+    """
+    config = {name: value for name, value in vars(extractor).items() if name not in exclude}
+    payload = json.dumps({
+        'class': type(extractor).__name__,
+        'code': _code_tokens(type(extractor)),
+        'config': _canonical(config),
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def check_fingerprint(name, expected, actual, mode='warn'):
+    """
+    Compare the fingerprint an artifact was made with (expected) against the
+    running extractor's (actual). Returns 'match', 'mismatch' or 'unknown'
+    (artifact made before fingerprints were recorded).
+
+    mode: 'warn' prints a warning, 'strict' raises RuntimeError on a mismatch,
+    'off' only returns the status.
+    """
+    if expected is None:
+        status = 'unknown'
+    else:
+        status = 'match' if expected == actual else 'mismatch'
+
+    if mode == 'off' or status == 'match':
+        return status
+    if status == 'mismatch':
+        message = (f"{name}: made with feature extractor {expected}, running extractor is {actual} - "
+                   f"features differ from the ones it was built on; re-extract / retrain")
+        if mode == 'strict':
+            raise RuntimeError(message)
+        print(f" WARNING: {message}")
+    else:
+        print(f" Note: {name} has no extractor fingerprint (made before fingerprints were recorded)")
+    return status
@@ -3,9 +3,12 @@ import pandas as pd
 import joblib
 import sys
 import os
+from datetime import datetime
 
 # Import from local Feature_Extractor.py
 from Feature_Extractor import URLFeatureExtractor
+from feature_cache import URLFeatureCache
+from feature_store import write_store_metadata
 
 print("="*70)
 print("  FEATURE EXTRACTION FOR DATASET 2024")
@@ -40,7 +43,9 @@ for label, count in label_counts.items():
 # Extract Features
 # ========================================================
 print(f"\n Extracting URL features from {len(df)} URLs...")
+# URLs extracted before with the same extractor version come from the cache
 extractor = URLFeatureExtractor()
+cache = URLFeatureCache(extractor)
 
 feature_rows = []
 labels = []
@@ -53,7 +58,7 @@ for idx, row in df.iterrows():
     url = str(row['url']).strip()
     
     try:
-        features = extractor.extract(url)
+        features = cache.extract(url)
         feature_rows.append(features)
         labels.append(int(row['label']))
     except Exception as e:
@@ -62,6 +67,9 @@ for idx, row in df.iterrows():
             print(f"    Failed to extract features from: {url[:50]}... - {e}")
 
 print(f"   Progress: {len(df)}/{len(df)} (100.0%)")
+cache.flush()
+cache_stats = cache.stats()
+print(f"   Feature cache: {cache_stats['hits']:,} hits, {cache_stats['misses']:,} extracted (version {cache_stats['version']})")
 
 if failed_count > 0:
     print(f"\n  Failed to extract features from {failed_count} URLs ({failed_count/len(df)*100:.2f}%)")
@@ -113,6 +121,11 @@ joblib.dump(labels, labels_path)
 print(f" Saved: extracted_features_2024.pkl (shape: {features_df.shape})")
 print(f" Saved: extracted_labels_2024.pkl (length: {len(labels)})")
 
+# Which extractor version produced these features (checked by training,
+# augmentation and the predictor)
+write_store_metadata(output_dir, extractor.fingerprint(), len(labels), datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+print(f" Saved: extracted_features_2024.json (extractor fingerprint {extractor.fingerprint()})")
+
 # ========================================================
 # Final Verification
 # ========================================================
@@ -3,8 +3,13 @@ import re
 import math
 from urllib.parse import urlparse, parse_qs
 from collections import Counter
+import os
+import sys
 import tldextract
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from extractor_fingerprint import fingerprint
+
 class URLFeatureExtractor:
     def __init__(self):
         # Suspicious keywords
@@ -47,6 +52,10 @@ class URLFeatureExtractor:
             'view', 'watch', 'wiki'
         }
         
+    def fingerprint(self):
+        """Version of this extractor's code + configuration (see extractor_fingerprint.py)"""
+        return fingerprint(self)
+
     def levenshtein_distance(self, s1, s2):
         """Calculate Levenshtein distance"""
         if len(s1) < len(s2):
@@ -0,0 +1,330 @@
+#feature_cache.py
+# Persistent URL -> feature cache for URLFeatureExtractor, shared by feature
+# extraction, training, augmentation and the API.
+#
+#   feature_cache/<extractor version>/
+#       columns.json               feature names (and which ones are integers)
+#       seg-<time>-<pid>.npy       sorted records (key uint64, values float64[n_features])
+#
+# Keys are 64-bit hashes of the URL; the extractor version is the extractor's
+# fingerprint (code + configuration, see extractor_fingerprint.py), so any
+# change to URLFeatureExtractor starts an empty cache instead of serving
+# stale features.
+#
+# Segments are written once and never modified: new entries are buffered and
+# written as a new segment by flush(), and segments are read memory-mapped,
+# so several processes can share a cache without loading it into memory or
+# locking.
+#
+# Merging is size-tiered, so an entry is rewritten a few times at most rather
+# than on every merge: max_segments segments of a similar size (the same power
+# of max_segments entries) are merged into one, and the largest (base) segment
+# is only rewritten once the others hold BASE_FRACTION of its entries, or the
+# cache is over max_entries.
+#
+# A long-running process (the API) passes background=True, so segment writes
+# and merges happen on a flusher thread instead of inside a request, and
+# max_entries, so the cache doesn't grow with every URL ever seen: a merge
+# over the cap keeps only the newest entries.
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+import numpy as np
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "feature_cache")
+BASE_FRACTION = 0.5   # rewrite the base segment when the others hold this share of its entries
+
+
+def cache_url(url):
+    """ The URL string that is hashed and extracted (so a key never maps to features of another string) """
+    return str(url).strip()
+
+
+def url_hashes(urls):
+    """
+    64-bit hash of every URL (BLAKE2b of cache_url(url), first 8 bytes).
+    hashlib rather than Python's hash() or pandas' hashing: keys are kept on
+    disk, so the hash must not change between processes or library versions.
+    """
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(cache_url(u).encode('utf-8'), digest_size=8).digest(), 'little')
+         for u in urls),
+        dtype=np.uint64, count=len(urls))
+
+
+def extractor_version(extractor):
+    return extractor.fingerprint()
+
+
+class URLFeatureCache:
+    """
+    get(url) / get_many(urls)   cached features (dict) or None
+    compute(url)                extract and add to the cache
+    extract(url)                get(url), or compute(url) on a miss
+
+    Returned dicts equal the extractor's own output (same keys, ints stay ints).
+    Thread-safe; new entries become visible to other processes after flush().
+
+    background=True     flushes and merges run on a daemon thread; put() only
+                        buffers, so no caller waits on a segment write or merge
+    max_entries         cap on the entries kept on disk (None = no cap); a merge
+                        over the cap keeps the newest 80% of it - whole older
+                        segments go first, entries within a segment in hash
+                        order (at random). The cap applies to the whole cache
+                        directory, including entries other processes wrote.
+                        At the cap, the base segment is rewritten once per
+                        20% of the cap in new entries.
+    """
+
+    def __init__(self, extractor, cache_dir=CACHE_DIR, version=None, flush_every=1000,
+                 max_segments=8, refresh_seconds=5.0, max_entries=None, background=False):
+        self.extractor = extractor
+        self.version = version or extractor_version(extractor)
+        self.dir = os.path.join(cache_dir, self.version)
+        self.flush_every = flush_every
+        self.max_segments = max_segments
+        self.refresh_seconds = refresh_seconds
+        self.max_entries = max_entries
+
+        self.columns = None
+        self.int_columns = frozenset()
+        self._dtype = None
+        self._segments = {}          # file name -> memory-mapped record array
+        self._pending = {}           # key -> float64 row, not yet written
+        self._flushing = {}          # key -> float64 row, being written by flush()
+        self._lock = threading.Lock()         # state used by lookups; never held during file writes
+        self._write_lock = threading.Lock()   # one flush / merge at a time
+        self._checked_at = 0.0
+        self.hits = self.misses = 0
+        self._refresh(force=True)
+
+        self._flush_wanted = threading.Event()
+        self._flusher = None
+        if background:
+            self._flusher = threading.Thread(target=self._flush_loop, name='url-feature-cache-flush', daemon=True)
+            self._flusher.start()
+
+    # ---- layout --------------------------------------------------------
+
+    def _set_columns(self, columns, int_columns):
+        self.columns = list(columns)
+        self.int_columns = frozenset(int_columns)
+        self._dtype = np.dtype([('key', '<u8'), ('values', '<f8', (len(self.columns),))])
+
+    def _init_columns(self, features):
+        """ Take the column layout from the first extracted URL (written once per version) """
+        int_columns = [name for name, value in features.items() if isinstance(value, (int, np.integer))]
+        self._set_columns(list(features), int_columns)
+        os.makedirs(self.dir, exist_ok=True)
+        path = os.path.join(self.dir, 'columns.json')
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'columns': self.columns, 'int_columns': int_columns}, f)
+        os.replace(tmp_path, path)
+
+    def _segment_names(self):
+        if not os.path.isdir(self.dir):
+            return []
+        return sorted(name for name in os.listdir(self.dir) if name.startswith('seg-') and name.endswith('.npy'))
+
+    def _refresh(self, force=False):
+        """ Pick up segments written (or removed by a merge) in other processes """
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.refresh_seconds:
+            return
+        self._checked_at = now
+        if self.columns is None:
+            columns_path = os.path.join(self.dir, 'columns.json')
+            if not os.path.exists(columns_path):
+                return
+            with open(columns_path) as f:
+                meta = json.load(f)
+            self._set_columns(meta['columns'], meta['int_columns'])
+        names = self._segment_names()
+        segments = {}
+        for name in names:
+            if name in self._segments:
+                segments[name] = self._segments[name]
+                continue
+            try:
+                segments[name] = np.load(os.path.join(self.dir, name), mmap_mode='r')
+            except (OSError, ValueError):
+                continue  # removed by a merge in the meantime
+        self._segments = segments
+
+    # ---- lookups -------------------------------------------------------
+
+    def _row_to_dict(self, row):
+        return {name: int(value) if name in self.int_columns else float(value)
+                for name, value in zip(self.columns, row.tolist())}
+
+    def _lookup(self, keys):
+        """ Float64 rows for keys (None where missing) """
+        rows = [None] * len(keys)
+        missing = np.ones(len(keys), dtype=bool)
+        for key_index, key in enumerate(keys):
+            row = self._pending.get(int(key))
+            if row is None:
+                row = self._flushing.get(int(key))
+            if row is not None:
+                rows[key_index] = row
+                missing[key_index] = False
+        for segment in list(self._segments.values()):
+            if not missing.any():
+                break
+            index = np.flatnonzero(missing)
+            segment_keys = segment['key']
+            pos = np.searchsorted(segment_keys, keys[index])
+            pos[pos == len(segment_keys)] = 0
+            found = segment_keys[pos] == keys[index]
+            for i, p in zip(index[found], pos[found]):
+                rows[i] = segment['values'][p]
+                missing[i] = False
+        return rows
+
+    def get_many(self, urls):
+        with self._lock:
+            self._refresh()
+            if self.columns is None:
+                self.misses += len(urls)
+                return [None] * len(urls)
+            rows = self._lookup(url_hashes(urls))
+            hits = sum(row is not None for row in rows)
+            self.hits += hits
+            self.misses += len(rows) - hits
+        return [None if row is None else self._row_to_dict(row) for row in rows]
+
+    def get(self, url):
+        return self.get_many([url])[0]
+
+    def compute(self, url):
+        url = cache_url(url)
+        features = self.extractor.extract(url)
+        self.put(url, features)
+        return features
+
+    def extract(self, url):
+        features = self.get(url)
+        return features if features is not None else self.compute(url)
+
+    # ---- writes --------------------------------------------------------
+
+    def put(self, url, features):
+        with self._lock:
+            if self.columns is None:
+                self._init_columns(features)
+            if list(features) != self.columns:
+                return  # a different layout than this version's - don't cache
+            self._pending[int(url_hashes([url])[0])] = np.array(
+                [features[name] for name in self.columns], dtype=np.float64)
+            full = len(self._pending) >= self.flush_every
+        if full:
+            if self._flusher is not None:
+                self._flush_wanted.set()
+            else:
+                self.flush()
+
+    def _flush_loop(self):
+        while True:
+            self._flush_wanted.wait()
+            self._flush_wanted.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f" URL feature cache flush failed: {e}")
+
+    def flush(self):
+        """
+        Write the buffered entries as a new segment, then merge segments if
+        needed (see _compact). Lookups only wait for the swap of the buffer;
+        the entries stay visible (in _flushing) while the segment is written.
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                self._flushing, self._pending = self._pending, {}
+                batch = self._flushing
+            keys = np.fromiter(batch.keys(), dtype=np.uint64, count=len(batch))
+            values = np.stack(list(batch.values()))
+            self._write_segment(keys, values)
+            with self._lock:
+                self._flushing = {}
+                self._refresh(force=True)
+                segments = dict(self._segments)
+            self._compact(segments)
+
+    def _compact(self, segments):
+        """ Size-tiered merging: rewrite the base (largest) segment only when the others
+            hold BASE_FRACTION of its entries or the cache is over max_entries; otherwise
+            merge max_segments segments of the same tier (power of max_segments). """
+        if len(segments) < 2:
+            return
+        sizes = {name: len(segment) for name, segment in segments.items()}
+        entries = sum(sizes.values())
+        base = max(sizes, key=sizes.get)
+        if (self.max_entries and entries > self.max_entries) or entries - sizes[base] >= BASE_FRACTION * sizes[base]:
+            self._merge(segments, sorted(segments))
+            return
+        tiers = {}
+        for name in sorted(segments):
+            if name != base:
+                tiers.setdefault(int(math.log(max(sizes[name], 1), max(self.max_segments, 2))), []).append(name)
+        for names in tiers.values():
+            if len(names) >= self.max_segments:
+                self._merge(segments, names)
+
+    def _write_segment(self, keys, values, written_at=None):
+        order = np.argsort(keys, kind='stable')
+        records = np.empty(len(keys), dtype=self._dtype)
+        records['key'] = keys[order]
+        records['values'] = values[order]
+        if written_at is None:
+            name = f"seg-{time.time_ns():020d}-{os.getpid()}.npy"
+        else:
+            # A merged segment keeps the time of its newest input, so older-first
+            # eviction still sees its age; the suffix keeps the name unique
+            name = f"seg-{written_at:020d}-{os.getpid()}-{time.time_ns()}.npy"
+        tmp_path = os.path.join(self.dir, name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.save(f, records)
+        os.replace(tmp_path, os.path.join(self.dir, name))
+        return name
+
+    def _merge(self, segments, names):
+        """ Merge the named segments (oldest first) into one - newest entry of a key wins,
+            trimmed to the cap - and remove them. Runs under _write_lock only; lookups
+            keep using the old segments until the refresh. """
+        records = np.concatenate([segments[name] for name in reversed(names)])
+        _, first = np.unique(records['key'], return_index=True)
+        if self.max_entries and len(first) > self.max_entries:
+            # Positions in the newest-first concatenation: the smallest are the newest entries
+            first = np.sort(first)[:int(self.max_entries * 0.8)]
+        self._write_segment(records['key'][first], records['values'][first],
+                            written_at=int(names[-1].split('-')[1]))
+        for name in names:
+            try:
+                os.remove(os.path.join(self.dir, name))
+            except OSError:
+                pass  # still mapped (Windows) or merged by another process - merged again next time
+        with self._lock:
+            self._refresh(force=True)
+
+    def stats(self):
+        with self._lock:
+            self._refresh()
+            entries = sum(len(segment) for segment in self._segments.values())
+        lookups = self.hits + self.misses
+        return {
+            'version': self.version,
+            'entries': entries,
+            'pending': len(self._pending) + len(self._flushing),
+            'segments': len(self._segments),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+        }
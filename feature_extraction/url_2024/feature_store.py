@@ -0,0 +1,197 @@
+#feature_store.py
+# URL feature store of Model 2024.
+#
+#   extracted_features/
+#       extracted_features_2024.pkl    base extraction of Dataset_2024.csv (FeatureExtract_2024.py)
+#       extracted_labels_2024.pkl
+#       extracted_features_2024.json   extractor fingerprint of the base extraction
+#       partitions/part-00001.pkl      rows appended by augmentation runs, oldest first
+#       partitions/manifest.json       rows / date / extractor fingerprint of every partition
+#       url_index_2024.npz             64-bit hashes of every URL in the store
+#
+# Augmentation appends a partition instead of rewriting the base pickles, and
+# load_feature_store() returns base rows first and partitions in order, so the
+# row order never changes - Update_2024.py relies on that to find the new rows.
+#
+# Every part records the fingerprint of the extractor that produced it; a
+# store mixing extractor versions is refused, since its rows are not comparable.
+# The manifest repeats the partitions' fingerprints so checking them doesn't
+# unpickle every partition (a partition missing from it is read instead).
+import json
+import os
+import joblib
+import numpy as np
+import pandas as pd
+from feature_cache import url_hashes
+
+STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "extracted_features")
+FEATURES_FILE = "extracted_features_2024.pkl"
+LABELS_FILE = "extracted_labels_2024.pkl"
+METADATA_FILE = "extracted_features_2024.json"
+PARTITIONS_DIR = "partitions"
+MANIFEST_FILE = "manifest.json"
+INDEX_FILE = "url_index_2024.npz"
+
+
+def partition_paths(store_dir=STORE_DIR):
+    partitions_dir = os.path.join(store_dir, PARTITIONS_DIR)
+    if not os.path.isdir(partitions_dir):
+        return []
+    return [os.path.join(partitions_dir, name) for name in sorted(os.listdir(partitions_dir))
+            if name.startswith('part-') and name.endswith('.pkl')]
+
+
+def load_partition(path):
+    """ {'features': DataFrame, 'labels': list, 'urls': list, 'sources': list, 'date': str,
+        'extractor_fingerprint': str} """
+    return joblib.load(path)
+
+
+def write_store_metadata(store_dir, extractor_fingerprint, rows, date):
+    """ Record the fingerprint of the extractor that produced the base pickles """
+    with open(os.path.join(store_dir, METADATA_FILE), 'w') as f:
+        json.dump({'extractor_fingerprint': extractor_fingerprint, 'rows': rows, 'date': date}, f, indent=4)
+
+
+def read_manifest(store_dir=STORE_DIR):
+    """ {partition file name: {'rows', 'date', 'extractor_fingerprint'}} """
+    path = os.path.join(store_dir, PARTITIONS_DIR, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_manifest(store_dir, manifest):
+    path = os.path.join(store_dir, PARTITIONS_DIR, MANIFEST_FILE)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=4)
+    os.replace(tmp_path, path)
+
+
+def _base_fingerprint(store_dir):
+    metadata_path = os.path.join(store_dir, METADATA_FILE)
+    if not os.path.exists(metadata_path):
+        return None
+    with open(metadata_path) as f:
+        return json.load(f).get('extractor_fingerprint')
+
+
+def _single_fingerprint(fingerprints):
+    """ The one fingerprint in {part name: fingerprint or None}; ValueError if parts differ """
+    known = {fp for fp in fingerprints.values() if fp}
+    if len(known) > 1:
+        detail = ', '.join(f"{name}: {fp}" for name, fp in fingerprints.items() if fp)
+        raise ValueError(f"Feature store mixes feature extractor versions ({detail}) - "
+                         f"re-run FeatureExtract_2024.py and the augmentation")
+    return known.pop() if known else None
+
+
+def store_fingerprint(store_dir=STORE_DIR):
+    """
+    Extractor fingerprint of the store's features, or None if no part records
+    one (extracted before fingerprints existed). Raises ValueError if parts
+    were extracted by different extractor versions.
+    """
+    fingerprints = {FEATURES_FILE: _base_fingerprint(store_dir)}
+    manifest = read_manifest(store_dir)
+    for path in partition_paths(store_dir):
+        name = os.path.basename(path)
+        entry = manifest.get(name) or load_partition(path)
+        fingerprints[name] = entry.get('extractor_fingerprint')
+    return _single_fingerprint(fingerprints)
+
+
+def load_feature_store(store_dir=STORE_DIR):
+    """ (X, y) of the base extraction followed by every partition """
+    paths = partition_paths(store_dir)
+    parts = [load_partition(path) for path in paths]
+    # Checked on the partitions just loaded rather than through store_fingerprint()
+    fingerprints = {FEATURES_FILE: _base_fingerprint(store_dir)}
+    fingerprints.update((os.path.basename(path), part.get('extractor_fingerprint'))
+                        for path, part in zip(paths, parts))
+    _single_fingerprint(fingerprints)
+
+    X = joblib.load(os.path.join(store_dir, FEATURES_FILE))
+    y = list(joblib.load(os.path.join(store_dir, LABELS_FILE)))
+    if not isinstance(X, pd.DataFrame):
+        X = pd.DataFrame(X)
+
+    if parts:
+        X = pd.concat([X] + [part['features'].reindex(columns=X.columns) for part in parts], ignore_index=True)
+        for part in parts:
+            y.extend(part['labels'])
+    return X, y
+
+
+def append_partition(features, labels, urls, sources, date, extractor_fingerprint, store_dir=STORE_DIR):
+    """ Write the rows as the next partition (atomically), add it to the manifest and return its path """
+    partitions_dir = os.path.join(store_dir, PARTITIONS_DIR)
+    os.makedirs(partitions_dir, exist_ok=True)
+    existing = partition_paths(store_dir)
+    number = int(os.path.basename(existing[-1])[5:10]) + 1 if existing else 1
+    path = os.path.join(partitions_dir, f"part-{number:05d}.pkl")
+
+    tmp_path = path + '.tmp'
+    joblib.dump({'features': features, 'labels': list(labels), 'urls': list(urls),
+                 'sources': list(sources), 'date': date, 'extractor_fingerprint': extractor_fingerprint}, tmp_path)
+    os.replace(tmp_path, path)
+
+    # A crash before this point leaves the partition out of the manifest - it is then read directly
+    manifest = read_manifest(store_dir)
+    manifest[os.path.basename(path)] = {'rows': len(labels), 'date': date,
+                                        'extractor_fingerprint': extractor_fingerprint}
+    _write_manifest(store_dir, manifest)
+    return path
+
+
+class URLIndex:
+    """
+    Persistent set of the URLs in the feature store, as a sorted array of
+    64-bit hashes (8 bytes per URL; a false match among n URLs has
+    probability about n^2 / 2^65).
+
+    The file also records how many partitions it covers: partitions written
+    after the index was last saved (a run that died in between) are indexed
+    again on load, so a URL can't be added twice.
+    """
+
+    def __init__(self, hashes=None, n_partitions=0, path=None):
+        self.hashes = np.unique(np.asarray(hashes if hashes is not None else [], dtype=np.uint64))
+        self.n_partitions = n_partitions
+        self.path = path
+
+    def __len__(self):
+        return len(self.hashes)
+
+    @classmethod
+    def load(cls, store_dir=STORE_DIR):
+        """ The saved index, or None if the store has none yet """
+        path = os.path.join(store_dir, INDEX_FILE)
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            index = cls(data['hashes'], int(data['n_partitions']), path)
+        for part_path in partition_paths(store_dir)[index.n_partitions:]:
+            index.add(url_hashes(load_partition(part_path)['urls']))
+            index.n_partitions += 1
+        return index
+
+    def contains(self, hashes):
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if not len(self.hashes):
+            return np.zeros(len(hashes), dtype=bool)
+        pos = np.searchsorted(self.hashes, hashes)
+        pos[pos == len(self.hashes)] = 0
+        return self.hashes[pos] == hashes
+
+    def add(self, hashes):
+        self.hashes = np.union1d(self.hashes, np.asarray(hashes, dtype=np.uint64))
+
+    def save(self, store_dir=STORE_DIR):
+        self.path = os.path.join(store_dir, INDEX_FILE)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, hashes=self.hashes, n_partitions=self.n_partitions)
+        os.replace(tmp_path, self.path)
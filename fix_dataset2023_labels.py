@@ -8,54 +8,89 @@ This script inverts the labels in Dataset2023.csv:
 Aligns with PhiUSIIL dataset description.
 """
 
-import pandas as pd
+import argparse
 import os
-from datetime import datetime
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'preprocessing'))
+from streaming import iter_csv_chunks
+from dataset_io import DatasetHistory
+
+parser = argparse.ArgumentParser(description="Invert the labels of Dataset2023.csv (once)")
+parser.add_argument('--chunksize', type=int, default=200_000, help="Rows per chunk")
+parser.add_argument('--force', action='store_true',
+                    help="Invert even if the file looks already fixed (labels flip back!)")
+args = parser.parse_args()
+
+STEP = 'fix_labels_2023'
+EXPECTED_LEGITIMATE = 134850
 
 print("=" * 70)
 print("FIXING DATASET 2023 LABEL REVERSAL")
 print("=" * 70)
 
 # Paths
-input_file = 'datasets/dataset_2023/Dataset2023.csv'
-output_file = 'datasets/dataset_2023/Dataset2023.csv'
-
-# Load dataset
-print(f"\n1. Loading dataset...")
-df = pd.read_csv(input_file)
-print(f"   Total rows: {len(df):,}")
-
-# Check current distribution
-label_0_before = len(df[df['label'] == 0])
-label_1_before = len(df[df['label'] == 1])
-print(f"\n2. Current label distribution:")
-print(f"   Label 0: {label_0_before:,}")
-print(f"   Label 1: {label_1_before:,}")
-
-# Invert labels: 0→1, 1→0
-print(f"\n3. Inverting labels...")
-df['label'] = df['label'].apply(lambda x: 1 - x)
-
-# Verify new distribution
-label_0_after = len(df[df['label'] == 0])
-label_1_after = len(df[df['label'] == 1])
+dataset_file = 'datasets/dataset_2023/Dataset2023.csv'
+
+# Inverting twice silently undoes the fix, so the history of the file
+# (content hashes, see preprocessing/dataset_io.py) decides whether it still needs it
+print(f"\n1. Checking dataset history...")
+history = DatasetHistory(dataset_file)
+previous = history.applied(STEP)
+if previous and not args.force:
+    print(f"   Labels were already inverted on {previous['date']} (sha256 {previous['output_sha256'][:12]})")
+    print(f"   Nothing to do.")
+    sys.exit(0)
+
+# Read and invert chunk by chunk. Every column is read as text and written back
+# unchanged, only the label column is rewritten.
+print(f"\n2. Inverting labels...")
+counts_before = {0: 0, 1: 0}
+rows = 0
+for chunk in iter_csv_chunks(dataset_file, args.chunksize):
+    labels = chunk['label'].astype(float)
+    if not labels.isin([0, 1]).all():
+        history.discard()
+        print(f"   ERROR: labels must be 0 or 1, found {sorted(labels[~labels.isin([0, 1])].unique())[:5]}")
+        sys.exit(1)
+    labels = labels.astype('int8')
+    counts_before[0] += int((labels == 0).sum())
+    counts_before[1] += int((labels == 1).sum())
+    chunk['label'] = (1 - labels).astype(str)
+    chunk.to_csv(history.tmp_path, mode='w' if rows == 0 else 'a', header=rows == 0, index=False)
+    rows += len(chunk)
+print(f"   Total rows: {rows:,}")
+
+print(f"\n3. Current label distribution:")
+print(f"   Label 0: {counts_before[0]:,}")
+print(f"   Label 1: {counts_before[1]:,}")
+
+# Without a history (e.g. a file fixed before histories were kept) the class
+# balance tells: legitimate pages are the majority in PhiUSIIL
+if counts_before[0] > counts_before[1] and not args.force:
+    history.discard()
+    print(f"\n   Label 0 is already the majority class - the labels look fixed already.")
+    print(f"   Nothing written. Use --force to invert anyway.")
+    sys.exit(0)
+
+label_0_after, label_1_after = counts_before[1], counts_before[0]
 print(f"\n4. New label distribution:")
 print(f"   Label 0 (Legitimate): {label_0_after:,}")
 print(f"   Label 1 (Phishing): {label_1_after:,}")
 
 # Verify against expected
 print(f"\n5. Verification:")
-print(f"   Expected - Legitimate: 134,850")
+print(f"   Expected - Legitimate: {EXPECTED_LEGITIMATE:,}")
 print(f"   Actual - Label 0: {label_0_after:,}")
-if label_0_after == 134850:
+if label_0_after == EXPECTED_LEGITIMATE:
     print(f"   ✅ CORRECT! Labels are now properly aligned.")
 else:
     print(f"   ⚠ Warning: Count doesn't match expected")
 
-# Save corrected dataset
+# Replace the dataset (atomic rename of the fully written file)
 print(f"\n6. Saving corrected dataset...")
-df.to_csv(output_file, index=False)
-print(f"   ✓ Saved: {output_file}")
+entry = history.commit(STEP, rows=rows, label_0=label_0_after, label_1=label_1_after)
+print(f"   ✓ Saved: {dataset_file} (sha256 {entry['output_sha256'][:12]})")
 
 print("\n" + "=" * 70)
 print("LABEL CORRECTION COMPLETED SUCCESSFULLY")
@@ -0,0 +1,567 @@
+#detection_log.py
+import os
+import re
+import csv
+import io
+import gzip
+import hashlib
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+# html_hash references the captured page in the HTML archive (empty when no page was captured);
+# entry_id is assigned on append so rows with the same timestamp and URL stay distinct
+LOG_FIELDS = ['timestamp', 'url', 'domain', 'prediction', 'probability', 'action', 'risk_level', 'reason', 'detailed_reason', 'html_hash', 'entry_id']
+TOMBSTONE_FIELDS = ['entry_id', 'marked_at']
+
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_PARTITION_RE = re.compile(r'^(\d{4}-\d{2}-\d{2}|undated)\.csv(\.gz)?$')
+
+
+def _row_hash(timestamp, url):
+    return hashlib.sha1(f"{timestamp}|{url}".encode('utf-8')).hexdigest()[:16]
+
+
+def partition_date(timestamp):
+    """ Day partition (YYYY-MM-DD) a row with this timestamp belongs to """
+    date = (timestamp or '')[:10]
+    return date if _DATE_RE.match(date) else 'undated'
+
+
+def entry_id(timestamp, url):
+    """ ID of a detection row written without an entry_id column (before IDs were
+        stored): <yyyymmdd>-<hash of timestamp|url>. The date prefix tells which
+        partition holds the row. """
+    return f"{partition_date(timestamp).replace('-', '')}-{_row_hash(timestamp, url)}"
+
+
+def new_entry_id(timestamp):
+    """ Unique ID for a new row: <yyyymmdd>-<random>, same shape as entry_id() """
+    return f"{partition_date(timestamp).replace('-', '')}-{uuid.uuid4().hex[:16]}"
+
+
+def row_id(row):
+    """ The stored entry_id of a row, or the timestamp|url one for older rows """
+    return row.get('entry_id') or entry_id(row.get('timestamp', ''), row.get('url', ''))
+
+
+def _entry_partition(eid):
+    day = (eid or '').split('-', 1)[0]
+    if len(day) == 8 and day.isdigit():
+        return f"{day[:4]}-{day[4:6]}-{day[6:]}"
+    return 'undated'
+
+
+def _iter_records(f):
+    """
+    Yield (offset, raw_bytes) for every complete CSV record in a binary file,
+    starting at the current position. Quoted fields may contain newlines, so
+    lines are joined until the quote count is even. A trailing record without
+    its final newline (a write in progress) is not yielded.
+    """
+    offset = f.tell()
+    buf = b''
+    start = offset
+    for line in iter(f.readline, b''):
+        if not buf:
+            start = offset
+        buf += line
+        offset += len(line)
+        if buf.count(b'"') % 2 == 0 and buf.endswith(b'\n'):
+            yield start, buf
+            buf = b''
+
+
+def _parse_record(raw):
+    return next(csv.reader(io.StringIO(raw.decode('utf-8'), newline='')))
+
+
+class _PartitionState:
+    """ In-memory state of one day partition, refreshed incrementally """
+    __slots__ = ('index', 'index_pos', 'columns', 'tombstones', 'tombstone_pos', 'summary', 'summary_key')
+
+    def __init__(self):
+        # entry_id -> byte offset of the row in the uncompressed partition file
+        self.index = {}
+        self.index_pos = 0
+        self.columns = None
+        # entry_id -> marked_at
+        self.tombstones = {}
+        self.tombstone_pos = 0
+        # cached counts and the file stats they were computed from
+        self.summary = None
+        self.summary_key = None
+
+
+class DetectionLog:
+    """
+    Append-only detection history, partitioned by day.
+
+    Layout of log_dir:
+        YYYY-MM-DD.csv             today's (and recent) detections, appendable
+        YYYY-MM-DD.csv.gz          sealed older days, tombstones already applied
+        YYYY-MM-DD.tombstones.csv  entries of that day marked as false positives
+
+    Marking an entry as a false positive never rewrites a log: a tombstone
+    (entry_id, marked_at) is appended to the day's tombstone file and readers
+    skip tombstoned rows. The entry_id carries its day, and each open
+    partition keeps an entry_id -> byte offset index that is extended only
+    with newly appended bytes, so lookups and marks cost the same at 1M rows
+    as at 100.
+
+    Range queries only open the partitions inside the range, and per-day
+    summary counts are cached until a partition changes, so dashboard latency
+    depends on the query window rather than on total history.
+
+    rotate() runs in the background when the day changes: it seals (applies
+    tombstones and gzips) partitions older than compress_after_days and
+    deletes partitions older than retention_days.
+    """
+
+    def __init__(self, log_dir, retention_days=365, compress_after_days=1, compact_threshold=500):
+        self.log_dir = log_dir
+        self.retention_days = retention_days
+        self.compress_after_days = compress_after_days
+        self.compact_threshold = compact_threshold
+
+        self._lock = threading.RLock()
+        self._states = {}
+        self._busy = set()
+        self._last_rotation = None
+
+        os.makedirs(log_dir, exist_ok=True)
+
+    # ------------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------------
+    def _csv_path(self, date):
+        return os.path.join(self.log_dir, f"{date}.csv")
+
+    def _gz_path(self, date):
+        return os.path.join(self.log_dir, f"{date}.csv.gz")
+
+    def _tombstone_path(self, date):
+        return os.path.join(self.log_dir, f"{date}.tombstones.csv")
+
+    def _state(self, date):
+        state = self._states.get(date)
+        if state is None:
+            state = self._states[date] = _PartitionState()
+        return state
+
+    def partitions(self, start=None, end=None):
+        """ Sorted day partitions, optionally limited to start <= day <= end (YYYY-MM-DD) """
+        dates = set()
+        for name in os.listdir(self.log_dir):
+            match = _PARTITION_RE.match(name)
+            if match:
+                dates.add(match.group(1))
+        return sorted(d for d in dates if (start is None or d >= start) and (end is None or d <= end))
+
+    def files(self, start=None, end=None):
+        """ Files whose content determines what rows(start, end) returns (for cache validators) """
+        paths = [self.log_dir]
+        for date in self.partitions(start, end):
+            paths.extend(p for p in (self._gz_path(date), self._csv_path(date), self._tombstone_path(date))
+                         if os.path.exists(p))
+        return paths
+
+    # ------------------------------------------------------------
+    # Incremental index / tombstone loading (caller holds the lock)
+    # ------------------------------------------------------------
+    def _refresh_index(self, date):
+        state = self._state(date)
+        path = self._csv_path(date)
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size < state.index_pos:
+            # File was replaced (compaction / sealing) - start over
+            state.index, state.index_pos, state.columns = {}, 0, None
+        if size == state.index_pos:
+            return
+
+        with open(path, 'rb') as f:
+            f.seek(state.index_pos)
+            for offset, raw in _iter_records(f):
+                state.index_pos = offset + len(raw)
+                values = _parse_record(raw)
+                if state.columns is None:
+                    state.columns = values
+                    continue
+                state.index[row_id(dict(zip(state.columns, values)))] = offset
+
+    def _refresh_tombstones(self, date):
+        state = self._state(date)
+        path = self._tombstone_path(date)
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size < state.tombstone_pos:
+            state.tombstones, state.tombstone_pos = {}, 0
+        if size == state.tombstone_pos:
+            return state.tombstones
+
+        with open(path, 'rb') as f:
+            f.seek(state.tombstone_pos)
+            for offset, raw in _iter_records(f):
+                state.tombstone_pos = offset + len(raw)
+                values = _parse_record(raw)
+                if offset == 0 or not values or values[0] == 'entry_id':
+                    continue
+                state.tombstones[values[0]] = values[1] if len(values) > 1 else ''
+        return state.tombstones
+
+    # ------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------
+    def append(self, row):
+        """ Append one detection row (dict with LOG_FIELDS keys) to its day partition
+            and return its entry_id """
+        date = partition_date(row.get('timestamp'))
+        path = self._csv_path(date)
+        with self._lock:
+            new_file = not os.path.exists(path)
+            # Keep the partition's own header: a day started before a column was
+            # added keeps its old layout until it is sealed
+            fieldnames = LOG_FIELDS
+            if not new_file:
+                self._refresh_index(date)
+                fieldnames = self._state(date).columns or LOG_FIELDS
+            row = dict(row)
+            if 'entry_id' in fieldnames:
+                row.setdefault('entry_id', new_entry_id(row.get('timestamp')))
+            else:
+                row['entry_id'] = entry_id(row.get('timestamp', ''), row.get('url', ''))
+            with open(path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+                if new_file:
+                    writer.writeheader()
+                writer.writerow(row)
+            rotate_due = self._last_rotation != datetime.now().strftime('%Y-%m-%d')
+        if rotate_due:
+            self.rotate_in_background()
+        return row['entry_id']
+
+    def tombstone(self, eid):
+        """ Mark an entry as removed. Returns False if it was already tombstoned. """
+        date = _entry_partition(eid)
+        path = self._tombstone_path(date)
+        with self._lock:
+            tombstones = self._refresh_tombstones(date)
+            if eid in tombstones:
+                return False
+            marked_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            new_file = not os.path.exists(path)
+            with open(path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=TOMBSTONE_FIELDS)
+                if new_file:
+                    writer.writeheader()
+                writer.writerow({'entry_id': eid, 'marked_at': marked_at})
+            self._refresh_tombstones(date)
+        self.maybe_compact(date)
+        return True
+
+    # ------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------
+    def _partition_readers(self, date):
+        """ Open text readers for the sealed and open files of a partition (oldest rows first) """
+        readers = []
+        if os.path.exists(self._gz_path(date)):
+            readers.append(gzip.open(self._gz_path(date), 'rt', encoding='utf-8', newline=''))
+        if os.path.exists(self._csv_path(date)):
+            readers.append(open(self._csv_path(date), 'r', encoding='utf-8', newline=''))
+        return readers
+
+    def is_tombstoned(self, eid):
+        date = _entry_partition(eid)
+        with self._lock:
+            return eid in self._refresh_tombstones(date)
+
+    def get(self, eid):
+        """ Return the live row with this entry_id, or None """
+        date = _entry_partition(eid)
+        with self._lock:
+            if eid in self._refresh_tombstones(date):
+                return None
+            self._refresh_index(date)
+            state = self._state(date)
+            offset = state.index.get(eid)
+            columns = state.columns
+
+        if offset is not None:
+            with open(self._csv_path(date), 'rb') as f:
+                f.seek(offset)
+                for _, raw in _iter_records(f):
+                    row = dict(zip(columns, _parse_record(raw)))
+                    # A compaction may have swapped the file since the offset was looked up
+                    if row_id(row) == eid:
+                        row['entry_id'] = eid
+                        return row
+                    break
+
+        # Sealed partitions hold a single day and are rarely queried - scan them
+        if os.path.exists(self._gz_path(date)):
+            with gzip.open(self._gz_path(date), 'rt', encoding='utf-8', newline='') as f:
+                for row in csv.DictReader(f):
+                    if row_id(row) == eid:
+                        row['entry_id'] = eid
+                        return row
+        return None
+
+    def find(self, timestamp, url):
+        """ The first live row with this timestamp and URL, or None (for callers that
+            don't have the entry_id; scans the row's day partition) """
+        for row in self._partition_rows(partition_date(timestamp)):
+            if row.get('timestamp') == timestamp and row.get('url') == url:
+                return row
+        return None
+
+    def _partition_rows(self, date):
+        with self._lock:
+            tombstones = set(self._refresh_tombstones(date))
+        for reader in self._partition_readers(date):
+            with reader:
+                for row in csv.DictReader(reader):
+                    eid = row_id(row)
+                    if eid in tombstones:
+                        continue
+                    row['entry_id'] = eid
+                    yield row
+
+    def rows(self, start=None, end=None, newest_first=False):
+        """ Yield live rows of the partitions between start and end (YYYY-MM-DD, inclusive),
+            tombstones applied. Partitions outside the range are never opened. """
+        dates = self.partitions(start, end)
+        if newest_first:
+            for date in reversed(dates):
+                day_rows = list(self._partition_rows(date))
+                day_rows.reverse()
+                yield from day_rows
+        else:
+            for date in dates:
+                yield from self._partition_rows(date)
+
+    def summary(self, date):
+        """ Counts of live rows in one partition: {'total', 'Blocked', 'Warned'}.
+            Cached until the partition or its tombstones change. """
+        key = []
+        for path in (self._gz_path(date), self._csv_path(date), self._tombstone_path(date)):
+            try:
+                st = os.stat(path)
+                key.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                key.append(None)
+        key = tuple(key)
+
+        with self._lock:
+            state = self._state(date)
+            if state.summary_key == key:
+                return dict(state.summary)
+
+        counts = {'total': 0, 'Blocked': 0, 'Warned': 0}
+        for row in self._partition_rows(date):
+            counts['total'] += 1
+            action = row.get('action')
+            if action in counts:
+                counts[action] += 1
+
+        with self._lock:
+            state.summary, state.summary_key = counts, key
+        return dict(counts)
+
+    def totals(self, start=None, end=None):
+        """ Summed summary() over the partitions in range """
+        totals = {'total': 0, 'Blocked': 0, 'Warned': 0}
+        for date in self.partitions(start, end):
+            for name, count in self.summary(date).items():
+                totals[name] += count
+        return totals
+
+    # ------------------------------------------------------------
+    # Compaction, sealing and retention
+    # ------------------------------------------------------------
+    def _run_in_background(self, key, func, *args):
+        with self._lock:
+            if key in self._busy:
+                return False
+            self._busy.add(key)
+
+        def worker():
+            try:
+                func(*args)
+            except Exception as e:
+                print(f" Detection log maintenance failed ({key}): {e}")
+            finally:
+                with self._lock:
+                    self._busy.discard(key)
+
+        threading.Thread(target=worker, name=f'detection-log-{key}', daemon=True).start()
+        return True
+
+    def maybe_compact(self, date):
+        """ Start a background compaction once a partition has enough tombstones """
+        with self._lock:
+            if len(self._state(date).tombstones) < self.compact_threshold:
+                return False
+        if os.path.exists(self._gz_path(date)):
+            return self._run_in_background(f'seal-{date}', self.seal, date)
+        return self._run_in_background(f'compact-{date}', self.compact, date)
+
+    def rotate_in_background(self):
+        with self._lock:
+            self._last_rotation = datetime.now().strftime('%Y-%m-%d')
+        return self._run_in_background('rotate', self.rotate)
+
+    def rotate(self):
+        """ Seal partitions older than compress_after_days and delete those past retention_days """
+        today = datetime.now().date()
+        seal_before = (today - timedelta(days=self.compress_after_days)).strftime('%Y-%m-%d')
+        drop_before = (today - timedelta(days=self.retention_days)).strftime('%Y-%m-%d')
+
+        sealed = dropped = 0
+        for date in self.partitions():
+            if date == 'undated':
+                continue
+            if self.retention_days and date < drop_before:
+                self.drop(date)
+                dropped += 1
+            elif date <= seal_before and os.path.exists(self._csv_path(date)):
+                self.seal(date)
+                sealed += 1
+        if sealed or dropped:
+            print(f" Detection log rotated: sealed {sealed}, dropped {dropped} partitions")
+        return sealed, dropped
+
+    def drop(self, date):
+        """ Delete a partition entirely (retention) """
+        with self._lock:
+            for path in (self._gz_path(date), self._csv_path(date), self._tombstone_path(date)):
+                if os.path.exists(path):
+                    os.remove(path)
+            self._states.pop(date, None)
+
+    def seal(self, date):
+        """ Apply tombstones and gzip a whole partition. Only used for days that no longer
+            receive appends, so holding the lock just serializes it with marks. """
+        with self._lock:
+            tombstones = set(self._refresh_tombstones(date))
+            tmp_path = self._gz_path(date) + '.tmp'
+            with gzip.open(tmp_path, 'wt', encoding='utf-8', newline='') as out:
+                writer = csv.DictWriter(out, fieldnames=LOG_FIELDS, extrasaction='ignore')
+                writer.writeheader()
+                for reader in self._partition_readers(date):
+                    with reader:
+                        for row in csv.DictReader(reader):
+                            eid = row_id(row)
+                            if eid not in tombstones:
+                                row['entry_id'] = eid
+                                writer.writerow(row)
+            with open(tmp_path, 'rb') as f:
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._gz_path(date))
+            for path in (self._csv_path(date), self._tombstone_path(date)):
+                if os.path.exists(path):
+                    os.remove(path)
+            self._states.pop(date, None)
+
+    def compact(self, date):
+        """ Rewrite an open partition without tombstoned rows and drop the applied tombstones """
+        path = self._csv_path(date)
+
+        # 1) Snapshot: everything up to end_pos is filtered against this tombstone set
+        with self._lock:
+            applied = set(self._refresh_tombstones(date))
+            end_pos = os.path.getsize(path) if os.path.exists(path) else 0
+        if not applied or not end_pos:
+            return 0
+
+        # 2) Filter the snapshot without holding the lock (appends keep going)
+        tmp_path = path + '.compact'
+        removed = 0
+        with open(path, 'rb') as src, open(tmp_path, 'wb') as dst:
+            columns = None
+            for offset, raw in _iter_records(src):
+                if offset >= end_pos:
+                    break
+                values = _parse_record(raw)
+                if columns is None:
+                    columns = values
+                    dst.write(raw)
+                    continue
+                if row_id(dict(zip(columns, values))) in applied:
+                    removed += 1
+                    continue
+                dst.write(raw)
+
+            # 3) Copy rows appended meanwhile, then swap files atomically
+            with self._lock:
+                src.seek(end_pos)
+                dst.write(src.read())
+                dst.flush()
+                os.fsync(dst.fileno())
+                os.replace(tmp_path, path)
+
+                # Keep only tombstones that arrived after the snapshot (swapped in like the
+                # partition: a crash leaves either the old or the new tombstone file)
+                remaining = {eid: marked_at for eid, marked_at in self._refresh_tombstones(date).items()
+                             if eid not in applied}
+                tombstone_path = self._tombstone_path(date)
+                with open(tombstone_path + '.compact', 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(TOMBSTONE_FIELDS)
+                    for eid, marked_at in remaining.items():
+                        writer.writerow([eid, marked_at])
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tombstone_path + '.compact', tombstone_path)
+
+                # Offsets changed - rebuild this partition's state lazily
+                self._states.pop(date, None)
+
+        print(f" Detection log {date} compacted: removed {removed} false positive rows")
+        return removed
+
+    # ------------------------------------------------------------
+    # Migration from the single-file log
+    # ------------------------------------------------------------
+    def migrate_legacy(self, legacy_file, legacy_tombstone_file=None):
+        """ Split a single-file Malicious_log.csv into day partitions (once).
+            The legacy file is renamed to <name>.migrated afterwards. """
+        if not os.path.exists(legacy_file):
+            return 0
+
+        # Tombstones written by the previous single-file log (plain row hashes)
+        legacy_tombstones = set()
+        if legacy_tombstone_file and os.path.exists(legacy_tombstone_file):
+            with open(legacy_tombstone_file, 'r', encoding='utf-8', newline='') as f:
+                legacy_tombstones = {row['entry_id'] for row in csv.DictReader(f) if row.get('entry_id')}
+
+        migrated = 0
+        with self._lock:
+            writers = {}
+            handles = []
+            try:
+                with open(legacy_file, 'r', encoding='utf-8', newline='') as f:
+                    for row in csv.DictReader(f):
+                        if _row_hash(row.get('timestamp', ''), row.get('url', '')) in legacy_tombstones:
+                            continue
+                        date = partition_date(row.get('timestamp'))
+                        writer = writers.get(date)
+                        if writer is None:
+                            path = self._csv_path(date)
+                            new_file = not os.path.exists(path)
+                            handle = open(path, 'a', newline='', encoding='utf-8')
+                            handles.append(handle)
+                            writer = writers[date] = csv.DictWriter(handle, fieldnames=LOG_FIELDS, extrasaction='ignore')
+                            if new_file:
+                                writer.writeheader()
+                        writer.writerow(row)
+                        migrated += 1
+            finally:
+                for handle in handles:
+                    handle.close()
+
+            os.replace(legacy_file, legacy_file + '.migrated')
+            if legacy_tombstone_file and os.path.exists(legacy_tombstone_file):
+                os.replace(legacy_tombstone_file, legacy_tombstone_file + '.migrated')
+
+        print(f" Migrated {migrated} detections from {os.path.basename(legacy_file)} into day partitions")
+        return migrated
@@ -0,0 +1,135 @@
+#html_archive.py
+import os
+import re
+import csv
+import gzip
+import hashlib
+import tempfile
+
+_HASH_RE = re.compile(r'^[0-9a-f]{64}$')
+LEGACY_MAP_FILE = 'legacy_html_map.csv'
+
+
+class HtmlArchive:
+    """
+    Content-addressed, compressed store for captured HTML pages.
+
+    Every page is stored once under the SHA-256 of its UTF-8 bytes as
+    <root>/<hash[:2]>/<hash>.html.gz, so identical phishing kits captured
+    again and again cost no extra space, and the two-character fan-out keeps
+    every directory small enough to list and back up quickly. Pages are
+    written to a temporary file and renamed into place, so a reader never
+    sees a partial page.
+    """
+
+    def __init__(self, root, compresslevel=6):
+        self.root = root
+        self.compresslevel = compresslevel
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, page_hash):
+        if not _HASH_RE.match(page_hash or ''):
+            raise ValueError(f"Invalid page hash: {page_hash!r}")
+        return os.path.join(self.root, page_hash[:2], f"{page_hash}.html.gz")
+
+    def __contains__(self, page_hash):
+        try:
+            return os.path.exists(self.path(page_hash))
+        except ValueError:
+            return False
+
+    def put(self, html):
+        """ Store a page (str or bytes) and return its hash. Already stored pages are not rewritten. """
+        data = html.encode('utf-8', errors='replace') if isinstance(html, str) else html
+        page_hash = hashlib.sha256(data).hexdigest()
+        path = self.path(page_hash)
+        if os.path.exists(path):
+            return page_hash
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=self.compresslevel, mtime=0) as gz:
+                gz.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return page_hash
+
+    def open(self, page_hash):
+        """ Open a stored page for streaming reads (text, decompressed on the fly) """
+        return gzip.open(self.path(page_hash), 'rt', encoding='utf-8', errors='replace')
+
+    def iter_chunks(self, page_hash, chunk_size=64 * 1024):
+        """ Yield the page in decompressed text chunks (for streaming HTTP responses) """
+        with self.open(page_hash) as f:
+            for chunk in iter(lambda: f.read(chunk_size), ''):
+                yield chunk
+
+    def read(self, page_hash):
+        with self.open(page_hash) as f:
+            return f.read()
+
+    def hashes(self):
+        """ Yield the hashes of all stored pages """
+        for fan_out in sorted(os.listdir(self.root)):
+            sub_dir = os.path.join(self.root, fan_out)
+            if len(fan_out) != 2 or not os.path.isdir(sub_dir):
+                continue
+            for name in sorted(os.listdir(sub_dir)):
+                if name.endswith('.html.gz'):
+                    yield name[:-len('.html.gz')]
+
+    def iter_pages(self):
+        """ Yield (hash, html) for every stored page, one page in memory at a time (e.g. for retraining) """
+        for page_hash in self.hashes():
+            yield page_hash, self.read(page_hash)
+
+    def legacy_files(self):
+        """ Legacy <uuid>.html files still in the archive root """
+        return [name for name in sorted(os.listdir(self.root))
+                if name.endswith('.html') and os.path.isfile(os.path.join(self.root, name))]
+
+    def migrate_legacy(self):
+        """ Move legacy <uuid>.html files from the archive root into the store (one-off,
+            run this module). Each uuid -> hash pair is appended to legacy_html_map.csv
+            before its file is removed. Returns {uuid: hash}. """
+        mapping = {}
+        names = self.legacy_files()
+        if not names:
+            return mapping
+
+        map_path = os.path.join(self.root, LEGACY_MAP_FILE)
+        new_file = not os.path.exists(map_path)
+        with open(map_path, 'a', newline='', encoding='utf-8') as map_file:
+            writer = csv.writer(map_file)
+            if new_file:
+                writer.writerow(['uuid', 'html_hash'])
+            for name in names:
+                path = os.path.join(self.root, name)
+                with open(path, 'rb') as f:
+                    page_hash = self.put(f.read())
+                uuid = name[:-len('.html')]
+                writer.writerow([uuid, page_hash])
+                map_file.flush()
+                os.fsync(map_file.fileno())
+                mapping[uuid] = page_hash
+                os.remove(path)
+        print(f" Archived {len(mapping)} legacy HTML files into {len(set(mapping.values()))} unique pages "
+              f"(uuid -> hash in {LEGACY_MAP_FILE})")
+        return mapping
+
+
+if __name__ == "__main__":
+    # One-off migration of the legacy <uuid>.html files, then a summary of the store
+    archive = HtmlArchive(os.path.join(os.path.dirname(__file__), '..', 'HTML_logs', 'html_logs'))
+    archive.migrate_legacy()
+
+    count = 0
+    stored_bytes = 0
+    for page_hash in archive.hashes():
+        count += 1
+        stored_bytes += os.path.getsize(archive.path(page_hash))
+    print(f" {count} unique pages, {stored_bytes / 1024:.1f} KB compressed")
@@ -0,0 +1,151 @@
+#sampling_profiler.py
+import os
+import sys
+import json
+import time
+import threading
+from collections import Counter
+
+# Leaf frames of threads that are only waiting (server accept loop, idle workers,
+# queue consumers); dropped by default so the profile shows where CPU goes
+_IDLE_LEAVES = {
+    ('threading.py', 'wait'), ('threading.py', '_wait_for_tstate_lock'), ('threading.py', 'join'),
+    ('selectors.py', 'select'), ('socketserver.py', 'serve_forever'), ('socket.py', 'accept'),
+    ('queue.py', 'get'), ('socket.py', 'readinto'), ('ssl.py', 'read'),
+}
+
+
+class SamplingProfiler:
+    """
+    Low-overhead statistical profiler for a running server.
+
+    A daemon thread wakes up every interval, reads the current Python stack
+    of every other thread (sys._current_frames) and counts identical stacks.
+    It never touches the sampled threads, so it cannot change what they do;
+    the cost is one stack walk per thread per interval on the sampler thread.
+
+    The result is written in the collapsed-stack format used by flamegraph.pl
+    and speedscope ("frame;frame;frame count" per line), with frames labelled
+    file.py:function so time is attributed to e.g. Feature_Extractor.py:extract.
+    A JSON summary next to it lists the project functions with the most
+    inclusive and self samples.
+    """
+
+    def __init__(self, output_dir, project_dir=None, max_seconds=300):
+        self.output_dir = output_dir
+        self.project_dir = os.path.abspath(project_dir) if project_dir else None
+        self.max_seconds = max_seconds
+        self._lock = threading.Lock()
+        self._thread = None
+        self.status = {'running': False, 'last': None}
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, seconds=30, interval=0.01, include_idle=False):
+        """ Start sampling in the background. Returns the output path, or None if a run is in progress. """
+        seconds = max(0.1, min(float(seconds), self.max_seconds))
+        interval = max(0.001, float(interval))
+        with self._lock:
+            if self.running:
+                return None
+            os.makedirs(self.output_dir, exist_ok=True)
+            path = os.path.join(self.output_dir, f"profile_{time.strftime('%Y%m%d_%H%M%S')}.folded")
+            self.status = {'running': True, 'output': path, 'seconds': seconds, 'interval': interval,
+                           'started_at': time.strftime('%Y-%m-%d %H:%M:%S'), 'last': self.status.get('last')}
+            self._thread = threading.Thread(target=self._run, args=(path, seconds, interval, include_idle),
+                                            name='sampling-profiler', daemon=True)
+            self._thread.start()
+        return path
+
+    def _label(self, code):
+        return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+    def _is_project(self, code):
+        return self.project_dir is not None and os.path.abspath(code.co_filename).startswith(self.project_dir)
+
+    def _run(self, path, seconds, interval, include_idle):
+        try:
+            summary = self._sample(path, seconds, interval, include_idle)
+        except Exception as e:
+            summary = {'output': path, 'error': str(e)}
+            print(f" Profiling failed: {e}")
+        with self._lock:
+            self.status = {'running': False, 'last': summary}
+
+    def _sample(self, path, seconds, interval, include_idle):
+        stacks = Counter()
+        project_codes = {}
+        own_id = threading.get_ident()
+        names = {}
+        samples = 0
+
+        deadline = time.perf_counter() + seconds
+        next_tick = time.perf_counter()
+        while time.perf_counter() < deadline:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                codes = []
+                while frame is not None:
+                    codes.append(frame.f_code)
+                    frame = frame.f_back
+                if not codes:
+                    continue
+                leaf = codes[0]
+                if not include_idle and (os.path.basename(leaf.co_filename), leaf.co_name) in _IDLE_LEAVES:
+                    continue
+                codes.reverse()
+                stacks[tuple(codes)] += 1
+                samples += 1
+            next_tick += interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()   # fell behind; don't burst
+
+        # Collapsed stacks (labels resolved once per distinct stack, not per sample)
+        inclusive = Counter()
+        self_samples = Counter()
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            for codes, count in stacks.most_common():
+                labels = [names.get(code) or names.setdefault(code, self._label(code)) for code in codes]
+                f.write(';'.join(labels) + f" {count}\n")
+                seen = set()
+                for code in codes:
+                    if code in seen or not self._is_project(code):
+                        continue
+                    seen.add(code)
+                    project_codes[names[code]] = code
+                    inclusive[names[code]] += count
+                # Self time goes to the innermost project frame (library calls count towards their caller)
+                for code in reversed(codes):
+                    if self._is_project(code):
+                        self_samples[names[code]] += count
+                        break
+        os.replace(path + '.tmp', path)
+
+        summary = {
+            'output': path,
+            'seconds': seconds,
+            'interval': interval,
+            'samples': samples,
+            'distinct_stacks': len(stacks),
+            'top_inclusive': [
+                {'function': name, 'samples': count, 'share': round(count / samples, 4) if samples else 0.0,
+                 'file': os.path.relpath(project_codes[name].co_filename, self.project_dir),
+                 'line': project_codes[name].co_firstlineno}
+                for name, count in inclusive.most_common(25)
+            ],
+            'top_self': [
+                {'function': name, 'samples': count, 'share': round(count / samples, 4) if samples else 0.0}
+                for name, count in self_samples.most_common(25)
+            ],
+        }
+        with open(path.replace('.folded', '.summary.json'), 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+
+        print(f" Profile written: {path} ({samples} samples, {len(stacks)} distinct stacks)")
+        return summary
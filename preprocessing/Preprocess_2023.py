@@ -1,14 +1,159 @@
 #Preprocess_2023.py
 import pandas as pd
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from streaming import iter_csv_chunks, fingerprints, canonical_values, FingerprintSet, BucketShuffler
+from dataset_io import DatasetHistory
+
+parser = argparse.ArgumentParser(description="Clean Dataset2023.csv")
+parser.add_argument('--stream', action='store_true',
+                    help="Process the CSV in chunks with bounded memory (for datasets larger than RAM)")
+parser.add_argument('--chunksize', type=int, default=100_000, help="Rows per chunk in --stream mode")
+parser.add_argument('--bucket-mb', type=int, default=256,
+                    help="Approximate size of each shuffle bucket in --stream mode")
+parser.add_argument('--force', action='store_true', help="Clean again even if the history says this file is already clean")
+args = parser.parse_args()
+if args.bucket_mb < 1:
+    parser.error("--bucket-mb must be at least 1")
+
+DATASET_PATH = "datasets/dataset_2023/Dataset2023.csv"
+STEP = "preprocess_2023"
+
+LABEL_MAPPING = {
+    'Legitimate': 0,
+    'legitimate': 0,
+    'Safe': 0,
+    'safe': 0,
+    'Phishing': 1,
+    'phishing': 1,
+    'Malicious': 1,
+    'malicious': 1
+}
+
+minimal_drop_cols = [
+    # dataset metadata
+    "FILENAME", "filename",
+    # direct leakage label-like scores
+    "LikelinessIndex",
+    "WAPLegitimate",
+    "WAPPhishing",
+    "URLSimilarityIndex",
+    "URLSimilarity",
+    "URLSimilarityScore",
+    "URLCharProb",
+    "URLCharProbScore",
+    "DomainSimilarity",
+    "IsUnreachable"
+]
 
 print("\n========================================")
 print("  PREPROCESSING — Dataset 2023 Cleaner")
 print("========================================\n")
 
+
+def stream_clean(history, chunksize, bucket_bytes):
+    """
+    Same cleaning as below, one chunk at a time. Duplicate URLs and rows are
+    detected with 64-bit fingerprints (8 bytes per distinct URL / row), and the
+    shuffle goes through hash buckets on disk, so memory is bounded by the chunk
+    and bucket size instead of the dataset size. Rows are compared by parsed
+    value, like drop_duplicates() below (see canonical_values()), and written as read.
+    """
+    path = history.dataset_path
+    seen_urls, seen_rows = FingerprintSet(), FingerprintSet()
+    stats = {'rows': 0, 'bad_labels': 0, 'url_dupes': 0, 'row_dupes': 0}
+    label_counts = {0: 0, 1: 0}
+    non_empty = None
+    shuffler = None
+
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(path))) as tmp_dir:
+        for chunk in iter_csv_chunks(path, chunksize, encoding="utf-8"):
+            stats['rows'] += len(chunk)
+            chunk.columns = chunk.columns.str.strip().str.replace(r"\s+", "", regex=True)
+            chunk = chunk.loc[:, ~chunk.columns.duplicated()]
+            if "label" not in chunk.columns:
+                raise ValueError(" ERROR: 'label' column not found in dataset!")
+
+            # Columns empty in every chunk are dropped when the output is written
+            has_values = chunk.notna().any()
+            non_empty = has_values if non_empty is None else (non_empty | has_values)
+
+            # Labels: names -> 0/1, anything else dropped
+            labels = chunk["label"].str.strip()
+            labels = labels.map(LABEL_MAPPING).fillna(pd.to_numeric(labels, errors="coerce"))
+            valid = labels.notna()
+            stats['bad_labels'] += int((~valid).sum())
+            chunk = chunk[valid].copy()
+            chunk["label"] = labels[valid].astype(int).astype(str)
+            if not set(chunk["label"].unique()).issubset({"0", "1"}):
+                raise ValueError(" ERROR: Labels must be 0 or 1!")
+
+            # Duplicate URLs, then fully identical rows (first occurrence in the stream wins)
+            url_col = next((c for c in chunk.columns if c.lower() in ["url", "link", "uri"]), None)
+            if url_col:
+                url_hashes = fingerprints(chunk[url_col])
+                keep = seen_urls.first_seen(url_hashes)
+                seen_urls.add(url_hashes)
+                stats['url_dupes'] += int((~keep).sum())
+                chunk = chunk[keep]
+            row_hashes = fingerprints(canonical_values(chunk))
+            keep = seen_rows.first_seen(row_hashes)
+            seen_rows.add(row_hashes)
+            stats['row_dupes'] += int((~keep).sum())
+            chunk, row_hashes = chunk[keep], row_hashes[keep]
+
+            for label, count in chunk["label"].value_counts().items():
+                label_counts[int(label)] += int(count)
+
+            if shuffler is None:
+                shuffler = BucketShuffler(tmp_dir, BucketShuffler.buckets_for(path, bucket_bytes), chunk.columns)
+                print(f" Columns: {len(chunk.columns)}, shuffle buckets: {shuffler.n_buckets}")
+            shuffler.add(chunk, row_hashes)
+            print(f"   {stats['rows']:,} rows read, {shuffler.rows:,} kept")
+
+        if shuffler is None:
+            raise ValueError(" ERROR: dataset is empty!")
+
+        columns = [c for c in shuffler.columns if non_empty.get(c, False) and c not in minimal_drop_cols]
+        dropped = [c for c in shuffler.columns if c not in columns]
+        written = shuffler.write(history.tmp_path, columns)
+    history.commit(STEP, mode='stream', rows_read=stats['rows'], rows=written, columns=len(columns))
+
+    print(f"\n Rows read:              {stats['rows']:,}")
+    print(f" Invalid labels dropped: {stats['bad_labels']:,}")
+    print(f" Duplicate URLs removed: {stats['url_dupes']:,}")
+    print(f" Duplicate rows removed: {stats['row_dupes']:,}")
+    print(f" Columns dropped:        {dropped}")
+    print(f" Fingerprint memory:     {(seen_urls.nbytes + seen_rows.nbytes) / 1024 / 1024:.1f} MB")
+    print("\n========================================")
+    print("  CLEANING COMPLETE")
+    print("========================================")
+    print(f"New shape: ({written}, {len(columns)})")
+    print(f"Final labels: 0={label_counts[0]}, 1={label_counts[1]}")
+    print(" Cleaned dataset successfully!\n")
+
+
+# The cleaned file replaces the dataset only once it is completely written
+# (see dataset_io.py); a file this script already cleaned is left alone
+history = DatasetHistory(DATASET_PATH)
+previous = history.applied(STEP)
+if previous and not args.force:
+    print(f" Already cleaned on {previous['date']} (sha256 {previous['output_sha256'][:12]}) - nothing to do")
+    print(" Use --force to clean it again")
+    sys.exit(0)
+
+if args.stream:
+    stream_clean(history, args.chunksize, args.bucket_mb * 1024 * 1024)
+    sys.exit(0)
+
 # ---------------------------------------------------
 # 1) Load dataset
 # ---------------------------------------------------
-df = pd.read_csv("datasets/dataset_2023/Dataset2023.csv", encoding="utf-8", low_memory=False)
+df = pd.read_csv(DATASET_PATH, encoding="utf-8", low_memory=False)
 
 print(" Original shape:", df.shape)
 print(" Original columns:", len(df.columns))
@@ -59,18 +204,7 @@ if df["label"].dtype == 'object':
     print(f"   Current labels: {sample_labels}")
     
     # Map to standard format: 0=Legitimate, 1=Phishing
-    label_mapping = {
-        'Legitimate': 0,
-        'legitimate': 0,
-        'Safe': 0,
-        'safe': 0,
-        'Phishing': 1,
-        'phishing': 1,
-        'Malicious': 1,
-        'malicious': 1
-    }
-    
-    df["label"] = df["label"].map(label_mapping)
+    df["label"] = df["label"].map(LABEL_MAPPING)
     
     if df["label"].isna().any():
         unmapped = df[df["label"].isna()]['label'].unique()
@@ -141,22 +275,6 @@ df = df.drop_duplicates()
 row_dupes_after = df.duplicated().sum()
 print(f" Duplicate rows after cleaning: {row_dupes_after}")
 
-minimal_drop_cols = [
-    # dataset metadata
-    "FILENAME", "filename",
-    # direct leakage label-like scores
-    "LikelinessIndex",
-    "WAPLegitimate",
-    "WAPPhishing",
-    "URLSimilarityIndex",
-    "URLSimilarity",
-    "URLSimilarityScore",
-    "URLCharProb",
-    "URLCharProbScore",
-    "DomainSimilarity",
-    "IsUnreachable"
-]
-
 # keep only the columns that exist before dropping (safe)
 to_drop = [c for c in minimal_drop_cols if c in df.columns]
 if to_drop:
@@ -175,7 +293,8 @@ df = df.sample(frac=1, random_state=42).reset_index(drop=True)
 # ---------------------------------------------------
 # 10) Save cleaned dataset
 # ---------------------------------------------------
-df.to_csv("datasets/dataset_2023/Dataset2023.csv", index=False, encoding="utf-8")
+df.to_csv(history.tmp_path, index=False, encoding="utf-8")
+history.commit(STEP, mode='memory', rows=len(df), columns=len(df.columns))
 
 print("\n========================================")
 print("  CLEANING COMPLETE")
@@ -1,6 +1,19 @@
 # Preprocess_2024.py - Clean Dataset_2024.csv
 import pandas as pd
+import argparse
 import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from streaming import iter_csv_chunks, fingerprints, canonical_values, FingerprintSet
+from dataset_io import DatasetHistory
+
+parser = argparse.ArgumentParser(description="Clean Dataset_2024.csv")
+parser.add_argument('--stream', action='store_true',
+                    help="Process the CSV in chunks with bounded memory (for datasets larger than RAM)")
+parser.add_argument('--chunksize', type=int, default=100_000, help="Rows per chunk in --stream mode")
+parser.add_argument('--force', action='store_true', help="Clean again even if the history says this file is already clean")
+args = parser.parse_args()
 
 print("\n" + "="*70)
 print("  DATASET 2024 PREPROCESSING")
@@ -8,6 +21,7 @@ print("="*70)
 
 # Path to dataset
 csv_path = "datasets/dataset_2024/Dataset_2024.csv"
+STEP = "preprocess_2024"
 
 # Check if file exists
 if not os.path.exists(csv_path):
@@ -15,6 +29,95 @@ if not os.path.exists(csv_path):
     print(f"   Please make sure the file is in: {os.path.abspath(csv_path)}")
     exit(1)
 
+
+def stream_clean(history, chunksize):
+    """
+    Same cleaning as below, one chunk at a time: duplicate rows and URLs are
+    detected with 64-bit fingerprints (8 bytes per distinct row / URL) instead
+    of holding the dataset in memory. Rows are compared by parsed value, like
+    drop_duplicates() below (see canonical_values()), and written as read.
+    """
+    path = history.dataset_path
+    seen_rows, seen_urls = FingerprintSet(), FingerprintSet()
+    stats = {'rows': 0, 'missing_urls': 0, 'row_dupes': 0, 'url_dupes': 0, 'written': 0}
+    label_counts = {}
+    url_col = label_col = None
+    first_chunk = True
+
+    for chunk in iter_csv_chunks(path, chunksize):
+        if url_col is None:
+            url_col = next((c for c in chunk.columns if 'url' in c.lower()), None)
+            label_col = next((c for c in chunk.columns
+                              if 'label' in c.lower() or 'class' in c.lower() or 'type' in c.lower()), None)
+            if url_col is None:
+                print(f" ERROR: No URL column found!")
+                print(f"   Available columns: {list(chunk.columns)}")
+                exit(1)
+            print(f" URL column: '{url_col}'")
+            print(f" Label column: '{label_col}'" if label_col else "  No label column found - will keep all columns")
+        stats['rows'] += len(chunk)
+
+        # Missing / empty URLs
+        chunk[url_col] = chunk[url_col].str.strip()
+        has_url = chunk[url_col].notna() & (chunk[url_col] != '')
+        stats['missing_urls'] += int((~has_url).sum())
+        chunk = chunk[has_url]
+
+        # Duplicate rows, then duplicate URLs (first occurrence in the stream wins)
+        row_hashes = fingerprints(canonical_values(chunk))
+        keep = seen_rows.first_seen(row_hashes)
+        seen_rows.add(row_hashes)
+        stats['row_dupes'] += int((~keep).sum())
+        chunk = chunk[keep]
+
+        url_hashes = fingerprints(chunk[url_col])
+        keep = seen_urls.first_seen(url_hashes)
+        seen_urls.add(url_hashes)
+        stats['url_dupes'] += int((~keep).sum())
+        chunk = chunk[keep]
+
+        if label_col:
+            for label, count in chunk[label_col].value_counts().items():
+                label_counts[label] = label_counts.get(label, 0) + int(count)
+        # The first chunk always writes the header, so the output exists even if every row is dropped
+        chunk.to_csv(history.tmp_path, mode='w' if first_chunk else 'a', header=first_chunk, index=False)
+        first_chunk = False
+        stats['written'] += len(chunk)
+        print(f"   {stats['rows']:,} rows read, {stats['written']:,} kept")
+
+    history.commit(STEP, mode='stream', rows_read=stats['rows'], rows=stats['written'])
+
+    print(f"\n Final Dataset Statistics:")
+    print(f"   Rows read: {stats['rows']:,}")
+    print(f"   Removed {stats['missing_urls']:,} rows with missing or empty URLs")
+    print(f"   Duplicate rows removed: {stats['row_dupes']:,}")
+    print(f"   Duplicate URLs removed: {stats['url_dupes']:,}")
+    print(f"   Total rows: {stats['written']:,}")
+    print(f"   Fingerprint memory: {(seen_rows.nbytes + seen_urls.nbytes) / 1024**2:.2f} MB")
+    if label_counts:
+        print(f"\n  Label Distribution:")
+        for label, count in sorted(label_counts.items()):
+            print(f"   {label}: {count} ({count/max(1, stats['written'])*100:.2f}%)")
+
+    print(f"\n" + "="*70)
+    print("  PREPROCESSING COMPLETE!")
+    print("="*70)
+    print(f"\n File updated: {os.path.abspath(path)}")
+
+
+# The cleaned file replaces the dataset only once it is completely written
+# (see dataset_io.py); a file this script already cleaned is left alone
+history = DatasetHistory(csv_path)
+previous = history.applied(STEP)
+if previous and not args.force:
+    print(f"\n Already cleaned on {previous['date']} (sha256 {previous['output_sha256'][:12]}) - nothing to do")
+    print(" Use --force to clean it again")
+    sys.exit(0)
+
+if args.stream:
+    stream_clean(history, args.chunksize)
+    sys.exit(0)
+
 # ========================================================
 # 1. Load the dataset
 # ========================================================
@@ -134,7 +237,8 @@ if label_col and label_col in df.columns:
 # 8. Save cleaned dataset (OVERWRITE original)
 # ========================================================
 print(f"\n Overwriting original file: {csv_path}")
-df.to_csv(csv_path, index=False)
+df.to_csv(history.tmp_path, index=False)
+history.commit(STEP, mode='memory', rows=len(df))
 
 print(f" Saved: {len(df)} rows, {len(df.columns)} columns")
 
@@ -0,0 +1,143 @@
+#dataset_io.py
+# Crash-safe dataset rewrites with a content-hash history.
+#
+# The preprocessing scripts rewrite their dataset in place. Writing straight
+# over the CSV means a crash (or Ctrl+C) mid-write leaves a truncated file and
+# no original. Instead every step writes <dataset>.tmp, fsyncs it, and only
+# then renames it over the dataset - a rename is atomic, so the dataset is
+# always either the old or the new version.
+#
+# Every rewrite is also recorded in <dataset>.history.json with the SHA-256 of
+# its input and output. A step finds out from the history whether it already
+# ran on the current file, so re-runs are no-ops - which matters for steps
+# that are not idempotent themselves, like the Dataset 2023 label inversion.
+import hashlib
+import json
+import os
+from datetime import datetime
+
+
+def file_sha256(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def fsync_file(path):
+    with open(path, 'rb') as f:
+        os.fsync(f.fileno())
+
+
+def fsync_dir(path):
+    """ Make a rename in this directory durable (no-op where directories can't be opened) """
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_json_atomic(path, data):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    fsync_dir(path)
+
+
+class DatasetHistory:
+    """
+    The rewrites applied to one dataset file, oldest first:
+        {'step', 'date', 'input_sha256', 'output_sha256', 'output_size', 'output_mtime_ns', ...details}
+
+    On load the history is checked against the file on disk:
+      - the file is the output of the last entry: the history is valid
+      - the file is the input of the last entry: the run crashed after recording
+        but before the rename, so that entry never happened and is dropped
+      - anything else: the file was replaced outside these scripts (e.g. a fresh
+        download), so the old history no longer describes it and is ignored
+
+    Hashing a multi-GB file takes a few seconds, so the file is only hashed when
+    its size or mtime differ from what the last entry recorded.
+    """
+
+    def __init__(self, dataset_path):
+        self.dataset_path = dataset_path
+        self.log_path = dataset_path + '.history.json'
+        self.tmp_path = dataset_path + '.tmp'
+        self.entries = []
+        self.current_sha256 = None
+
+        entries = []
+        if os.path.exists(self.log_path):
+            with open(self.log_path) as f:
+                entries = json.load(f).get('entries', [])
+
+        if entries:
+            last = entries[-1]
+            stat = os.stat(dataset_path)
+            if stat.st_size == last.get('output_size') and stat.st_mtime_ns == last.get('output_mtime_ns'):
+                self.current_sha256 = last['output_sha256']
+            else:
+                self.current_sha256 = file_sha256(dataset_path)
+
+            if self.current_sha256 == last['output_sha256']:
+                self.entries = entries
+            elif self.current_sha256 == last['input_sha256']:
+                print(f" Note: last '{last['step']}' run did not finish - the dataset was left unchanged")
+                self.entries = entries[:-1]
+            else:
+                print(f" Note: {dataset_path} changed outside the pipeline - previous history ignored")
+        else:
+            self.current_sha256 = file_sha256(dataset_path)
+
+        # A leftover temporary file is a crashed run's partial output
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+    def applied(self, step):
+        """ The most recent entry of step in the current file's history, or None """
+        for entry in reversed(self.entries):
+            if entry['step'] == step:
+                return entry
+        return None
+
+    def commit(self, step, **details):
+        """
+        Replace the dataset with tmp_path (written by the caller) and record it.
+
+        The entry is recorded before the rename: if the process dies in between,
+        the next load sees the dataset still matching the entry's input and drops it.
+        """
+        fsync_file(self.tmp_path)
+        stat = os.stat(self.tmp_path)
+        entry = {
+            'step': step,
+            'date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'input_sha256': self.current_sha256,
+            'output_sha256': file_sha256(self.tmp_path),
+            'output_size': stat.st_size,
+            'output_mtime_ns': stat.st_mtime_ns,
+            **details,
+        }
+        self.entries.append(entry)
+        write_json_atomic(self.log_path, {'dataset': os.path.basename(self.dataset_path), 'entries': self.entries})
+
+        os.replace(self.tmp_path, self.dataset_path)
+        fsync_dir(self.dataset_path)
+        self.current_sha256 = entry['output_sha256']
+        return entry
+
+    def discard(self):
+        """ Remove a partial temporary output (after an error) """
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
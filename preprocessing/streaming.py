@@ -0,0 +1,132 @@
+#streaming.py
+# Building blocks for preprocessing datasets that don't fit in memory:
+# the CSV is read in chunks, duplicates are found with 64-bit fingerprints
+# instead of keeping the rows, and rows are shuffled through bucket files on disk.
+import os
+import math
+import numpy as np
+import pandas as pd
+
+
+def iter_csv_chunks(path, chunksize, **kwargs):
+    """ Read a CSV in chunks with every column as text, so the same row always
+        has the same values (and fingerprint) whichever chunk it lands in """
+    return pd.read_csv(path, chunksize=chunksize, dtype=str, **kwargs)
+
+
+def fingerprints(values):
+    """ 64-bit hash of every row of a DataFrame (all columns) or Series """
+    return pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+
+
+def canonical_values(frame):
+    """
+    Chunks are read as text, but the in-memory scripts compare parsed values, for
+    which "1", "1.0" and "1e0" are the same number. Every value that parses as a
+    number is replaced by one spelling (repr of the float) so fingerprints of the
+    result find the same duplicate rows. Only for hashing - the rows written keep
+    their original text.
+
+    Not covered: a column that also holds text is kept as text by read_csv, so
+    there "1" and "1.0" stay different in memory but not here; integers above
+    2^53 are compared as floats.
+    """
+    columns = {}
+    for name in frame.columns:
+        values = frame[name]
+        numbers = pd.to_numeric(values, errors='coerce')
+        is_number = numbers.notna()
+        if is_number.any():
+            values = values.where(~is_number, numbers[is_number].astype(np.float64).map(repr))
+        columns[name] = values
+    return pd.DataFrame(columns, index=frame.index)
+
+
+class FingerprintSet:
+    """
+    Set of 64-bit fingerprints in one sorted NumPy array: 8 bytes per distinct
+    value instead of the row itself (or ~70 bytes for a Python int in a set).
+
+    With 64-bit hashes the chance of any false duplicate among n distinct
+    values is about n^2 / 2^65 - below 1e-5 for 10 million rows.
+    """
+
+    def __init__(self):
+        self._values = np.empty(0, dtype=np.uint64)
+
+    def __len__(self):
+        return len(self._values)
+
+    @property
+    def nbytes(self):
+        return self._values.nbytes
+
+    def contains(self, hashes):
+        """ Boolean mask: which hashes are already in the set """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if not len(self._values):
+            return np.zeros(len(hashes), dtype=bool)
+        pos = np.searchsorted(self._values, hashes)
+        pos[pos == len(self._values)] = 0
+        return self._values[pos] == hashes
+
+    def first_seen(self, hashes):
+        """ Boolean mask of the hashes seen for the first time (not in the set and
+            not earlier in this batch) - like ~duplicated(keep='first') over the stream """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        new = ~self.contains(hashes)
+        _, first_index = np.unique(hashes, return_index=True)
+        first_in_batch = np.zeros(len(hashes), dtype=bool)
+        first_in_batch[first_index] = True
+        return new & first_in_batch
+
+    def add(self, hashes):
+        hashes = np.unique(np.asarray(hashes, dtype=np.uint64))
+        hashes = hashes[~self.contains(hashes)]
+        if len(hashes):
+            # Both parts are sorted; a stable sort merges the two runs in linear time
+            self._values = np.sort(np.concatenate([self._values, hashes]), kind='stable')
+
+
+class BucketShuffler:
+    """
+    External shuffle: rows are appended to n_buckets files on disk by a hash
+    of their key, then each bucket is read back alone, shuffled in memory and
+    appended to the output. Keys hash to buckets independently of the input
+    order, so the output order is random; peak memory is one bucket.
+    """
+
+    def __init__(self, tmp_dir, n_buckets, columns, seed=42):
+        self.tmp_dir = tmp_dir
+        self.n_buckets = max(1, int(n_buckets))
+        self.columns = list(columns)
+        self.seed = seed
+        self.rows = 0
+        self._paths = [os.path.join(tmp_dir, f"bucket_{i:04d}.csv") for i in range(self.n_buckets)]
+
+    @staticmethod
+    def buckets_for(path, bucket_bytes):
+        """ Enough buckets that each holds about bucket_bytes (at least 1 MB) of the input file """
+        return max(1, math.ceil(os.path.getsize(path) / max(bucket_bytes, 1024 * 1024)))
+
+    def add(self, chunk, keys):
+        buckets = np.asarray(keys, dtype=np.uint64) % np.uint64(self.n_buckets)
+        for bucket, rows in chunk[self.columns].groupby(buckets, sort=False):
+            rows.to_csv(self._paths[int(bucket)], mode='a', header=False, index=False, encoding='utf-8')
+        self.rows += len(chunk)
+
+    def write(self, output_path, columns=None):
+        """ Write all buckets, each shuffled, to output_path (with header); returns the row count """
+        columns = list(columns or self.columns)
+        written = 0
+        rng = np.random.default_rng(self.seed)
+        pd.DataFrame(columns=columns).to_csv(output_path, index=False, encoding='utf-8')
+        for path in self._paths:
+            if not os.path.exists(path):
+                continue
+            rows = pd.read_csv(path, header=None, names=self.columns, dtype=str, keep_default_na=False)
+            rows = rows.iloc[rng.permutation(len(rows))]
+            rows[columns].to_csv(output_path, mode='a', header=False, index=False, encoding='utf-8')
+            written += len(rows)
+            os.remove(path)
+        return written
@@ -0,0 +1,276 @@
+import pandas as pd
+import numpy as np
+import joblib
+import pickle
+import argparse
+import copy
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from sklearn.model_selection import train_test_split
+from sklearn.metrics import accuracy_score, f1_score
+import warnings
+
+warnings.filterwarnings('ignore')
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from RuleBased.flat_forest import FlatForest
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from compact_frames import CONTENT_2023_DTYPES, read_compact_csv
+
+# ---------------------------------------------------
+# Post-training step for Model 2023: find the smallest subset of the
+# RandomForest's trees whose accuracy stays within --tolerance of the full
+# forest, and report accuracy vs. tree count, size, load time and latency.
+#
+# The held-out test split of Train_2023.py (same seed) is cut in two halves:
+# trees are chosen on the first half; a subset is only accepted once it is
+# also within tolerance on the second half, so a selection that merely fits
+# the first half's noise is not taken. Reported accuracies are on the second.
+#
+# Usage (from the repository root, after Train_2023.py):
+#   python training/Prune_2023.py                    # writes model_2023_pruned.pkl
+#   python training/Prune_2023.py --tolerance 0.001
+#   python training/Prune_2023.py --install          # pruned model becomes model_2023.pkl
+# ---------------------------------------------------
+parser = argparse.ArgumentParser(description="Prune the Model 2023 RandomForest to a minimal subset of trees")
+parser.add_argument('--dataset', default="datasets/dataset_2023/Dataset2023.csv")
+parser.add_argument('--model-dir', default="Models/model_2023")
+parser.add_argument('--tolerance', type=float, default=0.002, help="Allowed accuracy drop vs. the full forest")
+parser.add_argument('--max-trees', type=int, default=None, help="Stop greedy selection at this many trees")
+parser.add_argument('--install', action='store_true',
+                    help="Replace model_2023.pkl with the pruned model (original kept as model_2023_full.pkl)")
+args = parser.parse_args()
+
+print("\n" + "="*70)
+print("  PRUNING MODEL 2023")
+print("="*70)
+
+# ---------------------------------------------------
+# STEP 1: Load model and data (same split as Train_2023.py)
+# ---------------------------------------------------
+model_path = os.path.join(args.model_dir, "model_2023.pkl")
+full_path = os.path.join(args.model_dir, "model_2023_full.pkl")
+# After --install, model_2023.pkl is the pruned model; always start from the full forest
+rf = joblib.load(full_path if os.path.exists(full_path) else model_path)
+content_features = list(joblib.load(os.path.join(args.model_dir, "features_2023.pkl")))
+print(f"\n Loaded model: {len(rf.estimators_)} trees")
+
+df = read_compact_csv(args.dataset, {name: CONTENT_2023_DTYPES.get(name, 'float32') for name in content_features})
+X = df[content_features]
+y = df['label']
+_, X_test, _, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+X_sel, X_eval, y_sel, y_eval = train_test_split(X_test, y_test, test_size=0.5, random_state=42, stratify=y_test)
+print(f" Selection rows: {len(X_sel)}, evaluation rows: {len(X_eval)}")
+
+positive = rf.classes_[1]
+y_sel = (y_sel.to_numpy() == positive)
+y_eval = (y_eval.to_numpy() == positive)
+
+# ---------------------------------------------------
+# STEP 2: Per-tree probabilities (computed once)
+# ---------------------------------------------------
+print("\n Scoring every tree...")
+flat_full = FlatForest.from_sklearn(rf)
+
+def tree_probabilities(x, chunk=5000):
+    """ P(phishing) of every tree for every row: (n_trees, n_rows) float32 """
+    x = x.to_numpy(dtype=np.float32)
+    parts = [flat_full.value[flat_full.leaves(x[i:i + chunk])].astype(np.float32)
+             for i in range(0, len(x), chunk)]
+    return np.concatenate(parts, axis=1)
+
+P_sel = tree_probabilities(X_sel)
+P_eval = tree_probabilities(X_eval)
+n_trees = P_sel.shape[0]
+
+def subset_accuracy(P, y_true, trees):
+    return float(np.mean((P[trees].mean(axis=0) > 0.5) == y_true))
+
+full_trees = np.arange(n_trees)
+full_sel_acc = subset_accuracy(P_sel, y_sel, full_trees)
+full_eval_acc = subset_accuracy(P_eval, y_eval, full_trees)
+target = full_sel_acc - args.tolerance
+eval_target = full_eval_acc - args.tolerance
+print(f"   Full forest accuracy: selection {full_sel_acc:.4f}, evaluation {full_eval_acc:.4f}")
+print(f"   Target:               selection >= {target:.4f}, evaluation >= {eval_target:.4f}")
+
+# ---------------------------------------------------
+# STEP 3: Accuracy vs. tree count
+# ---------------------------------------------------
+# a) Trees in their original order (a forest trained with fewer estimators)
+def prefix_accuracy(P, y_true):
+    prefix = np.cumsum(P, axis=0) / np.arange(1, len(P) + 1)[:, None]
+    return ((prefix > 0.5) == y_true).mean(axis=1)
+
+prefix_ok = (prefix_accuracy(P_sel, y_sel) >= target) & (prefix_accuracy(P_eval, y_eval) >= eval_target)
+prefix_k = int(np.argmax(prefix_ok)) + 1 if prefix_ok.any() else n_trees
+
+# b) Greedy forward selection: repeatedly add the tree that helps accuracy most
+#    (ties broken by the lowest log loss)
+print("\n Greedy tree selection...")
+max_trees = min(args.max_trees or n_trees, n_trees)
+selected = []
+remaining = np.ones(n_trees, dtype=bool)
+sums = np.zeros(P_sel.shape[1], dtype=np.float64)
+greedy_acc_sel = []
+greedy_ok = False
+eps = 1e-6
+while len(selected) < max_trees:
+    k = len(selected) + 1
+    candidate_p = (sums[None, :] + P_sel) / k
+    acc = ((candidate_p > 0.5) == y_sel).mean(axis=1)
+    clipped = np.clip(candidate_p, eps, 1 - eps)
+    loss = -np.mean(np.where(y_sel, np.log(clipped), np.log(1 - clipped)), axis=1)
+    acc[~remaining] = -1.0
+    best_acc = acc.max()
+    best = int(np.argmin(np.where(acc == best_acc, loss, np.inf)))
+    selected.append(best)
+    remaining[best] = False
+    sums += P_sel[best]
+    greedy_acc_sel.append(float(best_acc))
+    if best_acc >= target and subset_accuracy(P_eval, y_eval, np.array(selected)) >= eval_target:
+        greedy_ok = True
+        break
+greedy_k = len(selected)
+if greedy_ok:
+    print(f"   Greedy selection reaches the target with {greedy_k} trees")
+else:
+    print(f"   Greedy selection did not reach the target within {greedy_k} trees")
+print(f"   Original order reaches the target with {prefix_k} trees")
+
+# Keep whichever subset is smaller (and actually meets the target)
+if greedy_ok and greedy_k <= prefix_k:
+    method, subset = 'greedy', list(selected)
+else:
+    method, subset = 'prefix', list(range(prefix_k))
+print(f"\n Selected: {len(subset)} of {n_trees} trees ({method})")
+
+checkpoints = sorted({k for k in (1, 2, 5, 10, 20, 50, 100, 150, 200, 300, 400, 500, 600, n_trees,
+                                  prefix_k, greedy_k) if k <= n_trees})
+curve = []
+for k in checkpoints:
+    point = {'trees': k, 'prefix_eval_accuracy': round(subset_accuracy(P_eval, y_eval, np.arange(k)), 5)}
+    if k <= greedy_k:
+        point['greedy_eval_accuracy'] = round(subset_accuracy(P_eval, y_eval, np.array(selected[:k])), 5)
+    curve.append(point)
+
+print(f"\n {'trees':>6} {'original order':>15} {'greedy':>8}")
+print("-"*35)
+for point in curve:
+    greedy = f"{point['greedy_eval_accuracy']:.4f}" if 'greedy_eval_accuracy' in point else '-'
+    print(f" {point['trees']:>6} {point['prefix_eval_accuracy']:>15.4f} {greedy:>8}")
+
+# ---------------------------------------------------
+# STEP 4: Build the pruned model
+# ---------------------------------------------------
+pruned = copy.copy(rf)
+pruned.estimators_ = [rf.estimators_[i] for i in subset]
+pruned.n_estimators = len(subset)
+for attr in ('oob_score_', 'oob_decision_function_'):
+    if hasattr(pruned, attr):
+        delattr(pruned, attr)   # described the full forest
+flat_pruned = FlatForest.from_sklearn(pruned)
+
+p_full = flat_full.predict_proba(X_eval.to_numpy(dtype=np.float32))[:, 1]
+p_pruned = flat_pruned.predict_proba(X_eval.to_numpy(dtype=np.float32))[:, 1]
+accuracy = {
+    'full': {'accuracy': round(accuracy_score(y_eval, p_full > 0.5), 5), 'f1': round(f1_score(y_eval, p_full > 0.5), 5)},
+    'pruned': {'accuracy': round(accuracy_score(y_eval, p_pruned > 0.5), 5), 'f1': round(f1_score(y_eval, p_pruned > 0.5), 5)},
+    'decision_agreement': round(float(np.mean((p_full > 0.5) == (p_pruned > 0.5))), 5),
+}
+
+# ---------------------------------------------------
+# STEP 5: Size, load time and latency
+# ---------------------------------------------------
+print("\n Measuring size, load time and latency...")
+
+def median_ms(func, inputs):
+    times = []
+    for item in inputs:
+        t0 = time.perf_counter()
+        func(item)
+        times.append(time.perf_counter() - t0)
+    return round(float(np.median(times)) * 1e3, 4)
+
+def profile_model(model, flat):
+    with tempfile.TemporaryDirectory() as tmp:
+        pkl_path = os.path.join(tmp, "model.pkl")
+        joblib.dump(model, pkl_path)
+        t0 = time.perf_counter()
+        joblib.load(pkl_path)
+        sklearn_load = time.perf_counter() - t0
+        npz_path = os.path.join(tmp, "model_flat.npz")
+        flat.save(npz_path)
+        t0 = time.perf_counter()
+        FlatForest.load(npz_path)
+        flat_load = time.perf_counter() - t0
+        sizes = (os.path.getsize(pkl_path), os.path.getsize(npz_path))
+
+    rows = X_eval.to_numpy(dtype=np.float32)
+    singles = [rows[i:i + 1] for i in range(min(100, len(rows)))]
+    batches = [rows[i:i + 256] for i in range(0, min(len(rows), 256 * 10) - 255, 256)] or [rows]
+    return {
+        'trees': len(model.estimators_),
+        'nodes': flat.n_nodes,
+        'sklearn_file_mb': round(sizes[0] / 1024 / 1024, 2),
+        'sklearn_memory_mb': round(len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)) / 1024 / 1024, 2),
+        'flat_file_mb': round(sizes[1] / 1024 / 1024, 2),
+        'flat_memory_mb': round(flat.nbytes / 1024 / 1024, 2),
+        'sklearn_load_ms': round(sklearn_load * 1e3, 1),
+        'flat_load_ms': round(flat_load * 1e3, 1),
+        'sklearn_single_ms': median_ms(lambda r: model.predict_proba(pd.DataFrame(r, columns=content_features)), singles),
+        'flat_single_ms': median_ms(flat.predict_proba, singles),
+        'sklearn_batch256_ms': median_ms(lambda r: model.predict_proba(pd.DataFrame(r, columns=content_features)), batches),
+        'flat_batch256_ms': median_ms(flat.predict_proba, batches),
+    }
+
+profile = {'full': profile_model(rf, flat_full), 'pruned': profile_model(pruned, flat_pruned)}
+
+print(f"\n {'':<22} {'full':>12} {'pruned':>12}")
+print("-"*50)
+for key in ('trees', 'nodes', 'sklearn_file_mb', 'flat_memory_mb', 'sklearn_load_ms', 'flat_load_ms',
+            'sklearn_single_ms', 'flat_single_ms', 'sklearn_batch256_ms', 'flat_batch256_ms'):
+    print(f" {key:<22} {profile['full'][key]:>12} {profile['pruned'][key]:>12}")
+print(f" {'eval accuracy':<22} {accuracy['full']['accuracy']:>12} {accuracy['pruned']['accuracy']:>12}")
+print(f" {'eval F1':<22} {accuracy['full']['f1']:>12} {accuracy['pruned']['f1']:>12}")
+print(f" Decision agreement with the full forest: {accuracy['decision_agreement']:.4f}")
+
+# ---------------------------------------------------
+# STEP 6: Save model and report
+# ---------------------------------------------------
+pruned_path = os.path.join(args.model_dir, "model_2023_pruned.pkl")
+joblib.dump(pruned, pruned_path)
+flat_pruned.save(os.path.join(args.model_dir, "model_2023_pruned_flat.npz"), source_path=pruned_path)
+print(f"\n Pruned model saved to {pruned_path}")
+
+if args.install:
+    if not os.path.exists(full_path):
+        os.replace(model_path, full_path)
+    joblib.dump(pruned, model_path)
+    # Records the installed pickle's hash, so the predictor uses it as its flat cache
+    flat_pruned.save(os.path.join(args.model_dir, "model_2023_flat.npz"), source_path=model_path)
+    print(f" Installed as {model_path} (full forest kept as {full_path})")
+
+report = {
+    'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+    'tolerance': args.tolerance,
+    'method': method,
+    'selected_trees': [int(i) for i in subset],
+    'selection_rows': int(len(X_sel)),
+    'evaluation_rows': int(len(X_eval)),
+    'accuracy_vs_trees': curve,
+    'accuracy': accuracy,
+    'profile': profile,
+    'installed': args.install,
+}
+reports_dir = os.path.join(args.model_dir, "reports")
+os.makedirs(reports_dir, exist_ok=True)
+report_path = os.path.join(reports_dir, "pruning_report_2023.json")
+with open(report_path, 'w', encoding='utf-8') as f:
+    json.dump(report, f, indent=2)
+print(f" Report saved to {report_path}")
+print("="*70)
@@ -5,8 +5,15 @@ from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, classification_report
 import os
+import sys
 import warnings
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from RuleBased.flat_forest import FlatForest
+from feature_extraction.content_2023.feature_extract_2023 import ContentFeatureExtractor
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from compact_frames import CONTENT_2023_DTYPES, read_compact_csv
+
 warnings.filterwarnings('ignore')
 
 print("\n" + "="*70)
@@ -14,23 +21,11 @@ print("  TRAINING MODEL 2023")
 print("="*70)
 
 # ---------------------------------------------------
-# STEP 1: Load Data
+# STEP 1: Dataset and Pure Content Features
 # ---------------------------------------------------
 dataset_path = "datasets/dataset_2023/Dataset2023.csv"
-print(f"\n Loading dataset from {dataset_path}...")
-
-try:
-    df = pd.read_csv(dataset_path)
-    print(f" Loaded {len(df)} samples")
-except FileNotFoundError:
-    print(" Dataset not found!")
-    exit(1)
-
-# ---------------------------------------------------
-# STEP 2: Select Pure Content Features
-# ---------------------------------------------------
-print("\n Selecting Pure Content Features...")
 
+# Pure content features
 content_features = [
     #28 features
     'LineOfCode', 'LargestLineLength', 'HasTitle', 'DomainTitleMatchScore', 
@@ -42,11 +37,24 @@ content_features = [
     'NoOfEmptyRef', 'NoOfExternalRef',
 ]
 
-missing = [c for c in content_features if c not in df.columns]
+try:
+    columns = pd.read_csv(dataset_path, nrows=0).columns
+except FileNotFoundError:
+    print(" Dataset not found!")
+    exit(1)
+
+missing = [c for c in content_features + ['label'] if c not in columns]
 if missing:
     print(f" Missing columns in dataset: {missing}")
     exit(1)
 
+# ---------------------------------------------------
+# STEP 2: Load the content features (only these columns, with compact dtypes)
+# ---------------------------------------------------
+print(f"\n Loading dataset from {dataset_path}...")
+df = read_compact_csv(dataset_path, {name: CONTENT_2023_DTYPES[name] for name in content_features})
+print(f" Loaded {len(df)} samples ({df.memory_usage(deep=True).sum() / 1024 / 1024:.1f} MB)")
+
 X = df[content_features]
 y = df['label']
 
@@ -142,7 +150,9 @@ metadata = {
     "num_features": n_features,
     "class_distribution": class_counts,
     "top_features": importance_df.head(20).to_dict(orient="records"),
-    "feature_stats_head": summary_stats.head(15).to_dict(orient="index")
+    "feature_stats_head": summary_stats.head(15).to_dict(orient="index"),
+    # Extractor that computes these features at prediction time (checked by the predictor on load)
+    "extractor_fingerprint": ContentFeatureExtractor().fingerprint()
 }
 
 os.makedirs("Models/model_2023", exist_ok=True)
@@ -163,6 +173,12 @@ joblib.dump(content_features, "Models/model_2023/features_2023.pkl")
 print(" Model saved to Models/model_2023/model_2023.pkl")
 print(" Features saved to Models/model_2023/features_2023.pkl")
 
+# Flattened copy evaluated by the predictor (records the pickle's hash, so it is only used with this model)
+flat_rf = FlatForest.from_sklearn(rf)
+flat_rf.save("Models/model_2023/model_2023_flat.npz", source_path="Models/model_2023/model_2023.pkl")
+print(f" Flattened forest saved to Models/model_2023/model_2023_flat.npz "
+      f"({flat_rf.n_nodes} nodes, {flat_rf.nbytes / 1024 / 1024:.1f} MB)")
+
 # ---------------------------------------------------
 # STEP 7: Generate Human-Readable Report
 # ---------------------------------------------------
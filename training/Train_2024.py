@@ -4,14 +4,44 @@ import joblib
 import json
 import os
 import sys
+import argparse
+import hashlib
+import threading
 from datetime import datetime
 from sklearn.model_selection import train_test_split, StratifiedKFold, cross_val_score
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix, precision_recall_curve
+import xgboost as xgb
 from xgboost import XGBClassifier
 import optuna
 import warnings
 warnings.filterwarnings('ignore')
 
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from compact_frames import LABEL_DTYPE, compact_frame
+
+parser = argparse.ArgumentParser(description="Train Model 2024 (URL) with Optuna hyperparameter search")
+parser.add_argument('--trials', type=int, default=30, help="Optuna trials")
+parser.add_argument('--parallel-trials', type=int, default=None,
+                    help="Trials run at the same time (default: one per 4 CPU cores, at least 1)")
+parser.add_argument('--threads-per-trial', type=int, default=None,
+                    help="XGBoost threads per trial (default: CPU cores / parallel trials)")
+parser.add_argument('--early-stopping-rounds', type=int, default=30,
+                    help="Stop adding trees when the validation fold's logloss hasn't improved for this many rounds")
+parser.add_argument('--study-name', default="xgboost_2024",
+                    help="Optuna study; re-running with the same name resumes it until --trials trials are finished "
+                         "(only on the same data - after new rows, start a new study, e.g. with --warm-start-from)")
+parser.add_argument('--storage', default=None,
+                    help="Optuna storage URL (default: sqlite database in models/model_2024; '' keeps the study in memory)")
+parser.add_argument('--warm-start-from', default=None, metavar='STUDY',
+                    help="Re-evaluate the best trials of an earlier study (e.g. before a data augmentation) first")
+parser.add_argument('--warm-start-trials', type=int, default=5,
+                    help="How many of the earlier study's best trials to re-evaluate")
+args = parser.parse_args()
+if args.warm_start_from and args.storage == '':
+    # An in-memory study only lives in this process - there is no earlier study to load
+    parser.error("--warm-start-from needs a persistent --storage (the earlier study is loaded from it); "
+                 "drop --storage '' or pass the storage URL of that study")
+
 print("\n" + "="*70)
 print("  TRAINING MODEL 2024 - WITH DETAILED REPORTING")
 print("="*70)
@@ -28,19 +58,35 @@ os.makedirs(reports_dir, exist_ok=True)
 # STEP 1: Load data
 # ---------------------------------------------------
 print("\n Loading data...")
-features_path = os.path.join(base_dir, "feature_extraction", "url_2024", "extracted_features", "extracted_features_2024.pkl")
-labels_path = os.path.join(base_dir, "feature_extraction", "url_2024", "extracted_features", "extracted_labels_2024.pkl")
-
-X = joblib.load(features_path)
-y = joblib.load(labels_path)
-print(f" Features loaded: {X.shape}")
+# Base extraction plus the partitions appended by dataset augmentation
+sys.path.append(os.path.join(base_dir, 'feature_extraction', 'url_2024'))
+sys.path.append(os.path.join(base_dir, 'feature_extraction'))
+from feature_store import load_feature_store, store_fingerprint
+from Feature_Extractor import URLFeatureExtractor
+from extractor_fingerprint import check_fingerprint
+
+X, y = load_feature_store()
+# The model is stamped with the extractor version of its training features
+extractor_fingerprint = store_fingerprint()
+check_fingerprint("Feature store", extractor_fingerprint, URLFeatureExtractor().fingerprint())
+# Smallest dtypes that hold each feature (int8 flags, int16 counts, float32 ratios)
+if not isinstance(X, pd.DataFrame):
+    X = pd.DataFrame(X)
+memory_before = X.memory_usage(deep=True).sum() / 1024 / 1024
+X = compact_frame(X)
+# Identifies the training data, so a study is never resumed on different rows
+dataset_fingerprint = hashlib.sha256(
+    f"{extractor_fingerprint}:{X.shape}".encode()
+    + pd.util.hash_pandas_object(X, index=False).to_numpy().tobytes()
+    + np.asarray(y).tobytes()).hexdigest()[:16]
+print(f" Features loaded: {X.shape} ({memory_before:.1f} MB -> {X.memory_usage(deep=True).sum() / 1024 / 1024:.1f} MB)")
 print(f" Labels loaded: {len(y)}")
 
 # ---------------------------------------------------
 # STEP 2: Validate labels
 # ---------------------------------------------------
 print("\n Validating labels...")
-y = pd.Series(y)
+y = pd.Series(y, dtype=LABEL_DTYPE)
 
 # Check label distribution
 unique, counts = np.unique(y, return_counts=True)
@@ -81,7 +127,37 @@ for label, count in train_dist.items():
 # ---------------------------------------------------
 print("\n Starting hyperparameter optimization...")
 
+# Trials run in parallel, each with a fixed XGBoost thread budget so that
+# parallel_trials x threads_per_trial never exceeds the machine
+cpu_count = os.cpu_count() or 1
+parallel_trials = args.parallel_trials or max(1, cpu_count // 4)
+threads_per_trial = args.threads_per_trial or max(1, cpu_count // parallel_trials)
+print(f"   {args.trials} trials, {parallel_trials} in parallel x {threads_per_trial} threads")
+
+# Same folds for every trial, so fold scores are comparable across trials
+cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
+cv_folds = list(cv.split(X_train, y_train))
+
+# Quantized (histogram) training matrices, built once per fold and reused by
+# every trial instead of converting the DataFrame in each fit. Each parallel
+# worker gets its own set, so no DMatrix is trained on by two threads at once.
+MAX_BIN = 256
+_fold_cache = threading.local()
+
+def fold_matrices():
+    if not hasattr(_fold_cache, 'folds'):
+        folds = []
+        for train_idx, valid_idx in cv_folds:
+            dtrain = xgb.QuantileDMatrix(X_train.iloc[train_idx], y_train.iloc[train_idx],
+                                         max_bin=MAX_BIN, nthread=threads_per_trial)
+            dvalid = xgb.QuantileDMatrix(X_train.iloc[valid_idx], y_train.iloc[valid_idx],
+                                         ref=dtrain, nthread=threads_per_trial)
+            folds.append((dtrain, dvalid, y_train.iloc[valid_idx].to_numpy()))
+        _fold_cache.folds = folds
+    return _fold_cache.folds
+
 def objective(trial):
+    n_estimators = trial.suggest_int("n_estimators", 100, 300)  # upper bound, early stopping decides
     params = {
         "max_depth": trial.suggest_int("max_depth", 3, 8),
         "reg_lambda": trial.suggest_float("reg_lambda", 1.0, 10.0),
@@ -90,33 +166,100 @@ def objective(trial):
         "subsample": trial.suggest_float("subsample", 0.6, 0.9),
         "colsample_bytree": trial.suggest_float("colsample_bytree", 0.6, 0.9),
         "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.1, log=True),
-        "n_estimators": trial.suggest_int("n_estimators", 100, 300),
         "scale_pos_weight": imbalance_ratio,  # Handle class imbalance
         "objective": "binary:logistic",
         "eval_metric": "logloss",
-        "random_state": 42,
-        "verbosity": 0
+        "tree_method": "hist",
+        "max_bin": MAX_BIN,
+        "seed": 42,
+        "verbosity": 0,
+        "nthread": threads_per_trial
     }
-    model = XGBClassifier(**params)
-    cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
-    cv_scores = cross_val_score(model, X_train, y_train, cv=cv, scoring='accuracy', n_jobs=-1)
-    return cv_scores.mean()
+    # Folds run one by one; the running mean is reported after each fold so the
+    # pruner can stop a trial that is already below the median of earlier trials
+    fold_scores = []
+    best_rounds = []
+    for fold, (dtrain, dvalid, y_valid) in enumerate(fold_matrices()):
+        booster = xgb.train(params, dtrain, num_boost_round=n_estimators, evals=[(dvalid, "valid")],
+                            early_stopping_rounds=args.early_stopping_rounds, verbose_eval=False)
+        best_rounds.append(booster.best_iteration + 1)
+        proba = booster.predict(dvalid, iteration_range=(0, booster.best_iteration + 1))
+        fold_scores.append(accuracy_score(y_valid, (proba > 0.5).astype(int)))
+        trial.report(float(np.mean(fold_scores)), step=fold)
+        if trial.should_prune():
+            raise optuna.TrialPruned()
+    trial.set_user_attr("best_n_estimators", int(np.mean(best_rounds)))
+    return float(np.mean(fold_scores))
+
+# Studies live in a local SQLite database, so an interrupted search resumes
+# where it stopped and later runs can start from its best configurations
+storage = args.storage
+if storage is None:
+    storage = f"sqlite:///{os.path.join(base_dir, 'models', 'model_2024', 'optuna_2024.db')}"
+if storage:
+    # Trials of a killed run stop sending heartbeats; the next run marks them
+    # failed and queues them again instead of leaving them RUNNING forever
+    storage = optuna.storages.RDBStorage(
+        storage, heartbeat_interval=30, grace_period=60,
+        failed_trial_callback=optuna.storages.RetryFailedTrialCallback(max_retry=1))
+else:
+    storage = None
 
 study = optuna.create_study(
     direction="maximize",
-    study_name="xgboost_2024",
-    pruner=optuna.pruners.MedianPruner(n_startup_trials=5, n_warmup_steps=3, interval_steps=1)
+    study_name=args.study_name,
+    storage=storage,
+    load_if_exists=True,
+    # constant_liar: parallel trials don't all sample the same region
+    sampler=optuna.samplers.TPESampler(seed=42, constant_liar=True),
+    # Trials can be pruned from the second fold on
+    pruner=optuna.pruners.MedianPruner(n_startup_trials=5, n_warmup_steps=1, interval_steps=1)
 )
 
-study.optimize(objective, n_trials=30, show_progress_bar=True, n_jobs=1)
+finished_states = (optuna.trial.TrialState.COMPLETE, optuna.trial.TrialState.PRUNED)
+finished = len(study.get_trials(deepcopy=False, states=finished_states))
+# Scores of a study are only comparable on the data it was started on: resuming it
+# on other data would skip the search and train the final model with stale params
+study_dataset = study.user_attrs.get("dataset_fingerprint")
+if study.trials and study_dataset != dataset_fingerprint:
+    parser.error(f"study '{args.study_name}' was run on {'other' if study_dataset else 'unrecorded'} data "
+                 f"(dataset {study_dataset or 'unknown'}, current {dataset_fingerprint}); pass a new --study-name, "
+                 f"optionally with --warm-start-from {args.study_name} to re-evaluate its best trials")
+study.set_user_attr("dataset_fingerprint", dataset_fingerprint)
+if finished:
+    print(f"   Resuming study '{args.study_name}': {finished} trials already finished")
+
+# Warm start: queue the best parameter sets of an earlier study; they are
+# re-scored on the current data (old scores are not comparable after new rows)
+if args.warm_start_from and finished:
+    print(f"   Warm start skipped: study '{args.study_name}' already has finished trials (queued when it was started)")
+elif args.warm_start_from:
+    previous = optuna.load_study(study_name=args.warm_start_from, storage=storage)
+    best_previous = sorted(previous.get_trials(deepcopy=False, states=(optuna.trial.TrialState.COMPLETE,)),
+                           key=lambda t: t.value, reverse=True)[:args.warm_start_trials]
+    for previous_trial in best_previous:
+        study.enqueue_trial(previous_trial.params, skip_if_exists=True)
+    print(f"   Warm start: {len(best_previous)} trials queued from study '{args.warm_start_from}'")
+
+remaining_trials = max(0, args.trials - finished)
+if remaining_trials:
+    study.optimize(objective, n_trials=remaining_trials, show_progress_bar=True, n_jobs=parallel_trials)
+
+pruned_trials = len(study.get_trials(deepcopy=False, states=(optuna.trial.TrialState.PRUNED,)))
+print(f"\n Trials: {len(study.trials)} ({pruned_trials} pruned)")
 
 print(f"\n Best CV Accuracy: {study.best_value:.4f}")
 
+# Final model: the tuned parameters, with as many trees as early stopping kept on average
+best_params = dict(study.best_params)
+best_params["n_estimators"] = study.best_trial.user_attrs.get("best_n_estimators", best_params["n_estimators"])
+print(f"   Trees: {best_params['n_estimators']} (early stopping, upper bound {study.best_params['n_estimators']})")
+
 # ---------------------------------------------------
 # STEP 5: Train final model
 # ---------------------------------------------------
 print("\n🤖 Training final model...")
-final_model = XGBClassifier(**study.best_params, eval_metric='logloss')
+final_model = XGBClassifier(**best_params, tree_method='hist', max_bin=MAX_BIN, eval_metric='logloss')
 final_model.fit(
     X_train, y_train,
     eval_set=[(X_test, y_test)],
@@ -241,31 +384,15 @@ print("\n" + "="*70)
 print("  VALIDATION: TESTING ON COMPLEX LEGITIMATE URLS")
 print("="*70)
 
-sys.path.append(os.path.join(base_dir, 'feature_extraction', 'url_2024'))
-from Feature_Extractor import URLFeatureExtractor
+from feature_cache import URLFeatureCache
+from complex_urls import COMPLEX_LEGITIMATE_URLS
 
-complex_test_urls = [
-    "https://www.britannica.com/biography/Che-Guevara",
-    "https://plato.stanford.edu/entries/ethics-ai/",
-    "https://www.khanacademy.org/math/algebra/x2f8bb11595b61c86:systems-of-equations",
-    "https://scholar.google.com/scholar?hl=en&q=phishing+detection",
-    "https://docs.google.com/document/d/1A9f8KJ9P2wQxU4Y/edit",
-    "https://learn.microsoft.com/en-us/azure/active-directory/develop/v2-oauth2-auth-code-flow",
-    "https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Promise",
-    "https://github.com/openai/gpt-4/blob/main/system_card.md",
-    "https://auth0.com/docs/flows/authorization-code-flow",
-    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-    "https://medium.com/@user/how-machine-learning-detects-phishing-8f92a9c12",
-    "https://www.reddit.com/r/netsec/comments/15f9k2m/phishing_detection_models/",
-    "https://vimeo.com/76979871",
-    "https://login.microsoftonline.com/common/oauth2/v2.0/authorize",
-    "https://accounts.google.com/o/oauth2/v2/auth",
-]
+complex_test_urls = COMPLEX_LEGITIMATE_URLS
 
 print(f"\n Testing {len(complex_test_urls)} complex legitimate URLs...")
 
 # Extract features
-extractor = URLFeatureExtractor()
+extractor = URLFeatureCache(URLFeatureExtractor())
 complex_features = []
 for url in complex_test_urls:
     try:
@@ -273,6 +400,7 @@ for url in complex_test_urls:
         complex_features.append(feats)
     except Exception as e:
         print(f"  Error extracting {url}: {e}")
+extractor.flush()
 
 X_complex = pd.DataFrame(complex_features)
 X_complex = X_complex.reindex(columns=X.columns, fill_value=0)
@@ -356,7 +484,8 @@ training_summary = {
         "label_distribution": label_distribution,
         "class_imbalance_ratio": float(imbalance_ratio)
     },
-    "hyperparameters": study.best_params,
+    "hyperparameters": best_params,
+    "extractor_fingerprint": extractor_fingerprint,
     "performance": {
         "test_accuracy": float(test_accuracy),
         "train_accuracy": float(train_accuracy),
@@ -487,7 +616,7 @@ report_lines.append(f"   • Balanced classes using scale_pos_weight={imbalance_
 report_lines.append(f"\n{'='*90}")
 report_lines.append("\n  HYPERPARAMETERS")
 report_lines.append("-"*90)
-for param, value in study.best_params.items():
+for param, value in best_params.items():
     report_lines.append(f"{param:<25} {value}")
 
 report_lines.append(f"\n{'='*90}")
@@ -0,0 +1,246 @@
+import pandas as pd
+import numpy as np
+import joblib
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from sklearn.model_selection import train_test_split
+from sklearn.metrics import accuracy_score, confusion_matrix
+from xgboost import XGBClassifier
+import warnings
+warnings.filterwarnings('ignore')
+
+# ---------------------------------------------------
+# Incremental update of Model 2024 after a dataset augmentation.
+#
+# Instead of a full Train_2024.py run (hyperparameter search + training from
+# scratch), boosting continues from the current model_2024.pkl: a few more
+# rounds are fitted on the new rows plus a replay sample of the old training
+# rows, so the added trees learn the new URLs without forgetting the old ones.
+#
+# New rows are the ones appended to the feature store since the model was
+# last trained or updated (recorded in the model metadata). The held-out test
+# split always comes from the rows of the last full Train_2024.py run, so it
+# is never trained on, however many updates follow.
+#
+# The updated model only replaces model_2024.pkl if it passes the gate:
+#   - accuracy on the original held-out test split (the same split as
+#     Train_2024.py) drops by at most --max-accuracy-drop
+#   - its false positive rate there rises by at most --max-fpr-increase
+#   - it flags no more of the complex legitimate URLs (complex_urls.py) than now
+#
+# Usage (from the repository root, after augmenting the dataset):
+#   python training/Update_2024.py
+#   python training/Update_2024.py --rounds 80 --replay-ratio 5
+#   python training/Update_2024.py --dry-run      # evaluate, don't install
+# ---------------------------------------------------
+parser = argparse.ArgumentParser(description="Continue training Model 2024 on newly added rows")
+parser.add_argument('--rounds', type=int, default=50, help="Boosting rounds to add")
+parser.add_argument('--learning-rate', type=float, default=None,
+                    help="Learning rate of the added rounds (default: the model's own)")
+parser.add_argument('--replay-ratio', type=float, default=3.0,
+                    help="Old training rows sampled per new row")
+parser.add_argument('--new-from-row', type=int, default=None,
+                    help="First new row in the feature store (default: rows the model was trained on)")
+parser.add_argument('--max-accuracy-drop', type=float, default=0.002)
+parser.add_argument('--max-fpr-increase', type=float, default=0.002)
+parser.add_argument('--dry-run', action='store_true', help="Run the gate but keep the current model")
+args = parser.parse_args()
+
+print("\n" + "="*70)
+print("  INCREMENTAL UPDATE - MODEL 2024")
+print("="*70)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+base_dir = os.path.dirname(script_dir)
+model_dir = os.path.join(base_dir, "models", "model_2024")
+reports_dir = os.path.join(model_dir, "reports")
+os.makedirs(reports_dir, exist_ok=True)
+
+# ---------------------------------------------------
+# STEP 1: Load current model and data
+# ---------------------------------------------------
+print("\n Loading model and data...")
+model_path = os.path.join(model_dir, "model_2024.pkl")
+metadata_path = os.path.join(model_dir, "model_2024_metadata.pkl")
+current_model = joblib.load(model_path)
+feature_names = list(joblib.load(os.path.join(model_dir, "features_2024.pkl")))
+metadata = joblib.load(metadata_path) if os.path.exists(metadata_path) else {}
+
+sys.path.append(os.path.join(base_dir, 'feature_extraction', 'url_2024'))
+from feature_store import load_feature_store, store_fingerprint
+
+X, y = load_feature_store()
+X = X.reindex(columns=feature_names, fill_value=0)
+y = pd.Series(y)
+
+split_rows = metadata.get('dataset', {}).get('total_samples')
+trained_rows = args.new_from_row or metadata.get('rows_trained', split_rows)
+if split_rows is None or trained_rows is None:
+    print(" ERROR: model metadata has no row count - retrain with Train_2024.py")
+    sys.exit(1)
+
+# New trees must be fitted on features from the same extractor version as the old ones
+extractor_fingerprint = store_fingerprint()
+model_fingerprint = metadata.get('extractor_fingerprint')
+if extractor_fingerprint and model_fingerprint and extractor_fingerprint != model_fingerprint:
+    print(f" ERROR: the model was trained on features of extractor {model_fingerprint},")
+    print(f"   the feature store now holds extractor {extractor_fingerprint} - run a full Train_2024.py")
+    sys.exit(1)
+
+new_rows = len(X) - trained_rows
+print(f" Feature store: {len(X):,} rows ({trained_rows:,} trained on, {new_rows:,} new)")
+if new_rows <= 0:
+    print(" Nothing to do - no rows were added since the model was trained")
+    sys.exit(0)
+
+# ---------------------------------------------------
+# STEP 2: Update set = new rows + replay sample of old training rows
+# ---------------------------------------------------
+# Same split as Train_2024.py, so the held-out test rows are never trained on;
+# rows added by earlier updates join the replay pool
+X_old, y_old = X.iloc[:split_rows], y.iloc[:split_rows]
+X_old_train, X_test, y_old_train, y_test = train_test_split(
+    X_old, y_old, test_size=0.2, random_state=42, stratify=y_old
+)
+X_old_train = pd.concat([X_old_train, X.iloc[split_rows:trained_rows]])
+y_old_train = pd.concat([y_old_train, y.iloc[split_rows:trained_rows]])
+X_new, y_new = X.iloc[trained_rows:], y.iloc[trained_rows:]
+
+# Part of the new rows is held out too, to see whether the update learned them
+stratify_new = y_new if y_new.value_counts().min() >= 2 else None
+if len(X_new) >= 10:
+    X_new_train, X_new_test, y_new_train, y_new_test = train_test_split(
+        X_new, y_new, test_size=0.2, random_state=42, stratify=stratify_new
+    )
+else:
+    X_new_train, X_new_test, y_new_train, y_new_test = X_new, X_new.iloc[:0], y_new, y_new.iloc[:0]
+
+replay_size = min(len(X_old_train), int(len(X_new_train) * args.replay_ratio))
+X_replay = X_old_train.sample(n=replay_size, random_state=42)
+y_replay = y_old_train.loc[X_replay.index]
+
+X_update = pd.concat([X_new_train, X_replay])
+y_update = pd.concat([y_new_train, y_replay])
+print(f" Update set: {len(X_new_train):,} new + {len(X_replay):,} replayed rows")
+
+# ---------------------------------------------------
+# STEP 3: Continue boosting from the current model
+# ---------------------------------------------------
+print(f"\n Adding {args.rounds} boosting rounds...")
+params = current_model.get_params()
+params['n_estimators'] = args.rounds
+params.pop('early_stopping_rounds', None)
+if args.learning_rate is not None:
+    params['learning_rate'] = args.learning_rate
+
+t0 = time.time()
+updated_model = XGBClassifier(**params)
+updated_model.fit(X_update, y_update, xgb_model=current_model.get_booster(), verbose=False)
+update_seconds = time.time() - t0
+print(f" Done in {update_seconds:.1f}s ({updated_model.get_booster().num_boosted_rounds()} trees in total)")
+
+# ---------------------------------------------------
+# STEP 4: Validation gate
+# ---------------------------------------------------
+print("\n" + "="*70)
+print("  VALIDATION GATE")
+print("="*70)
+
+def test_metrics(model, X_eval, y_eval):
+    if len(X_eval) == 0:
+        return {'accuracy': None, 'false_positive_rate': None}
+    pred = model.predict(X_eval)
+    tn, fp, fn, tp = confusion_matrix(y_eval, pred, labels=[0, 1]).ravel()
+    return {'accuracy': float(accuracy_score(y_eval, pred)),
+            'false_positive_rate': float(fp / (fp + tn)) if (fp + tn) > 0 else 0.0}
+
+from Feature_Extractor import URLFeatureExtractor
+from feature_cache import URLFeatureCache
+from complex_urls import COMPLEX_LEGITIMATE_URLS
+
+extractor = URLFeatureCache(URLFeatureExtractor())
+X_complex = pd.DataFrame([extractor.extract(url) for url in COMPLEX_LEGITIMATE_URLS]).reindex(
+    columns=feature_names, fill_value=0)
+extractor.flush()
+
+results = {}
+for name, model in (('current', current_model), ('updated', updated_model)):
+    complex_proba = model.predict_proba(X_complex)[:, 1]
+    results[name] = {
+        'held_out': test_metrics(model, X_test, y_test),
+        'new_rows_held_out': test_metrics(model, X_new_test, y_new_test),
+        'complex_false_positives': int(np.sum(complex_proba > 0.5)),
+        'complex_probabilities': [float(p) for p in complex_proba],
+    }
+
+current, updated = results['current'], results['updated']
+checks = {
+    'held_out_accuracy': updated['held_out']['accuracy'] >= current['held_out']['accuracy'] - args.max_accuracy_drop,
+    'held_out_false_positive_rate': (updated['held_out']['false_positive_rate']
+                                     <= current['held_out']['false_positive_rate'] + args.max_fpr_increase),
+    'complex_urls': updated['complex_false_positives'] <= current['complex_false_positives'],
+}
+passed = all(checks.values())
+
+def fmt(value):
+    return f"{value:.4f}" if value is not None else "-"
+
+print(f"\n{'Metric':<36} {'Current':>10} {'Updated':>10}")
+print("-"*60)
+print(f"{'Held-out accuracy':<36} {fmt(current['held_out']['accuracy']):>10} {fmt(updated['held_out']['accuracy']):>10}")
+print(f"{'Held-out false positive rate':<36} {fmt(current['held_out']['false_positive_rate']):>10} {fmt(updated['held_out']['false_positive_rate']):>10}")
+print(f"{'New rows (held out) accuracy':<36} {fmt(current['new_rows_held_out']['accuracy']):>10} {fmt(updated['new_rows_held_out']['accuracy']):>10}")
+print(f"{'Complex URLs flagged':<36} {current['complex_false_positives']:>10} {updated['complex_false_positives']:>10}")
+print()
+for check, ok in checks.items():
+    print(f"   {'PASS' if ok else 'FAIL'}  {check}")
+
+# ---------------------------------------------------
+# STEP 5: Install (or keep the current model)
+# ---------------------------------------------------
+installed = passed and not args.dry_run
+if installed:
+    previous_path = os.path.join(model_dir, "model_2024_previous.pkl")
+    os.replace(model_path, previous_path)
+    joblib.dump(updated_model, model_path)
+
+    metadata['rows_trained'] = len(X)
+    metadata['extractor_fingerprint'] = extractor_fingerprint or model_fingerprint
+    metadata.setdefault('incremental_updates', []).append({
+        'date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'new_rows': int(new_rows),
+        'replayed_rows': int(replay_size),
+        'rounds_added': args.rounds,
+        'held_out_accuracy': updated['held_out']['accuracy'],
+    })
+    joblib.dump(metadata, metadata_path)
+    print(f"\n Updated model installed: {model_path}")
+    print(f"   Previous model kept as: {previous_path}")
+elif passed:
+    print("\n Gate passed (dry run) - current model kept")
+else:
+    print("\n Gate failed - current model kept")
+
+report = {
+    'date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    'trained_rows': int(trained_rows),
+    'new_rows': int(new_rows),
+    'replayed_rows': int(replay_size),
+    'rounds_added': args.rounds,
+    'learning_rate': params.get('learning_rate'),
+    'update_seconds': round(update_seconds, 1),
+    'results': results,
+    'checks': checks,
+    'passed': passed,
+    'installed': installed,
+}
+report_path = os.path.join(reports_dir, "incremental_update_2024.json")
+with open(report_path, 'w') as f:
+    json.dump(report, f, indent=4)
+print(f" Saved: {report_path}")
+print("="*70)
+sys.exit(0 if passed else 1)
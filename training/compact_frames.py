@@ -0,0 +1,64 @@
+#compact_frames.py
+# Load training data with the smallest dtypes that hold it.
+#
+# pandas defaults to int64 / float64 for every numeric column and keeps every
+# column of the CSV; the models only need a few columns and convert their
+# input to float32 anyway (sklearn's trees and XGBoost both train on float32),
+# so int8 flags, int16/int32 counts and float32 scores give the same models
+# from a fraction of the memory.
+import numpy as np
+import pandas as pd
+
+# Dataset 2023 content features (the 28 used by Model 2023) by kind
+CONTENT_2023_DTYPES = {
+    # 0 / 1 flags
+    **{name: 'int8' for name in (
+        'HasTitle', 'HasFavicon', 'Robots', 'IsResponsive', 'HasDescription', 'HasExternalFormSubmit',
+        'HasSocialNet', 'HasSubmitButton', 'HasHiddenFields', 'HasPasswordField', 'Bank', 'Pay',
+        'Crypto', 'HasCopyrightInfo')},
+    # Similarity scores (0-100, fractional)
+    'DomainTitleMatchScore': 'float32',
+    'URLTitleMatchScore': 'float32',
+    # Counts; int32 on load (line lengths reach millions), shrunk further by compact_frame
+    **{name: 'int32' for name in (
+        'LineOfCode', 'LargestLineLength', 'NoOfURLRedirect', 'NoOfSelfRedirect', 'NoOfPopup',
+        'NoOfiFrame', 'NoOfImage', 'NoOfCSS', 'NoOfJS', 'NoOfSelfRef', 'NoOfEmptyRef', 'NoOfExternalRef')},
+}
+
+LABEL_DTYPE = 'int8'
+
+
+def compact_frame(df):
+    """ Downcast every numeric column in place: integral columns to the smallest
+        integer type that holds their range, other floats to float32 """
+    for column in df.columns:
+        values = df[column]
+        if values.dtype == bool:
+            df[column] = values.astype(np.int8)
+        elif pd.api.types.is_integer_dtype(values):
+            df[column] = pd.to_numeric(values, downcast='integer')
+        elif pd.api.types.is_float_dtype(values):
+            if values.notna().all() and (values == np.floor(values)).all():
+                df[column] = pd.to_numeric(values.astype(np.int64), downcast='integer')
+            else:
+                df[column] = values.astype(np.float32)
+    return df
+
+
+def read_compact_csv(path, dtypes, extra_columns=('label',)):
+    """
+    Read only the columns in dtypes (plus extra_columns) with those dtypes,
+    then shrink the integer columns to their actual range.
+
+    If a column does not fit its declared dtype (a missing value or a fraction
+    in a flag column), it is read as float and compacted from its values instead.
+    """
+    columns = list(dtypes) + [c for c in extra_columns if c not in dtypes]
+    read_dtypes = dict(dtypes)
+    read_dtypes.update({c: LABEL_DTYPE for c in extra_columns if c == 'label'})
+    try:
+        df = pd.read_csv(path, usecols=columns, dtype=read_dtypes)
+    except ValueError:
+        df = pd.read_csv(path, usecols=columns,
+                         dtype={c: 'float32' if t == 'float32' else 'float64' for c, t in read_dtypes.items()})
+    return compact_frame(df)
@@ -0,0 +1,21 @@
+#complex_urls.py
+# Legitimate URLs with long paths, query strings, OAuth endpoints etc. that URL
+# models tend to flag. Every Model 2024 build is checked against this list
+# (Train_2024.py reports it, Update_2024.py refuses updates that flag more of them).
+COMPLEX_LEGITIMATE_URLS = [
+    "https://www.britannica.com/biography/Che-Guevara",
+    "https://plato.stanford.edu/entries/ethics-ai/",
+    "https://www.khanacademy.org/math/algebra/x2f8bb11595b61c86:systems-of-equations",
+    "https://scholar.google.com/scholar?hl=en&q=phishing+detection",
+    "https://docs.google.com/document/d/1A9f8KJ9P2wQxU4Y/edit",
+    "https://learn.microsoft.com/en-us/azure/active-directory/develop/v2-oauth2-auth-code-flow",
+    "https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Promise",
+    "https://github.com/openai/gpt-4/blob/main/system_card.md",
+    "https://auth0.com/docs/flows/authorization-code-flow",
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "https://medium.com/@user/how-machine-learning-detects-phishing-8f92a9c12",
+    "https://www.reddit.com/r/netsec/comments/15f9k2m/phishing_detection_models/",
+    "https://vimeo.com/76979871",
+    "https://login.microsoftonline.com/common/oauth2/v2.0/authorize",
+    "https://accounts.google.com/o/oauth2/v2/auth",
+]